@@ -61,7 +61,9 @@ setup(
         'src/scs_analysis/sample_max.py',
         'src/scs_analysis/sample_midpoint.py',
         'src/scs_analysis/sample_min.py',
+        'src/scs_analysis/sample_multi_filter.py',
         'src/scs_analysis/sample_regression.py',
+        'src/scs_analysis/scs_pipeline.py',
         'src/scs_analysis/single_chart.py',
         'src/scs_analysis/socket_receiver.py',
         'src/scs_analysis/uds_receiver.py',
@@ -72,6 +74,9 @@ setup(
     extras_require={
         'dev': [
             'pypandoc'
+        ],
+        'batch': [
+            'numpy'
         ]
     }
 )
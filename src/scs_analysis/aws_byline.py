@@ -31,20 +31,20 @@ scs_analysis/aws_topic_history
 import sys
 
 from scs_analysis.cmd.cmd_aws_byline import CmdAWSByline
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
 
 from scs_core.aws.client.api_auth import APIAuth
 from scs_core.aws.manager.byline_manager import BylineManager
 
-from scs_core.data.json import JSONify
-
 from scs_core.sys.http_exception import HTTPException
 
 from scs_host.client.http_client import HTTPClient
 from scs_host.sys.host import Host
 
-
 # TODO: support "all topics" mode
 
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
@@ -82,6 +82,8 @@ if __name__ == '__main__':
             print("aws_byline: %s" % manager, file=sys.stderr)
             sys.stderr.flush()
 
+        stdout = OutputStream.construct()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -103,11 +105,10 @@ if __name__ == '__main__':
                         latest = byline
 
                 else:
-                    print(JSONify.dumps(byline))
-                    sys.stdout.flush()
+                    stdout.print(JSONCodec.dumps(byline))
 
             if cmd.latest and latest is not None:
-                print(JSONify.dumps(latest))
+                stdout.print(JSONCodec.dumps(latest))
 
         except HTTPException as ex:
             print("aws_byline: %s" % ex, file=sys.stderr)
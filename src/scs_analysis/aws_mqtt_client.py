@@ -46,6 +46,7 @@ import sys
 from scs_analysis.cmd.cmd_mqtt_client import CmdMQTTClient
 from scs_analysis.helper.aws_mqtt_client_handler import AWSMQTTClientHandler
 from scs_analysis.helper.mqtt_reporter import MQTTReporter
+from scs_analysis.helper.output_stream import OutputStream
 
 from scs_core.aws.client.client_auth import ClientAuth
 from scs_core.aws.client.mqtt_client import MQTTClient, MQTTSubscriber
@@ -116,6 +117,8 @@ if __name__ == '__main__':
             print("aws_mqtt_client: %s" % client, file=sys.stderr)
             sys.stderr.flush()
 
+        stdout = OutputStream.construct(live=True)
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -138,8 +141,7 @@ if __name__ == '__main__':
             reporter.print("done" if success else "abandoned")
 
             if cmd.echo:
-                print(message)
-                sys.stdout.flush()
+                stdout.print(message)
 
 
         # ----------------------------------------------------------------------------------------------------------------
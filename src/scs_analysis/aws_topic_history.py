@@ -47,12 +47,13 @@ import sys
 
 from scs_analysis.cmd.cmd_aws_topic_history import CmdAWSTopicHistory
 from scs_analysis.helper.aws_topic_history_reporter import AWSTopicHistoryReporter
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
 
 from scs_core.aws.client.api_auth import APIAuth
 from scs_core.aws.manager.byline_manager import BylineManager
 from scs_core.aws.manager.lambda_message_manager import MessageManager
 
-from scs_core.data.json import JSONify
 from scs_core.data.localized_datetime import LocalizedDatetime
 
 from scs_core.sys.http_exception import HTTPException
@@ -115,6 +116,8 @@ if __name__ == '__main__':
             print("aws_topic_history: %s" % message_manager, file=sys.stderr)
             sys.stderr.flush()
 
+        stdout = OutputStream.construct()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -147,8 +150,7 @@ if __name__ == '__main__':
             for message in message_manager.find_for_topic(cmd.topic, start, end):
                 document = message if cmd.include_wrapper else message.payload
 
-                print(JSONify.dumps(document))
-                sys.stdout.flush()
+                stdout.print(JSONCodec.dumps(document))
 
         except HTTPException as ex:
             print("aws_topic_history: %s" % ex, file=sys.stderr)
@@ -30,8 +30,9 @@ import json
 import sys
 
 from scs_analysis.cmd.cmd_aws_topic_publisher import CmdAWSTopicPublisher
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
 
-from scs_core.data.json import JSONify
 from scs_core.data.publication import Publication
 
 
@@ -47,6 +48,8 @@ if __name__ == '__main__':
     if cmd.verbose:
         print("aws_topic_publisher: %s" % cmd, file=sys.stderr)
 
+    stdout = OutputStream.construct(live=True)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -59,8 +62,7 @@ if __name__ == '__main__':
 
             publication = Publication(cmd.topic, jdict)
 
-            print(JSONify.dumps(publication))
-            sys.stdout.flush()
+            stdout.print(JSONCodec.dumps(publication))
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -45,7 +45,8 @@ https://en.wikipedia.org/wiki/ISO_8601
 
 import sys
 
-from scs_core.data.json import JSONify
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
 
 from scs_core.aws.data.upload_interval import UploadInterval
 
@@ -56,6 +57,8 @@ if __name__ == '__main__':
 
     interval = None
 
+    stdout = OutputStream.construct()
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -74,8 +77,7 @@ if __name__ == '__main__':
                 continue
 
             # report...
-            print(JSONify.dumps(interval))
-            sys.stdout.flush()
+            stdout.print(JSONCodec.dumps(interval))
 
 
     # ----------------------------------------------------------------------------------------------------------------
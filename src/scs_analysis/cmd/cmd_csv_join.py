@@ -8,6 +8,8 @@ source repo: scs_analysis
 
 import optparse
 
+from scs_core.data.timedelta import Timedelta
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -18,15 +20,17 @@ class CmdCSVJoin(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-t TYPE] [-i] [-v] -l PREFIX PK FILENAME "
-                                                    "-r PREFIX PK FILENAME", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [-t TYPE] [-i [-a DIRECTION TOLERANCE]] [-s | -m COUNT] "
+                                                    "[-v] -l PREFIX PK FILENAME -r PREFIX PK FILENAME "
+                                                    "[-r PREFIX PK FILENAME ..]", version="%prog 1.0")
 
         # compulsory...
         self.__parser.add_option("--left", "-l", type="string", nargs=3, action="store", dest="left",
                                  help="output path prefix, primary key and filename for left-hand set")
 
-        self.__parser.add_option("--right", "-r", type="string", nargs=3, action="store", dest="right",
-                                 help="output path prefix, primary key and filename for right-hand set")
+        self.__parser.add_option("--right", "-r", type="string", nargs=3, action="append", dest="right",
+                                 help="output path prefix, primary key and filename for right-hand set "
+                                      "(may be repeated)")
 
         # optional...
         self.__parser.add_option("--type", "-t", type="string", nargs=1, action="store", dest="type", default='INNER',
@@ -35,6 +39,17 @@ class CmdCSVJoin(object):
         self.__parser.add_option("--iso8601", "-i", action="store_true", dest="iso8601", default=False,
                                  help="interpret the primary key as an ISO 8601 datetime")
 
+        self.__parser.add_option("--as-of", "-a", type="string", nargs=2, action="store", dest="as_of",
+                                 help="join each left rec with the right rec found { 'BACKWARD' | 'FORWARD' | "
+                                      "'NEAREST' } within a [[DD-]HH:]MM[:SS] TOLERANCE")
+
+        self.__parser.add_option("--sorted", "-s", action="store_true", dest="sorted", default=False,
+                                 help="merge files that are in primary key order, without holding them in memory")
+
+        self.__parser.add_option("--max-documents", "-m", type="int", nargs=1, action="store", dest="max_documents",
+                                 help="spill to temporary files once COUNT documents are held in memory "
+                                      "(default 1000000)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -47,6 +62,23 @@ class CmdCSVJoin(object):
         if self.__opts.left is None or self.__opts.right is None:
             return False
 
+        if len(set(prefix for prefix, _, _ in self.sets)) < len(self.sets):
+            return False
+
+        if len(self.__opts.right) > 1 and self.type == 'RIGHT':
+            return False
+
+        if self.__opts.as_of is not None:
+            if not self.iso8601 or self.type not in ('INNER', 'LEFT'):
+                return False
+
+            if self.tolerance is None or self.tolerance.total_seconds() < 0:
+                return False
+
+        if self.__opts.max_documents is not None:
+            if self.sorted or self.as_of or self.max_documents < 1:
+                return False
+
         return True
 
 
@@ -58,38 +90,42 @@ class CmdCSVJoin(object):
 
 
     @property
-    def left_prefix(self):
-        return None if self.__opts.left is None else self.__opts.left[0]
+    def sets(self):
+        # (prefix, pk, filename) for the left-hand set, then each right-hand set...
+        if self.__opts.left is None or self.__opts.right is None:
+            return None
+
+        return [tuple(self.__opts.left)] + [tuple(right) for right in self.__opts.right]
 
 
     @property
-    def left_pk(self):
-        return None if self.__opts.left is None else self.__opts.left[1]
+    def iso8601(self):
+        return self.__opts.iso8601
 
 
     @property
-    def left_filename(self):
-        return None if self.__opts.left is None else self.__opts.left[2]
+    def as_of(self):
+        return self.__opts.as_of is not None
 
 
     @property
-    def right_prefix(self):
-        return None if self.__opts.right is None else self.__opts.right[0]
+    def direction(self):
+        return None if self.__opts.as_of is None else self.__opts.as_of[0]
 
 
     @property
-    def right_pk(self):
-        return None if self.__opts.right is None else self.__opts.right[1]
+    def tolerance(self):
+        return None if self.__opts.as_of is None else Timedelta.construct_from_flag(self.__opts.as_of[1])
 
 
     @property
-    def right_filename(self):
-        return None if self.__opts.right is None else self.__opts.right[2]
+    def sorted(self):
+        return self.__opts.sorted
 
 
     @property
-    def iso8601(self):
-        return self.__opts.iso8601
+    def max_documents(self):
+        return self.__opts.max_documents
 
 
     @property
@@ -104,5 +140,7 @@ class CmdCSVJoin(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdCSVJoin:{type:%s, left:%s, right:%s, iso8601:%s, verbose:%s}" % \
-               (self.type, self.__opts.left, self.__opts.right, self.iso8601, self.verbose)
+        return "CmdCSVJoin:{type:%s, left:%s, right:%s, iso8601:%s, as_of:%s, sorted:%s, max_documents:%s, " \
+               "verbose:%s}" % \
+               (self.type, self.__opts.left, self.__opts.right, self.iso8601, self.__opts.as_of, self.sorted,
+                self.max_documents, self.verbose)
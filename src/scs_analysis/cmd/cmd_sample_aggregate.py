@@ -8,44 +8,101 @@ source repo: scs_analysis
 
 import optparse
 
+from scs_core.data.timedelta import Timedelta
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
 class CmdSampleAggregate(object):
     """unix command line handler"""
 
-    def __init__(self):
+    def __init__(self, args=None):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog -c HH:MM:SS [-m] [-f] [-i ISO] [-v] [PATH_1 .. PATH_N]",
+        self.__parser = optparse.OptionParser(usage="%prog -c HH:MM:SS [-c HH:MM:SS ..] [-o FILE_PREFIX] [-m] [-x] [-f] "
+                                                    "[-i ISO] [-g GROUP_PATH] [{ -b | -l LATENESS }] [-s STATE_FILE] "
+                                                    "[-v] [PATH_1 .. PATH_N]",
                                               version="%prog 1.0")
 
         # compulsory...
-        self.__parser.add_option("--checkpoint", "-c", type="string", nargs=1, action="store", dest="checkpoint",
-                                 help="a time specification as **:/5:00")
+        self.__parser.add_option("--checkpoint", "-c", type="string", nargs=1, action="append", dest="checkpoints",
+                                 help="a time specification as **:/5:00 (may be repeated)")
 
         # optional...
+        self.__parser.add_option("--output-prefix", "-o", type="string", nargs=1, action="store",
+                                 dest="file_prefix", help="write the output of each checkpoint to a CSV file, "
+                                                          "named with FILE_PREFIX")
+
         self.__parser.add_option("--min-max", "-m", action="store_true", dest="min_max", default=False,
                                  help="report min and max in addition to midpoint")
 
+        self.__parser.add_option("--statistics", "-x", action="store_true", dest="statistics", default=False,
+                                 help="report count, stdev, p5, p50 and p95 in addition to midpoint")
+
         self.__parser.add_option("--fill", "-f", action="store_true", dest="fill", default=False,
                                  help="fill output with checkpoints missing from input")
 
         self.__parser.add_option("--iso-path", "-i", type="string", nargs=1, action="store", default="rec", dest="iso",
                                  help="path for ISO 8601 datetime field (default 'rec')")
 
+        self.__parser.add_option("--group-by", "-g", type="string", nargs=1, action="store", dest="group_by",
+                                 help="aggregate separately for each value of GROUP_PATH, such as 'tag'")
+
+        self.__parser.add_option("--batch", "-b", action="store_true", dest="batch", default=False,
+                                 help="aggregate in blocks with NumPy, for offline files")
+
+        self.__parser.add_option("--lateness", "-l", type="string", nargs=1, action="store", dest="lateness",
+                                 help="accept out-of-order documents up to [[DD-]HH:]MM[:SS] late")
+
+        self.__parser.add_option("--state", "-s", type="string", nargs=1, action="store", dest="state",
+                                 help="resume from, and save the open checkpoint periods to, STATE_FILE")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
-        self.__opts, self.__args = self.__parser.parse_args()
+        self.__opts, self.__args = self.__parser.parse_args(args)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if not self.checkpoints:
+            return False
+
+        if len(set(self.checkpoints)) != len(self.checkpoints):
+            return False
+
+        if self.__opts.lateness is not None and self.lateness is None:
+            return False
+
+        if self.batch and self.lateness is not None:
+            return False
+
+        if self.batch and self.state is not None:
+            return False
+
+        if self.batch and self.statistics:
+            return False
+
+        return True
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
     def checkpoint(self):
-        return self.__opts.checkpoint
+        return self.checkpoints[0] if self.checkpoints else None
+
+
+    @property
+    def checkpoints(self):
+        return self.__opts.checkpoints if self.__opts.checkpoints else []
+
+
+    @property
+    def file_prefix(self):
+        return self.__opts.file_prefix
 
 
     @property
@@ -58,6 +115,11 @@ class CmdSampleAggregate(object):
         return self.__opts.min_max
 
 
+    @property
+    def statistics(self):
+        return self.__opts.statistics
+
+
     @property
     def fill(self):
         return self.__opts.fill
@@ -68,6 +130,26 @@ class CmdSampleAggregate(object):
         return self.__opts.iso
 
 
+    @property
+    def group_by(self):
+        return self.__opts.group_by
+
+
+    @property
+    def batch(self):
+        return self.__opts.batch
+
+
+    @property
+    def lateness(self):
+        return Timedelta.construct_from_flag(self.__opts.lateness)
+
+
+    @property
+    def state(self):
+        return self.__opts.state
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -80,5 +162,7 @@ class CmdSampleAggregate(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleAggregate:{checkpoint:%s, min_max:%s, fill:%s, iso:%s, verbose:%s, nodes:%s}" %  \
-               (self.checkpoint, self.min_max, self.fill, self.iso, self.verbose, self.nodes)
+        return "CmdSampleAggregate:{checkpoints:%s, file_prefix:%s, min_max:%s, statistics:%s, fill:%s, iso:%s, " \
+               "group_by:%s, batch:%s, lateness:%s, state:%s, verbose:%s, nodes:%s}" %  \
+               (self.checkpoints, self.file_prefix, self.min_max, self.statistics, self.fill, self.iso, self.group_by,
+                self.batch, self.__opts.lateness, self.state, self.verbose, self.nodes)
@@ -18,9 +18,12 @@ class CmdSampleAH(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-v] RH_PATH T_PATH", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [-w WORKERS] [-v] RH_PATH T_PATH", version="%prog 1.0")
 
         # optional...
+        self.__parser.add_option("--workers", "-w", type="int", nargs=1, action="store", dest="workers", default=1,
+                                 help="number of processes, for offline files (default 1)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -33,11 +36,19 @@ class CmdSampleAH(object):
         if len(self.__args) != 2:
             return False
 
+        if self.workers < 1:
+            return False
+
         return True
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -60,4 +71,5 @@ class CmdSampleAH(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleAH:{verbose:%s, rh_path:%s, t_path:%s}" % (self.verbose, self.rh_path, self.t_path)
+        return "CmdSampleAH:{workers:%s, verbose:%s, rh_path:%s, t_path:%s}" % \
+               (self.workers, self.verbose, self.rh_path, self.t_path)
@@ -18,7 +18,8 @@ class CmdSampleAhCorrection(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog -s SENS_MV BASELINE -c WS WB [-v] GAS_SUB_PATH AH_PATH",
+        self.__parser = optparse.OptionParser(usage="%prog -s SENS_MV BASELINE -c WS WB [-w WORKERS] [-v] "
+                                                    "GAS_SUB_PATH AH_PATH",
                                               version="%prog 1.0")
 
         # compulsory...
@@ -29,6 +30,9 @@ class CmdSampleAhCorrection(object):
                                  help="sensitivity and baseline weightings for a standard aH delta unit")
 
         # optional...
+        self.__parser.add_option("--workers", "-w", type="int", nargs=1, action="store", dest="workers", default=1,
+                                 help="number of processes, for offline files (default 1)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -44,6 +48,9 @@ class CmdSampleAhCorrection(object):
         if len(self.__args) != 2:
             return False
 
+        if self.workers < 1:
+            return False
+
         return True
 
 
@@ -69,6 +76,11 @@ class CmdSampleAhCorrection(object):
         return None if self.__opts.correction is None else self.__opts.correction[1]
 
 
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -91,5 +103,5 @@ class CmdSampleAhCorrection(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleAhCorrection:{sensor:%s, correction:%s, verbose:%s, paths:%s}" %  \
-               (self.__opts.sensor, self.__opts.correction, self.verbose, self.__args)
+        return "CmdSampleAhCorrection:{sensor:%s, correction:%s, workers:%s, verbose:%s, paths:%s}" %  \
+               (self.__opts.sensor, self.__opts.correction, self.workers, self.verbose, self.__args)
@@ -20,7 +20,8 @@ class CmdSampleConcentration(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-v] GAS DENSITY_PATH T_PATH [{P_PATH | -p PRESSURE}]",
+        self.__parser = optparse.OptionParser(usage="%prog [-w WORKERS] [-v] GAS DENSITY_PATH T_PATH "
+                                                    "[{P_PATH | -p PRESSURE}]",
                                               version="%prog 1.0")
 
         # optional...
@@ -28,6 +29,9 @@ class CmdSampleConcentration(object):
                                  default=Gas.STP_PRESSURE, help="assume constant atmospheric pressure in kPA "
                                                                 "(default 101.3)")
 
+        self.__parser.add_option("--workers", "-w", type="int", nargs=1, action="store", dest="workers", default=1,
+                                 help="number of processes, for offline files (default 1)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -43,6 +47,9 @@ class CmdSampleConcentration(object):
         if self.pressure is not None and self.p_path is not None:
             return False
 
+        if self.workers < 1:
+            return False
+
         return True
 
 
@@ -53,6 +60,11 @@ class CmdSampleConcentration(object):
         return self.__opts.pressure
 
 
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -85,5 +97,6 @@ class CmdSampleConcentration(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleConcentration:{pressure:%s, verbose:%s, gas:%s, density_path:%s, t_path:%s, p_path:%s}" % \
-               (self.pressure, self.verbose, self.gas, self.density_path, self.t_path, self.p_path)
+        return "CmdSampleConcentration:{pressure:%s, workers:%s, verbose:%s, gas:%s, density_path:%s, t_path:%s, " \
+               "p_path:%s}" % \
+               (self.pressure, self.workers, self.verbose, self.gas, self.density_path, self.t_path, self.p_path)
@@ -18,9 +18,12 @@ class CmdSampleFilter(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-p PRECISION] [-v] [PATH]", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [-b] [-p PRECISION] [-v] [PATH]", version="%prog 1.0")
 
         # optional...
+        self.__parser.add_option("--batch", "-b", action="store_true", dest="batch", default=False,
+                                 help="filter in blocks of documents, for offline files")
+
         self.__parser.add_option("--prec", "-p", type="int", nargs=1, action="store", default=None, dest="precision",
                                  help="precision (default 0 decimal places)")
 
@@ -32,6 +35,11 @@ class CmdSampleFilter(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    @property
+    def batch(self):
+        return self.__opts.batch
+
+
     @property
     def precision(self):
         return self.__opts.precision
@@ -54,4 +62,5 @@ class CmdSampleFilter(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleFilter:{precision:%s, verbose:%s, path:%s}" % (self.precision, self.verbose, self.path)
+        return "CmdSampleFilter:{batch:%s, precision:%s, verbose:%s, path:%s}" % \
+               (self.batch, self.precision, self.verbose, self.path)
@@ -19,7 +19,7 @@ class CmdSampleISO8601(object):
         Constructor
         """
         self.__parser = optparse.OptionParser(usage="%prog { -z | -f DATE_FORMAT [-t TIMEZONE_NAME [-u]] [-i ISO_PATH]"
-                                                    " { DATETIME_PATH | DATE_PATH TIME_PATH } } [-v]",
+                                                    " { DATETIME_PATH | DATE_PATH TIME_PATH } } [-w WORKERS] [-v]",
                                               version="%prog 1.0")
 
         # optional...
@@ -38,6 +38,9 @@ class CmdSampleISO8601(object):
         self.__parser.add_option("--iso-path", "-i", type="string", nargs=1, action="store", default="rec", dest="iso",
                                  help="path for ISO 8601 datetime output (default 'rec')")
 
+        self.__parser.add_option("--workers", "-w", type="int", nargs=1, action="store", dest="workers", default=1,
+                                 help="number of processes, for offline files (default 1)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -59,6 +62,9 @@ class CmdSampleISO8601(object):
         if len(self.__args) < 1 or len(self.__args) > 2:
             return False
 
+        if self.workers < 1:
+            return False
+
         return True
 
 
@@ -107,6 +113,11 @@ class CmdSampleISO8601(object):
         return self.__opts.iso
 
 
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -134,5 +145,7 @@ class CmdSampleISO8601(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleISO8601:{zones:%s, format:%s, timezone:%s, utc:%s, iso:%s, verbose:%s, datetime_paths:%s}" % \
-               (self.zones, self.format, self.timezone, self.utc, self.iso, self.verbose, self.datetime_paths())
+        return "CmdSampleISO8601:{zones:%s, format:%s, timezone:%s, utc:%s, iso:%s, workers:%s, verbose:%s, " \
+               "datetime_paths:%s}" % \
+               (self.zones, self.format, self.timezone, self.utc, self.iso, self.workers, self.verbose,
+                self.datetime_paths())
@@ -20,7 +20,8 @@ class CmdLowPass(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog -d DELTA_T -c CUT_OFF [-p PRECISION] [-v] [PATH]",
+        self.__parser = optparse.OptionParser(usage="%prog -d DELTA_T -c CUT_OFF [-b] [-p PRECISION] [-v] "
+                                                    "[PATH_1 .. PATH_N]",
                                               version="%prog 1.0")
 
         # compulsory...
@@ -31,6 +32,9 @@ class CmdLowPass(object):
                                  help="cut-off frequency")
 
         # optional...
+        self.__parser.add_option("--batch", "-b", action="store_true", dest="batch", default=False,
+                                 help="filter in blocks of documents, for offline files")
+
         self.__parser.add_option("--prec", "-p", type="int", nargs=1, action="store", default=None, dest="precision",
                                  help="precision (default 0 decimal places)")
 
@@ -61,6 +65,11 @@ class CmdLowPass(object):
         return self.__opts.cut_off
 
 
+    @property
+    def batch(self):
+        return self.__opts.batch
+
+
     @property
     def precision(self):
         return self.__opts.precision
@@ -72,8 +81,8 @@ class CmdLowPass(object):
 
 
     @property
-    def path(self):
-        return self.__args[0] if len(self.__args) > 0 else None
+    def nodes(self):
+        return self.__args if len(self.__args) > 0 else [None]
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -83,5 +92,5 @@ class CmdLowPass(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdLowPassFilter:{delta:%s, cut_off:%s, precision:%s, verbose:%s, path:%s}" % \
-               (self.delta, self.cut_off, self.precision, self.verbose, self.path)
+        return "CmdLowPassFilter:{delta:%s, cut_off:%s, batch:%s, precision:%s, verbose:%s, nodes:%s}" % \
+               (self.delta, self.cut_off, self.batch, self.precision, self.verbose, self.nodes)
@@ -20,7 +20,7 @@ class CmdSampleMedian(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-w SIZE] [-p PRECISION] [-v] [PATH]",
+        self.__parser = optparse.OptionParser(usage="%prog [-w SIZE] [-p PRECISION] [-v] [PATH_1 .. PATH_N]",
                                               version="%prog 1.0")
 
         # optional...
@@ -63,8 +63,8 @@ class CmdSampleMedian(object):
 
 
     @property
-    def path(self):
-        return self.__args[0] if len(self.__args) > 0 else None
+    def nodes(self):
+        return self.__args if len(self.__args) > 0 else [None]
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -74,5 +74,5 @@ class CmdSampleMedian(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleMedian:{window:%s, verbose:%s, precision:%s, path:%s}" % \
-               (self.window, self.verbose, self.precision, self.path)
+        return "CmdSampleMedian:{window:%s, verbose:%s, precision:%s, nodes:%s}" % \
+               (self.window, self.verbose, self.precision, self.nodes)
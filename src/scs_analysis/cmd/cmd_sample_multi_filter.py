@@ -0,0 +1,75 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+"""
+
+import optparse
+
+from scs_analysis.helper.multi_filter import FilterSpec
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdSampleMultiFilter(object):
+    """
+    unix command line handler
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-p PRECISION] [-v] PATH=FILTER[,FILTER..] "
+                                                    "[PATH=FILTER[,FILTER..] ..]", version="%prog 1.0")
+
+        # optional...
+        self.__parser.add_option("--prec", "-p", type="int", nargs=1, action="store", default=None, dest="precision",
+                                 help="precision (default 0 decimal places)")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if len(self.__args) == 0:
+            return False
+
+        if None in self.specs:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def precision(self):
+        return self.__opts.precision
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def specs(self):
+        return [FilterSpec.construct_from_arg(arg) for arg in self.__args]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdSampleMultiFilter:{precision:%s, verbose:%s, specs:%s}" % \
+               (self.precision, self.verbose, self.__args)
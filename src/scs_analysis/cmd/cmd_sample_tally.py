@@ -8,6 +8,8 @@ source repo: scs_analysis
 
 import optparse
 
+from scs_core.data.timedelta import Timedelta
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -18,12 +20,17 @@ class CmdSampleTally(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-t TALLY] [-p PRECISION] [-v] [PATH]", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [{ -t TALLY | -w DURATION }] [-p PRECISION] [-v] "
+                                                    "[PATH_1 .. PATH_N]",
+                                              version="%prog 1.0")
 
         # optional...
         self.__parser.add_option("--tally", "-t", type="int", nargs=1, action="store", dest="tally",
                                  help="generate a rolling aggregate for TALLY number of data points (default all)")
 
+        self.__parser.add_option("--window", "-w", type="string", nargs=1, action="store", dest="window",
+                                 help="generate a rolling aggregate over the [[DD-]HH:]MM[:SS] up to each rec")
+
         self.__parser.add_option("--prec", "-p", type="int", nargs=1, action="store", default=None, dest="precision",
                                  help="precision (default 0 decimal places)")
 
@@ -39,6 +46,12 @@ class CmdSampleTally(object):
         if self.tally is not None and self.tally < 1:
             return False
 
+        if self.__opts.window is not None and (self.window is None or self.window.total_seconds() <= 0):
+            return False
+
+        if self.tally is not None and self.window is not None:
+            return False
+
         return True
 
 
@@ -49,6 +62,16 @@ class CmdSampleTally(object):
         return self.__opts.tally
 
 
+    @property
+    def window(self):
+        return Timedelta.construct_from_flag(self.__opts.window)
+
+
+    @property
+    def duration(self):
+        return None if self.window is None else self.window.total_seconds()
+
+
     @property
     def precision(self):
         return self.__opts.precision
@@ -60,8 +83,8 @@ class CmdSampleTally(object):
 
 
     @property
-    def path(self):
-        return self.__args[0] if len(self.__args) > 0 else None
+    def nodes(self):
+        return self.__args if len(self.__args) > 0 else [None]
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -71,5 +94,5 @@ class CmdSampleTally(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleTally:{tally:%s, precision:%s, verbose:%s, path:%s}" % \
-                    (self.tally, self.precision, self.verbose, self.path)
+        return "CmdSampleTally:{tally:%s, window:%s, precision:%s, verbose:%s, nodes:%s}" % \
+                    (self.tally, self.__opts.window, self.precision, self.verbose, self.nodes)
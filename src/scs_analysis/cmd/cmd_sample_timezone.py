@@ -18,12 +18,15 @@ class CmdSampleTimezone(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog { -z | TIMEZONE_NAME }", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog { -z | [-w WORKERS] TIMEZONE_NAME }", version="%prog 1.0")
 
         # optional...
         self.__parser.add_option("--zones", "-z", action="store_true", dest="zones", default=False,
                                  help="list the available timezone names to stderr")
 
+        self.__parser.add_option("--workers", "-w", type="int", nargs=1, action="store", dest="workers", default=1,
+                                 help="number of processes, for offline files (default 1)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -36,6 +39,9 @@ class CmdSampleTimezone(object):
         if bool(self.timezone) == bool(self.__opts.zones):
             return False
 
+        if self.workers < 1:
+            return False
+
         return True
 
 
@@ -51,6 +57,11 @@ class CmdSampleTimezone(object):
         return self.__opts.zones
 
 
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -63,4 +74,5 @@ class CmdSampleTimezone(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleTimezone:{timezone:%s, zones:%s, verbose:%s}" % (self.timezone, self.zones, self.verbose)
+        return "CmdSampleTimezone:{timezone:%s, zones:%s, workers:%s, verbose:%s}" % \
+               (self.timezone, self.zones, self.workers, self.verbose)
@@ -0,0 +1,166 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+"""
+
+import optparse
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdSampleTSStdev(object):
+    """unix command line handler"""
+
+    __MODES = ['G', 'R', 'S']
+
+    @classmethod
+    def is_valid_mode(cls, mode):
+        return mode in cls.__MODES
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog -r START END -t START END -p FILENAME -f FILENAME "
+                                                    "[-m { G | R | S }] [-s STEP] [-v] "
+                                                    "RH_PATH T_PATH REPORT_SUB_PATH REF_PATH", version="%prog 1.0")
+
+        # compulsory...
+        self.__parser.add_option("--rh-offsets", "-r", type="int", nargs=2, action="store", dest="rh_offsets",
+                                 help="START and END of humidity shifts (START <= END)")
+
+        self.__parser.add_option("--t-offsets", "-t", type="int", nargs=2, action="store", dest="t_offsets",
+                                 help="START and END of temperature shifts (START <= END)")
+
+        self.__parser.add_option("--report-file", "-p", type="string", nargs=1, action="store", dest="report_filename",
+                                 help="reported data filename")
+
+        self.__parser.add_option("--ref-file", "-f", type="string", nargs=1, action="store", dest="ref_filename",
+                                 help="reference data filename")
+
+        # optional...
+        self.__parser.add_option("--mode", "-m", type="string", nargs=1, action="store", dest="mode", default='R',
+                                 help="search mode: grid, coarse-to-fine refinement or golden-section (default 'R')")
+
+        self.__parser.add_option("--step", "-s", type="int", nargs=1, action="store", dest="step", default=5,
+                                 help="grid step, or coarse step for refinement (default 5)")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.__opts.rh_offsets is None or self.__opts.t_offsets is None:
+            return False
+
+        if self.report_filename is None or self.ref_filename is None:
+            return False
+
+        if len(self.__args) < 4:
+            return False
+
+        if self.rh_offset_start > self.rh_offset_end or self.t_offset_start > self.t_offset_end:
+            return False
+
+        if not self.is_valid_mode(self.mode):
+            return False
+
+        if self.step < 1:
+            return False
+
+        # golden-section search is on one axis only...
+        if self.mode == 'S' and self.rh_offset_start != self.rh_offset_end and \
+                self.t_offset_start != self.t_offset_end:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def rh_offset_start(self):
+        return None if self.__opts.rh_offsets is None else self.__opts.rh_offsets[0]
+
+
+    @property
+    def rh_offset_end(self):
+        return None if self.__opts.rh_offsets is None else self.__opts.rh_offsets[1]
+
+
+    @property
+    def t_offset_start(self):
+        return None if self.__opts.t_offsets is None else self.__opts.t_offsets[0]
+
+
+    @property
+    def t_offset_end(self):
+        return None if self.__opts.t_offsets is None else self.__opts.t_offsets[1]
+
+
+    @property
+    def report_filename(self):
+        return self.__opts.report_filename
+
+
+    @property
+    def ref_filename(self):
+        return self.__opts.ref_filename
+
+
+    @property
+    def mode(self):
+        return None if self.__opts.mode is None else self.__opts.mode.upper()
+
+
+    @property
+    def step(self):
+        return self.__opts.step
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def rh_path(self):
+        return self.__args[0] if len(self.__args) > 0 else None
+
+
+    @property
+    def t_path(self):
+        return self.__args[1] if len(self.__args) > 1 else None
+
+
+    @property
+    def report_sub_path(self):
+        return self.__args[2] if len(self.__args) > 2 else None
+
+
+    @property
+    def ref_path(self):
+        return self.__args[3] if len(self.__args) > 3 else None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdSampleTSStdev:{rh_offsets:%s, t_offsets:%s, report_filename:%s, ref_filename:%s, mode:%s, " \
+               "step:%s, verbose:%s, rh_path:%s, t_path:%s, report_sub_path:%s, ref_path:%s}" % \
+               (self.__opts.rh_offsets, self.__opts.t_offsets, self.report_filename, self.ref_filename, self.mode,
+                self.step, self.verbose, self.rh_path, self.t_path, self.report_sub_path, self.ref_path)
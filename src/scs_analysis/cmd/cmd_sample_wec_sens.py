@@ -18,13 +18,16 @@ class CmdSampleWeCSens(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-v] -s SENS PATH", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [-w WORKERS] [-v] -s SENS PATH", version="%prog 1.0")
 
         # compulsory...
         self.__parser.add_option("--sens", "-s", type="float", nargs=1, action="store", default=None, dest="sens",
                                  help="sensitivity (mV / ppb)")
 
         # optional...
+        self.__parser.add_option("--workers", "-w", type="int", nargs=1, action="store", dest="workers", default=1,
+                                 help="number of processes, for offline files (default 1)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -37,6 +40,9 @@ class CmdSampleWeCSens(object):
         if self.sens is None or len(self.__args) != 1:
             return False
 
+        if self.workers < 1:
+            return False
+
         return True
 
 
@@ -47,6 +53,11 @@ class CmdSampleWeCSens(object):
         return self.__opts.sens
 
 
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -64,4 +75,5 @@ class CmdSampleWeCSens(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleWeCSens:{sens:%s, verbose:%s, path:%s}" % (self.sens, self.verbose, self.path)
+        return "CmdSampleWeCSens:{sens:%s, workers:%s, verbose:%s, path:%s}" % \
+               (self.sens, self.workers, self.verbose, self.path)
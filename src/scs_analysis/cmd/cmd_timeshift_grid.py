@@ -21,7 +21,7 @@ class CmdTimeshiftGrid(object):
         Constructor
         """
         self.__parser = optparse.OptionParser(usage="%prog -r START END STEP -t START END STEP -p FILENAME -f FILENAME "
-                                                    "[-v] RH_PATH T_PATH REPORT_SUB_PATH REF_PATH",
+                                                    "[-j JOBS] [-v] RH_PATH T_PATH REPORT_SUB_PATH REF_PATH",
                                                     version="%prog 1.0")
 
         # compulsory...
@@ -38,6 +38,9 @@ class CmdTimeshiftGrid(object):
                                  help="reference data filename")
 
         # optional...
+        self.__parser.add_option("--jobs", "-j", type="int", nargs=1, action="store", dest="jobs", default=1,
+                                 help="number of offset pairs to evaluate in parallel (default 1)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -56,6 +59,9 @@ class CmdTimeshiftGrid(object):
         if len(self.__args) < 4:
             return False
 
+        if self.jobs < 1:
+            return False
+
         if self.rh_offset_start > self.rh_offset_end:
             return False
 
@@ -103,6 +109,11 @@ class CmdTimeshiftGrid(object):
         return None if self.__opts.t_offsets is None else self.__opts.t_offsets[2]
 
 
+    @property
+    def jobs(self):
+        return self.__opts.jobs
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -145,7 +156,7 @@ class CmdTimeshiftGrid(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdTimeshiftGrid:{rh_offsets:%s, t_offsets:%s, report_filename:%s, ref_filename:%s, verbose:%s, " \
-               "rh_path:%s, t_path:%s, report_sub_path:%s, ref_path:%s}" % \
-               (self.__opts.rh_offsets, self.__opts.t_offsets, self.report_filename, self.ref_filename, self.verbose,
-                self.rh_path, self.t_path, self.report_sub_path, self.ref_path)
+        return "CmdTimeshiftGrid:{rh_offsets:%s, t_offsets:%s, report_filename:%s, ref_filename:%s, jobs:%s, " \
+               "verbose:%s, rh_path:%s, t_path:%s, report_sub_path:%s, ref_path:%s}" % \
+               (self.__opts.rh_offsets, self.__opts.t_offsets, self.report_filename, self.ref_filename, self.jobs,
+                self.verbose, self.rh_path, self.t_path, self.report_sub_path, self.ref_path)
@@ -8,27 +8,58 @@ Created on 22 Feb 2019
 source repo: scs_analysis
 
 DESCRIPTION
-The csv_join utility performs an SQL join operation on a pair of CSV files. This is particularly useful where a
-comparison is to be made on timeline data from two devices.
+The csv_join utility performs an SQL join operation on two or more CSV files. This is particularly useful where a
+comparison is to be made on timeline data from two or more devices.
 
 All four join types are supported: inner, left outer, right outer and full outer. Inner joins are used when the output
 should only contain rows that match on their primary key.
 
-Output is in the form of a sequence of JSON documents containing three fields: rec, left table contents (labelled for
-the left PREFIX) and right table contents (labelled for the right PREFIX). The left and right contents do not contain
-their primary key fields. For outer joins, content nodes may be null.
+Output is in the form of a sequence of JSON documents containing rec, the left table contents (labelled for the left
+PREFIX), and one node of right table contents for each --right flag (labelled for its PREFIX). The contents do not
+contain their primary key fields. For outer joins, content nodes may be null.
+
+The --right flag may be repeated, so that any number of files - typically those of a set of co-located devices - are
+joined to the left-hand file in one operation. The prefixes must be distinct. An INNER join then reports the primary
+keys found in every file, a LEFT join those of the left-hand file, and a FULL join those of any file. RIGHT joins are
+only available for a single right-hand file.
 
 The --iso8601 flag is provided to indicate that the primary key should be interpreted as a ISO 8601 datetime. This is
 useful where data sets use alternate datetime formats such as 2019-02-22T01:00:00Z and 2019-02-22T01:00:00+00:00.
 
+Where all the files are in primary key order, as timeline data normally is, the --sorted flag may be used. The files are
+then joined by a single streaming merge, so that none is held in memory. The output is the same as that of the default
+join. The order of each file is verified as it is read, and execution terminates at the first primary key that is out of
+order.
+
+Devices and reference stations seldom report at exactly the same times. With the --iso8601 flag, the --as-of flag joins
+each left-hand document with the document of each right-hand file at or near its rec: the latest at or before it
+(BACKWARD), the earliest at or after it (FORWARD) or the closest (NEAREST), provided that the two are no further apart
+than the TOLERANCE. Only INNER and LEFT joins are available, and each right-hand content includes its own rec, so that
+the alignment can be checked. As-of joins are performed by a streaming merge, so all files must be in rec order.
+
+Without the --sorted or --as-of flags, files are joined in memory. Where they are too large for that, the
+--max-documents flag sets the number of documents that may be held (by default, 1000000). Once the COUNT is exceeded,
+documents are written to partition files in the temporary directory (see TMPDIR), by a hash of their primary key, and
+the join is performed partition by partition. The output is the same as that of an in-memory join.
+
 If the --verbose flag is used, a summary of the join operation is written to stderr.
 
 SYNOPSIS
-csv_join.py [-t TYPE] -l PREFIX PK FILENAME -r PREFIX PK FILENAME [-i] [-v]
+csv_join.py [-t TYPE] -l PREFIX PK FILENAME -r PREFIX PK FILENAME [-r PREFIX PK FILENAME ..]
+[-i [-a DIRECTION TOLERANCE]] [-s | -m COUNT] [-v]
 
 EXAMPLES
 csv_join.py -i -v -l praxis rec praxis_301/praxis_301_2018-08.csv -r ref rec ref/ref_2018-08.csv
 
+csv_join.py -i -s -t FULL -l praxis rec praxis_301/praxis_301_2018.csv -r ref rec ref/ref_2018.csv
+
+csv_join.py -i -m 200000 -t FULL -l praxis rec praxis_301/praxis_301_2018.csv -r ref rec ref/ref_2018.csv
+
+csv_join.py -i -a NEAREST 00:00:30 -l praxis rec praxis_301/praxis_301_2018-08.csv -r ref rec ref/ref_2018-08.csv
+
+csv_join.py -i -s -t LEFT -l ref rec ref/ref_2018-08.csv -r praxis_301 rec praxis_301/praxis_301_2018-08.csv \
+-r praxis_302 rec praxis_302/praxis_302_2018-08.csv -r praxis_303 rec praxis_303/praxis_303_2018-08.csv
+
 DOCUMENT EXAMPLE - INPUT
 left:
 {"rec": "2019-02-01T02:00:00Z", "val": {"NO2": {"weV": 0.297185, "cnc": 40.8, "aeV": 0.298467, "weC": 0.002271}}}
@@ -49,125 +80,161 @@ https://www.w3schools.com/sql/sql_join.asp
 
 import sys
 
+from functools import partial
+
 from scs_analysis.cmd.cmd_csv_join import CmdCSVJoin
+from scs_analysis.helper.grace_join import GraceJoin
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.merge_join import MergeJoin
+from scs_analysis.helper.output_stream import OutputStream
 
 from scs_core.csv.csv_reader import CSVReader
 
 from scs_core.data.join import Join
-from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
-if __name__ == '__main__':
+class JoinInput(object):
+    """
+    classdocs
+    """
 
-    reader = None
-    result = None
+    # ----------------------------------------------------------------------------------------------------------------
 
-    left_document_count = 0
-    left_processed_count = 0
+    def __init__(self, pk_path, filename):
+        """
+        Constructor
+        """
+        self.__pk_path = pk_path
+        self.__filename = filename
 
-    right_document_count = 0
-    right_processed_count = 0
+        self.__document_count = 0
+        self.__processed_count = 0
 
-    joined_count = 0
 
     # ----------------------------------------------------------------------------------------------------------------
-    # cmd...
 
-    cmd = CmdCSVJoin()
+    def documents(self):
+        # the documents of the file that have a primary key value - a document is processed once the next is sought...
+        try:
+            reader = CSVReader(filename=self.__filename)
+        except FileNotFoundError:
+            print("csv_join: file not found: %s" % self.__filename, file=sys.stderr)
+            exit(1)
 
-    if not cmd.is_valid():
-        cmd.print_help(sys.stderr)
-        exit(2)
+        try:
+            for row in reader.rows:
+                jstr = row.strip()
+                datum = JSONCodec.path_dict(row)
 
-    if not Join.is_valid_type(cmd.type):
-        print("csv_join: invalid join type: %s" % cmd.type, file=sys.stderr)
-        exit(2)
+                if datum is None:
+                    continue
 
-    if cmd.verbose:
-        print("csv_join: %s" % cmd, file=sys.stderr)
+                self.__document_count += 1
 
-    try:
-        # ------------------------------------------------------------------------------------------------------------
-        # resources...
+                if self.__pk_path not in datum.paths():
+                    print("csv_join: pk '%s' missing: %s" % (self.__pk_path, jstr), file=sys.stderr)
+                    exit(1)
 
-        join = Join.construct(cmd.left_prefix, cmd.left_pk, cmd.right_prefix, cmd.right_pk, cmd.iso8601)
+                if datum.node(self.__pk_path) == '':
+                    continue
 
-        try:
-            reader = CSVReader(filename=cmd.left_filename)
-        except FileNotFoundError:
-            print("csv_join: file not found: %s" % cmd.left_filename, file=sys.stderr)
-            exit(1)
+                yield datum
 
-        for row in reader.rows:
-            jstr = row.strip()
-            datum = PathDict.construct_from_jstr(row)
+                self.__processed_count += 1
 
-            if datum is None:
-                continue
+        finally:
+            reader.close()
 
-            left_document_count += 1
 
-            if cmd.left_pk not in datum.paths():
-                print("csv_join: pk '%s' missing: %s" % (cmd.left_pk, jstr), file=sys.stderr)
-                exit(1)
+    # ----------------------------------------------------------------------------------------------------------------
 
-            if datum.node(cmd.left_pk) == '':
-                continue
+    @property
+    def document_count(self):
+        return self.__document_count
 
-            try:
-                join.append_to_left(datum)
-            except ValueError as ex:
-                print("csv_join: invalid pk '%s' in: %s" % (datum.node(cmd.left_pk), jstr), file=sys.stderr)
-                exit(1)
 
-            left_processed_count += 1
+    @property
+    def processed_count(self):
+        return self.__processed_count
 
-        reader.close()
 
-        try:
-            reader = CSVReader(filename=cmd.right_filename)
-        except FileNotFoundError:
-            print("csv_join: file not found: %s" % cmd.right_filename, file=sys.stderr)
-            exit(1)
+    # ----------------------------------------------------------------------------------------------------------------
 
-        for row in reader.rows:
-            jstr = row.strip()
-            datum = PathDict.construct_from_jstr(row)
+    def __str__(self, *args, **kwargs):
+        return "JoinInput:{pk_path:%s, filename:%s, document_count:%s, processed_count:%s}" % \
+               (self.__pk_path, self.__filename, self.document_count, self.processed_count)
 
-            if datum is None:
-                continue
 
-            right_document_count += 1
+# --------------------------------------------------------------------------------------------------------------------
 
-            if cmd.right_pk not in datum.paths():
-                print("csv_join: pk '%s' missing: %s" % (cmd.right_pk, jstr), file=sys.stderr)
-                exit(1)
+if __name__ == '__main__':
+
+    inputs = []
+    join = None
 
-            if datum.node(cmd.right_pk) == '':
-                continue
+    joined_count = 0
 
-            try:
-                join.append_to_right(datum)
-            except ValueError as ex:
-                print("csv_join: invalid pk '%s' in: %s" % (datum.node(cmd.right_pk), jstr), file=sys.stderr)
-                exit(1)
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
 
-            right_processed_count += 1
+    cmd = CmdCSVJoin()
 
-        reader.close()
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if not Join.is_valid_type(cmd.type):
+        print("csv_join: invalid join type: %s" % cmd.type, file=sys.stderr)
+        exit(2)
+
+    if cmd.as_of and not MergeJoin.is_valid_direction(cmd.direction):
+        print("csv_join: invalid as-of direction: %s" % cmd.direction, file=sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("csv_join: %s" % cmd, file=sys.stderr)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        inputs = [JoinInput(pk, filename) for _, pk, filename in cmd.sets]
+
+        prefixes = [prefix for prefix, _, _ in cmd.sets]
+        pks = [pk for _, pk, _ in cmd.sets]
+
+        if cmd.sorted or cmd.as_of:
+            join = MergeJoin.construct(prefixes, pks, cmd.iso8601, [join_input.documents() for join_input in inputs])
+
+        else:
+            max_documents = GraceJoin.DEFAULT_MAX_DOCUMENTS if cmd.max_documents is None else cmd.max_documents
+            join = GraceJoin.construct(prefixes, pks, cmd.iso8601, max_documents)
+
+            for index, join_input in enumerate(inputs):
+                for datum in join_input.documents():
+                    try:
+                        join.append(index, datum)
+                    except ValueError:
+                        print("csv_join: invalid pk '%s' in: %s" % (datum.node(pks[index]), JSONCodec.dumps(datum)),
+                              file=sys.stderr)
+                        exit(1)
 
         if cmd.verbose:
             print("csv_join: %s" % join, file=sys.stderr)
             sys.stderr.flush()
 
+        stdout = OutputStream.construct()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        if cmd.type == 'LEFT':
+        if cmd.as_of:
+            operation = partial(join.as_of, cmd.direction, cmd.tolerance.total_seconds(), cmd.type == 'LEFT')
+
+        elif cmd.type == 'LEFT':
             operation = join.left
 
         elif cmd.type == 'RIGHT':
@@ -179,11 +246,15 @@ if __name__ == '__main__':
         else:
             operation = join.inner
 
-        for datum in operation():
-            print(JSONify.dumps(datum))
-            sys.stdout.flush()
+        try:
+            for datum in operation():
+                stdout.print(JSONCodec.dumps(datum))
 
-            joined_count += 1
+                joined_count += 1
+
+        except ValueError as ex:
+            print("csv_join: %s" % ex, file=sys.stderr)
+            exit(1)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -194,10 +265,20 @@ if __name__ == '__main__':
             print("csv_join: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        if isinstance(join, GraceJoin):
+            join.close()
+
         if cmd.verbose:
-            print("csv_join: left: documents: %d processed: %d" % (left_document_count, left_processed_count),
-                  file=sys.stderr)
-            print("csv_join: right: documents: %d processed: %d" % (right_document_count, right_processed_count),
-                  file=sys.stderr)
+            for index, join_input in enumerate(inputs):
+                if index == 0:
+                    label = 'left'
+                elif len(inputs) == 2:
+                    label = 'right'
+                else:
+                    label = 'right %s' % prefixes[index]
+
+                print("csv_join: %s: documents: %d processed: %d" %
+                      (label, join_input.document_count, join_input.processed_count), file=sys.stderr)
+
             print("csv_join: joined: %d" % joined_count,
                   file=sys.stderr)
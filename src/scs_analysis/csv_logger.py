@@ -63,6 +63,7 @@ access to the storage medium.
 import sys
 
 from scs_analysis.cmd.cmd_csv_logger import CmdCSVLogger
+from scs_analysis.helper.output_stream import OutputStream
 
 from scs_core.csv.csv_log import CSVLog
 from scs_core.csv.csv_logger import CSVLogger
@@ -114,6 +115,8 @@ if __name__ == '__main__':
             print("csv_logger: %s" % logger, file=sys.stderr)
             sys.stderr.flush()
 
+        stdout = OutputStream.construct(live=True)
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -136,8 +139,7 @@ if __name__ == '__main__':
 
             # echo...
             if cmd.echo:
-                print(datum)
-                sys.stdout.flush()
+                stdout.print(datum)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -48,6 +48,7 @@ scs_analysis/csv_writer
 import sys
 
 from scs_analysis.cmd.cmd_csv_reader import CmdCSVReader
+from scs_analysis.helper.output_stream import OutputStream
 
 from scs_core.csv.csv_reader import CSVReader
 
@@ -67,8 +68,10 @@ if __name__ == '__main__':
     if cmd.verbose:
         print("csv_reader: %s" % cmd, file=sys.stderr)
 
+    stdout = OutputStream.construct()
+
     if cmd.array:
-        print('[', end='')
+        stdout.print('[', end='')
 
     try:
         for filename in cmd.filenames:
@@ -96,15 +99,13 @@ if __name__ == '__main__':
 
                 if cmd.array:
                     if count == 0:
-                        print(datum, end='')
+                        stdout.print(datum, end='')
 
                     else:
-                        print(", %s" % datum, end='')
+                        stdout.print(", %s" % datum, end='')
 
                 else:
-                    print(datum)
-
-                sys.stdout.flush()
+                    stdout.print(datum)
 
                 count += 1
 
@@ -121,7 +122,7 @@ if __name__ == '__main__':
 
     finally:
         if cmd.array:
-            print(']')
+            stdout.print(']')
 
         if cmd.verbose:
             print("csv_reader: rows: %d" % count, file=sys.stderr)
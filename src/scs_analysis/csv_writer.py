@@ -38,6 +38,7 @@ scs_analysis/csv_reader
 import sys
 
 from scs_analysis.cmd.cmd_csv_writer import CmdCSVWriter
+from scs_analysis.helper.output_stream import OutputStream
 
 from scs_core.csv.csv_writer import CSVWriter
 
@@ -71,6 +72,9 @@ if __name__ == '__main__':
         if cmd.verbose:
             print("csv_writer: %s" % writer, file=sys.stderr)
 
+        # without a filename, CSV rows go to stdout, and echoes must interleave with them...
+        stdout = OutputStream.construct(live=cmd.filename is None)
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -82,8 +86,7 @@ if __name__ == '__main__':
 
             # echo...
             if cmd.echo:
-                print(jstr)
-                sys.stdout.flush()
+                stdout.print(jstr)
 
             count += 1
 
@@ -0,0 +1,253 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+Chunked, column-wise filtering of a document stream, for the --batch modes of sample_low_pass and sample_error.
+
+Documents are read in chunks. For each chunk, the numeric leaves under the given nodes are gathered into one column
+per leaf path, and each column is passed through its own recurrence. The state of a recurrence is carried from chunk
+to chunk, so results do not depend on where the chunks fall, and are identical to those of the streaming utility.
+
+Each filter is an exponential average, and each output depends on the one before. A closed form, or
+scipy.signal.lfilter(..), would round differently from the streaming utility, so the recurrence is a plain loop over
+its column. What is done per chunk rather than per document is everything around it - leaf path resolution, column
+extraction, and the construction of output documents without PathDict.
+
+ErrorRecurrence is also used one value at a time, by sample_error and sample_multi_filter in streaming mode.
+"""
+
+from collections import OrderedDict
+
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.rolling_filter import RollingFilter
+
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BatchFilter(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_CHUNK_SIZE = 65536                              # documents
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def target(document: PathDict):
+        node = document.node()
+
+        return OrderedDict(rec=node['rec']) if 'rec' in node else OrderedDict()
+
+
+    @staticmethod
+    def cells(layout):
+        # for each document, (path, index in column) for each of its leaf paths...
+        cursors = {}
+
+        for paths in layout:
+            cells = []
+
+            for path in paths:
+                index = cursors.get(path, 0)
+                cursors[path] = index + 1
+
+                cells.append((path, index))
+
+            yield cells
+
+
+    @staticmethod
+    def insert(target, path, fields):
+        # as PathDict.append(..) for each field, for paths without array indices...
+        if ':' in path:
+            target_dict = PathDict(target)
+
+            for field, value in fields:
+                target_dict.append(path + '.' + field, value)
+
+            return
+
+        node = target
+
+        for key in path.split('.'):
+            try:
+                node = node[key]
+
+            except KeyError:
+                node[key] = OrderedDict()
+                node = node[key]
+
+        for field, value in fields:
+            node[field] = value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, nodes, construct, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Constructor
+        """
+        self.__filter = RollingFilter(nodes, construct)     # RollingFilter of recurrence
+        self.__chunk_size = chunk_size                      # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def chunks(self, lines, strict=False):
+        # arrays of PathDict - if strict, the stream ends at the first line that is not a document...
+        documents = []
+
+        for line in lines:
+            datum = JSONCodec.path_dict(line)
+
+            if datum is None:
+                if strict:
+                    break
+
+                continue
+
+            documents.append(datum)
+
+            if len(documents) == self.__chunk_size:
+                yield documents
+                documents = []
+
+        if documents:
+            yield documents
+
+
+    def columns(self, documents):
+        # the leaf paths of each document, and a dict of path: (array of value, recurrence)...
+        layout = []
+        columns = OrderedDict()
+
+        for document in documents:
+            paths = []
+
+            for path, value, recurrence in self.__filter.values(document):
+                try:
+                    column = columns[path]
+
+                except KeyError:
+                    column = columns[path] = ([], recurrence)
+
+                column[0].append(value)
+                paths.append(path)
+
+            layout.append(paths)
+
+        return layout, columns
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BatchFilter:{chunk_size:%s, filter:%s}" % (self.__chunk_size, self.__filter)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class LowPassRecurrence(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, delta_t, cut_off_frequency):
+        tau = 1 / cut_off_frequency
+
+        return cls(delta_t / tau)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, alpha):
+        """
+        Constructor
+        """
+        self.__alpha = alpha                                # float
+        self.__y = None                                     # float - carried from chunk to chunk
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def line(self, xs):
+        # as LowPassFilter.line(..) for each x...
+        alpha = self.__alpha
+        y = self.__y
+
+        ys = []
+
+        for x in xs:
+            if y is None:
+                y = x
+
+            y += alpha * (x - y)
+            ys.append(y)
+
+        self.__y = y
+
+        return ys
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "LowPassRecurrence:{alpha:%s, y:%s}" % (self.__alpha, self.__y)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ErrorRecurrence(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__aggregate = None                             # float
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def compute(self, latest):
+        # the aggregate, or None where it is first set...
+        if self.__aggregate is None:
+            self.__aggregate = latest
+            return None
+
+        self.__aggregate = (0.9 * self.__aggregate) + (0.1 * latest)
+
+        return self.__aggregate
+
+
+    def line(self, xs):
+        # as compute(..) for each x...
+        return [self.compute(x) for x in xs]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def aggregate(self):
+        return self.__aggregate
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        aggregate = "None" if self.__aggregate is None else format(self.__aggregate, '.6f')
+
+        return "ErrorRecurrence:{aggregate:%s}" % aggregate
@@ -0,0 +1,209 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+Fast checkpoint bucketing for the aggregation hot loop.
+
+CheckpointIndex maps an epoch timestamp to the epoch timestamp of its enclosing checkpoint. Checkpoints repeat every
+day in local time. The index recovers the ticks of each hour, minute and second field from the CheckpointGenerator
+once, and then repeats the generator's next(..) step for step, on integers, with no datetime objects per document.
+
+FastISO8601 parses the fixed rec formats emitted by devices - such as 2019-01-01T12:00:00Z or
+2019-01-01T12:00:00.123+01:00 - with datetime.fromisoformat(..), without regular expressions. Any other form is passed
+to LocalizedDatetime.construct_from_iso8601(..).
+"""
+
+from bisect import bisect_right
+from datetime import datetime, timezone
+
+from scs_core.data.checkpoint_generator import CheckpointGenerator
+from scs_core.data.localized_datetime import LocalizedDatetime
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CheckpointIndex(object):
+    """
+    classdocs
+    """
+
+    DAY = 86400                                             # seconds
+
+    __ORIGIN = datetime(2000, 1, 1, tzinfo=timezone.utc)    # any day, for alignment tests
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, specification):
+        return cls(CheckpointGenerator.construct(specification))
+
+
+    @staticmethod
+    def utc_offset(localised_datetime: LocalizedDatetime):
+        offset = localised_datetime.datetime.utcoffset()
+
+        return 0 if offset is None else int(offset.total_seconds())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, generator):
+        """
+        Constructor
+        """
+        self.__generator = generator                        # CheckpointGenerator
+        self.__is_24h = generator.is_24h()                  # bool
+
+        hours, minutes, seconds = self.__field_ticks(generator)
+
+        self.__hours = hours                                # array of int
+        self.__minutes = minutes                            # array of int
+        self.__seconds = seconds                            # array of int
+
+        self.__aligned_hours = frozenset(hours)             # set of int
+        self.__aligned_minutes = frozenset(minutes)         # set of int
+        self.__aligned_seconds = frozenset(seconds)         # set of int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def enclosing_timestamp(self, timestamp, utc_offset):
+        local = timestamp + utc_offset
+        local_second = int(local // 1)
+
+        day_start = local_second - local_second % self.DAY
+        hour, remainder = divmod(local_second - day_start, 3600)
+        minute, second = divmod(remainder, 60)
+
+        if local == local_second and hour in self.__aligned_hours and minute in self.__aligned_minutes and \
+                second in self.__aligned_seconds:
+            return timestamp
+
+        return day_start + self.__following(hour, minute, second) - utc_offset
+
+
+    def enclosing_localised_datetime(self, localised_datetime: LocalizedDatetime):
+        utc_offset = self.utc_offset(localised_datetime)
+        timestamp = self.enclosing_timestamp(localised_datetime.timestamp(), utc_offset)
+
+        return self.localised_datetime(timestamp, localised_datetime.tzinfo)
+
+
+    def next_localised_datetime(self, localised_datetime: LocalizedDatetime):
+        utc_offset = self.utc_offset(localised_datetime)
+        local_second = int(localised_datetime.timestamp() // 1) + utc_offset
+
+        day_start = local_second - local_second % self.DAY
+        hour, remainder = divmod(local_second - day_start, 3600)
+        minute, second = divmod(remainder, 60)
+
+        timestamp = day_start + self.__following(hour, minute, second) - utc_offset
+
+        return self.localised_datetime(timestamp, localised_datetime.tzinfo)
+
+
+    @staticmethod
+    def localised_datetime(timestamp, tzinfo):
+        return LocalizedDatetime(datetime.fromtimestamp(timestamp, tzinfo))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __following(self, hour, minute, second):
+        # CheckpointGenerator.next(..), step for step, giving seconds from the start of the day...
+        seconds = self.__seconds
+        next_second = seconds[bisect_right(seconds, second) % len(seconds)]
+
+        if next_second > second:
+            minute -= 1                                     # current minute should be tested
+
+        minutes = self.__minutes
+        next_minute = minutes[bisect_right(minutes, minute) % len(minutes)]
+
+        if next_minute > minute:
+            hour -= 1                                       # current hour should be tested
+
+        hours = self.__hours
+        next_hour = hours[bisect_right(hours, hour) % len(hours)]
+
+        day_increment = self.__is_24h or next_hour < hour
+
+        return next_hour * 3600 + next_minute * 60 + next_second + (self.DAY if day_increment else 0)
+
+
+    @classmethod
+    def __field_ticks(cls, generator):
+        # each field of a generated checkpoint is one of the field's ticks...
+        _, hour, minute, second = generator.next(0, 0, 0)
+
+        def aligns(h, m, s):
+            return generator.aligns(LocalizedDatetime(cls.__ORIGIN.replace(hour=h, minute=m, second=s)))
+
+        hours = [h for h in range(24) if aligns(h, minute, second)]
+        minutes = [m for m in range(60) if aligns(hour, m, second)]
+        seconds = [s for s in range(60) if aligns(hour, minute, s)]
+
+        return hours, minutes, seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def generator(self):
+        return self.__generator
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CheckpointIndex:{hours:%s, minutes:%s, seconds:%s}" % (self.__hours, self.__minutes, self.__seconds)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class FastISO8601(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, datetime_str):
+        localised = cls.__parse(datetime_str)
+
+        if localised is not None:
+            return localised
+
+        return LocalizedDatetime.construct_from_iso8601(datetime_str)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __parse(s):
+        # YYYY-MM-DDTHH:MM:SS[.fff | .ffffff]{Z | +HH:MM}, checked here, and parsed by datetime...
+        try:
+            if s[-1] == 'Z':
+                zone_start = len(s) - 1
+                s = s[:-1] + '+00:00'
+
+            else:
+                zone_start = len(s) - 6
+
+            if s[4] != '-' or s[7] != '-' or s[10] != 'T' or s[13] != ':' or s[16] != ':':
+                return None
+
+            if s[zone_start] not in '+-':
+                return None
+
+            if zone_start != 19 and (s[19] != '.' or zone_start - 20 not in (3, 6)):
+                return None
+
+            return LocalizedDatetime(datetime.fromisoformat(s))
+
+        except (AttributeError, IndexError, TypeError, ValueError):
+            return None                                     # includes datetime without fromisoformat(..)
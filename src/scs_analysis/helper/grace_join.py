@@ -0,0 +1,325 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A disk-spilling equivalent of MultiJoin, for the default mode of csv_join.
+
+Documents are appended to a MultiJoin until more than max_documents have been appended. At that point the join spills:
+the documents held so far, and each document appended after, are written to one of FAN_OUT partition files in a
+temporary directory, chosen by a hash of its primary key. Primary keys are normalised as they are by JoinSet, so
+equal keys - such as 2019-02-22T01:00:00Z and 2019-02-22T01:00:00+00:00 with pk_is_iso8601 - fall in the same
+partition. Each partition is then joined in memory by a MultiJoin of its own. A partition that still holds more than
+max_documents is partitioned again with a different hash, to a depth of MAX_DEPTH.
+
+The output of each partition is written to a file in the order of the join type, and the files are merged, so that the
+output is the same as that of a MultiJoin holding every document:
+
+* INNER and LEFT joins report in the order in which primary keys first appear in the left-hand set, and RIGHT joins in
+the order in which they first appear in the last set
+* FULL joins report in ascending primary key order
+
+Documents are held on disk as "index TAB ordinal TAB JSON", and outputs as "key TAB JSON", where the key is the
+ordinal of the first document of the primary key in the driving set, or the primary key itself for FULL joins.
+"""
+
+import heapq
+import os
+import tempfile
+
+from operator import itemgetter
+
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.multi_join import MultiJoin
+
+from scs_core.data.localized_datetime import LocalizedDatetime
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GraceJoin(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_MAX_DOCUMENTS = 1000000                         # documents held in memory
+    FAN_OUT = 32                                            # partitions per partitioning
+    MAX_DEPTH = 4                                           # partitionings
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, set_paths, pk_paths, pk_is_iso8601, max_documents=DEFAULT_MAX_DOCUMENTS):
+        return GraceJoin(set_paths, pk_paths, pk_is_iso8601, max_documents)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, set_paths, pk_paths, pk_is_iso8601, max_documents):
+        """
+        Constructor
+        """
+        self.__set_paths = set_paths                        # array of string
+        self.__pk_paths = pk_paths                          # array of string
+        self.__pk_is_iso8601 = pk_is_iso8601                # bool
+        self.__max_documents = max_documents                # int
+
+        self.__join = MultiJoin.construct(set_paths, pk_paths, pk_is_iso8601)   # MultiJoin, until spilled
+        self.__documents = []                               # array of (index, ordinal, PathDict), until spilled
+        self.__ordinal = 0                                  # int - documents appended
+
+        self.__directory = None                             # TemporaryDirectory, once spilled
+        self.__partitions = None                            # array of JoinPartition, once spilled
+        self.__partition_count = 0                          # int - partition files written
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, index, document: PathDict):
+        if self.__partitions is None:
+            self.__join.append(index, document)
+            self.__documents.append((index, self.__ordinal, document))
+
+            if len(self.__documents) > self.__max_documents:
+                self.__spill()
+
+        else:
+            self.__write(self.__partitions, 0, index, self.__ordinal, document)
+
+        self.__ordinal += 1
+
+
+    def close(self):
+        if self.__directory is not None:
+            self.__directory.cleanup()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def inner(self):
+        return self.__run('inner', 0)
+
+
+    def left(self):
+        return self.__run('left', 0)
+
+
+    def right(self):
+        return self.__run('right', len(self.__set_paths) - 1)
+
+
+    def full(self):
+        return self.__run('full', None)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __spill(self):
+        self.__directory = tempfile.TemporaryDirectory(prefix='csv_join_')
+        self.__partitions = self.__open_partitions()
+
+        for index, ordinal, document in self.__documents:
+            self.__write(self.__partitions, 0, index, ordinal, document)
+
+        self.__join = None
+        self.__documents = None
+
+
+    def __open_partitions(self):
+        partitions = []
+
+        for _ in range(self.FAN_OUT):
+            partitions.append(JoinPartition(os.path.join(self.__directory.name, str(self.__partition_count))))
+            self.__partition_count += 1
+
+        return partitions
+
+
+    def __write(self, partitions, depth, index, ordinal, document: PathDict):
+        key = self.__key(index, document)
+        partition = partitions[hash((depth, key)) % len(partitions)]
+
+        partition.write(index, ordinal, JSONCodec.dumps(document.node()))
+
+
+    def __key(self, index, document: PathDict):
+        # the normalised primary key, as JoinSet.append(..) - ISO 8601 datetimes as POSIX timestamps...
+        pk_value = document.node(self.__pk_paths[index])
+
+        if self.__pk_is_iso8601:
+            datetime = LocalizedDatetime.construct_from_iso8601(pk_value)
+
+            if datetime is None:
+                raise ValueError(pk_value)
+
+            return datetime.timestamp()
+
+        return pk_value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __run(self, operation, driver):
+        # driver is the index of the set whose order is reported, or None for primary key order...
+        if self.__partitions is None:
+            yield from getattr(self.__join, operation)()
+            return
+
+        for partition in self.__partitions:
+            partition.close()
+
+        outputs = [self.__join_partition(partition, 1, operation, driver) for partition in self.__partitions]
+
+        for _, jstr in self.__merge(outputs):
+            yield JSONCodec.path_dict(jstr)
+
+        for output in outputs:
+            output.remove()
+
+
+    def __join_partition(self, partition, depth, operation, driver):
+        output = JoinPartition(partition.filename + '.out')
+
+        # too large - partition again...
+        if len(partition) > self.__max_documents and depth < self.MAX_DEPTH:
+            partitions = self.__open_partitions()
+
+            for index, ordinal, document in partition.documents():
+                self.__write(partitions, depth, index, ordinal, document)
+
+            partition.remove()
+
+            for sub_partition in partitions:
+                sub_partition.close()
+
+            sub_outputs = [self.__join_partition(sub_partition, depth + 1, operation, driver)
+                           for sub_partition in partitions]
+
+            for key, jstr in self.__merge(sub_outputs):
+                output.write_output(key, jstr)
+
+            for sub_output in sub_outputs:
+                sub_output.remove()
+
+            output.close()
+
+            return output
+
+        # join...
+        join = MultiJoin.construct(self.__set_paths, self.__pk_paths, self.__pk_is_iso8601)
+        ordinals = {}
+
+        for index, ordinal, document in partition.documents():
+            join.append(index, document)
+
+            if index == driver:
+                ordinals.setdefault(self.__key(index, document), ordinal)
+
+        partition.remove()
+
+        pk_path = self.__pk_paths[0 if driver is None else driver]
+
+        for datum in getattr(join, operation)():
+            pk_value = datum.node(pk_path)
+            key = pk_value.timestamp() if self.__pk_is_iso8601 else pk_value
+
+            output.write_output(key if driver is None else ordinals[key], JSONCodec.dumps(datum))
+
+        output.close()
+
+        return output
+
+
+    @staticmethod
+    def __merge(outputs):
+        return heapq.merge(*(output.outputs() for output in outputs), key=itemgetter(0))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def spilled(self):
+        return self.__partitions is not None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        join = self.__join if self.__partitions is None else None
+
+        return "GraceJoin:{max_documents:%s, appended:%s, spilled:%s, partitions:%s, join:%s}" % \
+               (self.__max_documents, self.__ordinal, self.spilled, self.__partition_count, join)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class JoinPartition(object):
+    """
+    classdocs
+    """
+
+    def __init__(self, filename):
+        """
+        Constructor
+        """
+        self.__filename = filename                          # string
+        self.__file = open(filename, 'w')                   # file, until closed
+        self.__count = 0                                    # int - lines written
+
+
+    def __len__(self):
+        return self.__count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, index, ordinal, jstr):
+        self.__file.write('%d\t%d\t%s\n' % (index, ordinal, jstr))
+        self.__count += 1
+
+
+    def write_output(self, key, jstr):
+        self.__file.write('%s\t%s\n' % (JSONCodec.dumps(key), jstr))
+        self.__count += 1
+
+
+    def close(self):
+        self.__file.close()
+
+
+    def remove(self):
+        os.remove(self.__filename)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def documents(self):
+        with open(self.__filename) as file:
+            for line in file:
+                index, ordinal, jstr = line.split('\t', 2)
+
+                yield int(index), int(ordinal), JSONCodec.path_dict(jstr)
+
+
+    def outputs(self):
+        with open(self.__filename) as file:
+            for line in file:
+                key, jstr = line.rstrip('\n').split('\t', 1)
+
+                yield JSONCodec.loads(key), jstr
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "JoinPartition:{filename:%s, count:%s}" % (self.filename, len(self))
@@ -0,0 +1,76 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+The document parse / serialise layer for the stream utilities.
+
+Parsing uses orjson if it is installed, falling back to the standard library for any document that orjson rejects
+(such as NaN, Infinity or integers wider than 64 bits), and for every document if orjson is not installed. Key order
+is preserved in both cases.
+
+Serialisation uses a single, cached JSONify encoder, so its output is byte-identical to JSONify.dumps(..) - key order,
+separators, float formatting and non-ASCII characters are unchanged. orjson is not used for serialisation, because
+its separators and float formatting differ from those of the standard library.
+
+https://github.com/ijl/orjson
+"""
+
+import json
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class JSONCodec(object):
+    """
+    classdocs
+    """
+
+    __DECODER = json.JSONDecoder(object_pairs_hook=OrderedDict)
+    __ENCODER = JSONify(ensure_ascii=False)                 # the JSONify.dumps(..) defaults
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def is_accelerated():
+        return orjson is not None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def loads(cls, jstr):
+        if orjson is not None:
+            try:
+                return orjson.loads(jstr)
+            except orjson.JSONDecodeError:
+                pass                                        # the standard library decides
+
+        return cls.__DECODER.decode(jstr)
+
+
+    @classmethod
+    def path_dict(cls, jstr):
+        try:
+            jdict = cls.loads(jstr)
+        except ValueError:
+            return None
+
+        return PathDict(jdict)
+
+
+    @classmethod
+    def dumps(cls, obj):
+        return cls.__ENCODER.encode(obj)
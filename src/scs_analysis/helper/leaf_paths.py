@@ -0,0 +1,71 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+Leaf path resolution, shared by sample_aggregate and the rolling filter utilities.
+
+The leaf paths under a set of nodes are found with LeafPaths.find(..). Callers cache them against the shape of the
+document - its keys, and which of its leaves are null - so that they are only resolved again when the shape of the
+input changes. No more than MAX_SHAPES shapes are held before a cache is cleared.
+
+An IndexError is raised for a node whose array index is out of range, for the calling utility to report.
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.datum import Datum
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class LeafPaths(object):
+    """
+    classdocs
+    """
+
+    MAX_SHAPES = 256                                        # document shapes held, before a cache is cleared
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def find(nodes, sample: PathDict):
+        leaf_paths = OrderedDict()                          # dict of path: is_numeric
+
+        for node in nodes:
+            try:
+                paths = sample.paths(node)
+
+            except KeyError:
+                continue
+
+            except IndexError as ex:
+                raise IndexError("%s: %s" % (node, ex))
+
+            for path in paths:
+                if path == 'rec':
+                    continue
+
+                value = sample.node(path)
+
+                if value is None:
+                    continue                                # the type is not yet known
+
+                leaf_paths[path] = Datum.is_numeric(value)
+
+        return leaf_paths
+
+
+    @classmethod
+    def shape(cls, node):
+        # a hashable fingerprint of the keys of a document, and of which of its leaves are null...
+        if isinstance(node, dict):
+            return tuple((key, cls.shape(value)) for key, value in node.items())
+
+        if isinstance(node, list):
+            return ('[', ) + tuple(cls.shape(item) for item in node)
+
+        return node is not None
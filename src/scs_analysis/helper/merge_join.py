@@ -0,0 +1,337 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A streaming sort-merge equivalent of scs_core's Join, for the --sorted mode of csv_join.
+
+Join holds both sets of documents in dictionaries until the join is performed. Where the sets are already in primary
+key order - as timeline data normally is - the join can instead be performed as a single k-way merge of the streams,
+holding only the current document of each set.
+
+The first set is the left-hand set, and each of the others is a right-hand set. With one right-hand set, the output is
+the same as that of Join, and with several it is the same as that of MultiJoin:
+
+* a primary key that appears more than once in a set is joined once, with the last of its documents
+* INNER joins report the primary keys found in every set, and LEFT joins those of the left-hand set, as given by the
+left-hand set
+* RIGHT joins report the primary keys of the last set, as given by that set
+* FULL joins report every primary key, as given by the first right-hand set in which it is present, or otherwise by the
+left-hand set
+* all four join types report in ascending primary key order
+
+The order of each set is verified as it is read. A ValueError is raised at the first primary key that is lower than the
+one before it.
+
+The same merge provides an as-of join, for ISO 8601 primary keys. Each document in the left-hand set is joined with the
+document of each right-hand set whose rec is the latest at or before its own (BACKWARD), the earliest at or after its
+own (FORWARD), or the closest (NEAREST, preferring the earlier on a tie) - provided that the two are no more than the
+tolerance apart. Right-hand documents are reported with their own primary keys, so that the alignment can be seen.
+"""
+
+import heapq
+
+from scs_analysis.helper.json_codec import JSONCodec
+
+from scs_core.data.localized_datetime import LocalizedDatetime
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MergeJoin(object):
+    """
+    classdocs
+    """
+
+    DIRECTIONS = ('BACKWARD', 'FORWARD', 'NEAREST')
+
+    @classmethod
+    def is_valid_direction(cls, name):
+        return name.upper() in cls.DIRECTIONS
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, set_paths, pk_paths, pk_is_iso8601, documents):
+        sets = [SortedJoinSet(set_path, pk_path, pk_is_iso8601, set_documents)
+                for set_path, pk_path, set_documents in zip(set_paths, pk_paths, documents)]
+
+        return MergeJoin(sets)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, sets):
+        """
+        Constructor
+        """
+        self.__sets = sets                      # array of SortedJoinSet - the left-hand set, then the right-hand sets
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def inner(self):
+        for entries in self.__merge():
+            if any(entry is None for entry in entries):
+                continue
+
+            yield self.__union(self.__sets[0].pk_path, entries[0][0], entries)
+
+
+    def left(self):
+        for entries in self.__merge():
+            if entries[0] is None:
+                continue
+
+            yield self.__union(self.__sets[0].pk_path, entries[0][0], entries)
+
+
+    def right(self):
+        for entries in self.__merge():
+            if entries[-1] is None:
+                continue
+
+            yield self.__union(self.__sets[-1].pk_path, entries[-1][0], entries)
+
+
+    def full(self):
+        for entries in self.__merge():
+            entry = next((entry for entry in entries[1:] if entry is not None), entries[0])
+
+            yield self.__union(self.__sets[0].pk_path, entry[0], entries)
+
+
+    def as_of(self, direction, tolerance, outer=False):
+        # direction is BACKWARD, FORWARD or NEAREST, tolerance is in seconds - if outer, as LEFT, otherwise as INNER...
+        direction = direction.upper()
+        left_set = self.__sets[0]
+
+        cursors = [AsOfCursor(right_set.entries()) for right_set in self.__sets[1:]]
+
+        for left in left_set.entries():
+            pk = left[0]
+            rights = [cursor.match(pk, direction, tolerance) for cursor in cursors]
+
+            if not outer and any(right is None for right in rights):
+                continue
+
+            yield PathDict.union((left_set.pk_path, pk), (left_set.set_path, left_set.node(left[1])),
+                                 *((right_set.set_path, None if right is None else right[1])
+                                   for right_set, right in zip(self.__sets[1:], rights)))
+
+        # the remainder of each right-hand set is verified...
+        for cursor in cursors:
+            cursor.drain()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __keyed(index, entries):
+        for entry in entries:
+            yield entry[0], index, entry
+
+
+    def __merge(self):
+        # the entry of each set for each primary key, in order - absent entries are None...
+        streams = [self.__keyed(index, join_set.entries()) for index, join_set in enumerate(self.__sets)]
+
+        pk = None
+        entries = None
+
+        for entry_pk, index, entry in heapq.merge(*streams):
+            if entries is not None and entry_pk != pk:
+                yield entries
+                entries = None
+
+            if entries is None:
+                pk = entry_pk
+                entries = [None] * len(self.__sets)
+
+            entries[index] = entry
+
+        if entries is not None:
+            yield entries
+
+
+    def __union(self, pk_path, pk, entries):
+        return PathDict.union((pk_path, pk), *((join_set.set_path, None if entry is None else join_set.node(entry[1]))
+                                               for join_set, entry in zip(self.__sets, entries)))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "MergeJoin:{sets:[%s]}" % ', '.join(str(join_set) for join_set in self.__sets)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AsOfCursor(object):
+    """
+    classdocs
+    """
+
+    def __init__(self, entries):
+        """
+        Constructor
+        """
+        self.__entries = entries                            # iterator of (pk value, document)
+
+        self.__preceding = None                             # the latest entry at or before the current pk
+        self.__following = next(entries, None)              # the earliest entry after the current pk
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def match(self, pk, direction, tolerance):
+        # pk values must be presented in order...
+        while self.__following is not None and self.__following[0] <= pk:
+            self.__preceding = self.__following
+            self.__following = next(self.__entries, None)
+
+        preceding = self.__preceding
+        following = self.__following
+
+        if preceding is not None and preceding[0] == pk:
+            return preceding                                # exact match, in any direction
+
+        if direction == 'BACKWARD':
+            candidates = (preceding, )
+
+        elif direction == 'FORWARD':
+            candidates = (following, )
+
+        else:
+            candidates = (preceding, following)
+
+        match = None
+        match_distance = None
+
+        for candidate in candidates:
+            if candidate is None:
+                continue
+
+            distance = abs(candidate[0].timestamp() - pk.timestamp())
+
+            if distance <= tolerance and (match is None or distance < match_distance):
+                match = candidate
+                match_distance = distance
+
+        return match
+
+
+    def drain(self):
+        for _ in self.__entries:
+            pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AsOfCursor:{preceding:%s, following:%s}" % \
+               (None if self.__preceding is None else self.__preceding[0],
+                None if self.__following is None else self.__following[0])
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SortedJoinSet(object):
+    """
+    classdocs
+    """
+
+    def __init__(self, set_path, pk_path, pk_is_iso8601, documents):
+        """
+        Constructor
+        """
+        self.__set_path = set_path
+        self.__pk_path = pk_path
+        self.__pk_is_iso8601 = pk_is_iso8601
+
+        self.__documents = documents            # iterable of PathDict, in primary key order
+        self.__count = 0                        # int - distinct primary key values read
+
+
+    def __len__(self):
+        return self.__count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def entries(self):
+        # (pk value, document) for each distinct pk value - as JoinSet, the first pk value with the last document...
+        entry = None
+
+        for document in self.__documents:
+            pk_value = self.pk_value(document)
+
+            if entry is not None:
+                if pk_value < entry[0]:
+                    raise ValueError("pk '%s' out of order in: %s" %
+                                     (document.node(self.pk_path), JSONCodec.dumps(document.node())))
+
+                if pk_value == entry[0]:
+                    entry = (entry[0], document)
+                    continue
+
+                yield entry
+
+            entry = (pk_value, document)
+            self.__count += 1
+
+        if entry is not None:
+            yield entry
+
+
+    def pk_value(self, document: PathDict):
+        pk_value = document.node(self.pk_path)
+
+        if self.pk_is_iso8601:
+            datetime = LocalizedDatetime.construct_from_iso8601(pk_value)
+
+            if datetime is None:
+                raise ValueError("invalid pk '%s' in: %s" % (pk_value, JSONCodec.dumps(document.node())))
+
+            pk_value = datetime
+
+        return pk_value
+
+
+    def node(self, document: PathDict):
+        # as JoinSet.retrieve(..)...
+        node = PathDict()
+
+        for path in document.paths():
+            if path != self.pk_path:
+                node.append(path, document.node(path))
+
+        return node
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def set_path(self):
+        return self.__set_path
+
+
+    @property
+    def pk_path(self):
+        return self.__pk_path
+
+
+    @property
+    def pk_is_iso8601(self):
+        return self.__pk_is_iso8601
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SortedJoinSet:{set_path:%s, pk_path:%s, pk_is_iso8601:%s, len:%d}" % \
+               (self.set_path, self.pk_path, self.pk_is_iso8601, len(self))
@@ -0,0 +1,233 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+The filter engine for sample_multi_filter - median, average, low-pass and error filters, run together over one parse
+of each document.
+
+A FilterSpec names a node, and the filters to run on each of its numeric leaves, as PATH=FILTER[,FILTER..]. The
+filters are:
+
+med:WINDOW                  rolling median over an odd WINDOW of samples, as sample_median
+avg:TALLY                   rolling average over TALLY samples, as sample_average
+lpf:DELTA_T:CUT_OFF         low pass filter, as sample_low_pass
+err                         exponential average and error, as sample_error - reported as agr and err
+
+An empty PATH stands for all the numeric leaves of the document. Each leaf gets a FilterBank holding its own state for
+each filter, so each output is the same as that of the corresponding single-filter utility.
+"""
+
+from scs_analysis.helper.batch_filter import ErrorRecurrence
+from scs_analysis.helper.rolling_filter import RollingFilter
+from scs_analysis.helper.rolling_median import RollingMedian
+from scs_analysis.helper.running_sums import RunningAverage
+
+from scs_core.data.low_pass_filter import LowPassFilter
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class FilterSpec(object):
+    """
+    classdocs
+    """
+
+    PARAMS = {'med': 1, 'avg': 1, 'lpf': 2, 'err': 0}      # dict of filter name: parameter count
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_arg(cls, arg):
+        path, separator, filters = arg.partition('=')
+
+        if not separator or not filters:
+            return None
+
+        specs = []
+
+        for spec in filters.split(','):
+            name, *params = spec.split(':')
+
+            if name not in cls.PARAMS or len(params) != cls.PARAMS[name]:
+                return None
+
+            if name in (filter_name for filter_name, _ in specs):
+                return None
+
+            try:
+                params = [float(param) for param in params]
+            except ValueError:
+                return None
+
+            if any(param <= 0 for param in params):
+                return None
+
+            if name in ('med', 'avg'):
+                if not params[0].is_integer():
+                    return None
+
+                params = [int(params[0])]
+
+            if name == 'med' and params[0] % 2 == 0:
+                return None
+
+            specs.append((name, tuple(params)))
+
+        return cls(path if path else None, specs)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path, filters):
+        """
+        Constructor
+        """
+        self.__path = path                                  # string (or None for the whole document)
+        self.__filters = filters                            # array of (name, params)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def bank(self):
+        return FilterBank(self.__filters)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    @property
+    def filters(self):
+        return self.__filters
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "FilterSpec:{path:%s, filters:%s}" % (self.path, self.filters)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class FilterBank(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __construct(name, params):
+        if name == 'med':
+            return RollingMedian.construct(*params)
+
+        if name == 'avg':
+            return RunningAverage(*params)
+
+        if name == 'lpf':
+            return LowPassFilter.construct(*params)
+
+        return ErrorRecurrence()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filters):
+        """
+        Constructor
+        """
+        self.__filters = [(name, self.__construct(name, params))
+                          for name, params in filters]      # array of (name, filter state)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def fields(self, value):
+        # (field, value) for each output of each filter, in spec order...
+        fields = []
+
+        for name, state in self.__filters:
+            if name == 'med':
+                fields.append(('med', state.compute(value)))
+
+            elif name == 'avg':
+                state.append(value)
+                fields.append(('avg', state.compute()))
+
+            elif name == 'lpf':
+                fields.append(('lpf', state.line(value)))
+
+            else:
+                latest = float(value)
+                aggregate = state.compute(latest)
+
+                if aggregate is not None:
+                    fields.append(('agr', aggregate))
+                    fields.append(('err', latest - aggregate))
+
+        return fields
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "FilterBank:{%s}" % ', '.join(name + ': ' + str(state) for name, state in self.__filters)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MultiFilter(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, specs, precision):
+        """
+        Constructor
+        """
+        self.__precision = precision                        # int
+
+        self.__filters = [RollingFilter([spec.path], lambda path, spec=spec: spec.bank())
+                          for spec in specs]                # array of RollingFilter
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def datum(self, sample: PathDict):
+        outputs = []
+
+        for leaves in self.__filters:
+            for path, value, bank in leaves.values(sample):
+                outputs.append((path, value, bank.fields(value)))
+
+        if not outputs:
+            return None
+
+        target = PathDict()
+
+        if sample.has_path('rec'):
+            target.copy(sample, 'rec')
+
+        for path, value, fields in outputs:
+            target.append(path + '.src', value)
+
+            for field, field_value in fields:
+                target.append(path + '.' + field, round(field_value, self.__precision))
+
+        return target.node()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "MultiFilter:{precision:%s, filters:[%s]}" % \
+               (self.__precision, ', '.join(str(leaves) for leaves in self.__filters))
@@ -0,0 +1,107 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A generalisation of scs_core's Join to any number of sets, for the default mode of csv_join.
+
+The first set is the left-hand set, and each of the others is a right-hand set. Each set is held in a JoinSet, so
+primary keys are normalised and duplicates are resolved exactly as by Join:
+
+* INNER joins report the primary keys of the left-hand set that are found in every right-hand set
+* LEFT joins report every primary key of the left-hand set
+* RIGHT joins report every primary key of the last set
+* FULL joins report every primary key of any set, as given by the first right-hand set in which it is present, or
+otherwise by the left-hand set
+
+With one right-hand set, the output is the same as that of Join.
+"""
+
+from scs_core.data.join import JoinSet
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MultiJoin(object):
+    """
+    classdocs
+    """
+
+    @classmethod
+    def construct(cls, set_paths, pk_paths, pk_is_iso8601):
+        sets = [JoinSet(set_path, pk_path, pk_is_iso8601) for set_path, pk_path in zip(set_paths, pk_paths)]
+
+        return MultiJoin(sets)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, sets):
+        """
+        Constructor
+        """
+        self.__sets = sets                      # array of JoinSet - the left-hand set, then the right-hand sets
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, index, document: PathDict):
+        self.__sets[index].append(document)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def inner(self):
+        left = self.__sets[0]
+
+        for pk in left.pk_values():
+            nodes = self.__nodes(pk)
+
+            if any(node is None for node in nodes[1:]):
+                continue
+
+            yield self.__union(left.pk_path, pk, nodes)
+
+
+    def left(self):
+        left = self.__sets[0]
+
+        for pk in left.pk_values():
+            yield self.__union(left.pk_path, pk, self.__nodes(pk))
+
+
+    def right(self):
+        right = self.__sets[-1]
+
+        for pk in right.pk_values():
+            yield self.__union(right.pk_path, pk, self.__nodes(pk))
+
+
+    def full(self):
+        # keys - where sets share a pk value, the set update keeps the first...
+        pk_values = set()
+
+        for join_set in self.__sets[1:] + self.__sets[:1]:
+            pk_values.update(join_set.pk_values())
+
+        for pk in sorted(pk_values):
+            yield self.__union(self.__sets[0].pk_path, pk, self.__nodes(pk))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __nodes(self, pk):
+        return [join_set.retrieve(pk) for join_set in self.__sets]
+
+
+    def __union(self, pk_path, pk, nodes):
+        return PathDict.union((pk_path, pk), *zip((join_set.set_path for join_set in self.__sets), nodes))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "MultiJoin:{sets:[%s]}" % ', '.join(str(join_set) for join_set in self.__sets)
@@ -0,0 +1,167 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+Searches for the (t, rH) offset pair with the lowest error standard deviation.
+
+Three strategies are provided:
+
+grid - every offset pair in the given bounds is evaluated at the given step
+refine - a coarse grid, followed by successively finer grids around the minimum, down to a step of 1
+golden - a golden-section search along a single axis, with the other axis fixed
+
+The objective function is called as func(t_offset, rh_offset), and should return a stdev, or None if the stdev cannot
+be computed. Results are cached, so no offset pair is evaluated more than once.
+
+https://en.wikipedia.org/wiki/Golden-section_search
+"""
+
+from collections import OrderedDict
+from math import sqrt
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OffsetSearch(object):
+    """
+    classdocs
+    """
+
+    INVERSE_PHI = (sqrt(5) - 1) / 2
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, func):
+        """
+        Constructor
+        """
+        self.__func = func                                  # callable: (t_offset, rh_offset) -> stdev or None
+        self.__stdevs = OrderedDict()                       # dict of (t_offset, rh_offset): stdev
+
+
+    def __len__(self):
+        return len(self.__stdevs)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def grid(self, t_start, t_end, rh_start, rh_end, step):
+        for t_offset in self.__ticks(t_start, t_end, step):
+            for rh_offset in self.__ticks(rh_start, rh_end, step):
+                self.stdev(t_offset, rh_offset)
+
+        return self.optimum(t_start, t_end, rh_start, rh_end)
+
+
+    def refine(self, t_start, t_end, rh_start, rh_end, step):
+        t_offset, rh_offset = self.grid(t_start, t_end, rh_start, rh_end, step)
+
+        while step > 1:
+            if t_offset is None:
+                break
+
+            # window of the previous step around the minimum...
+            t_lower, t_upper = max(t_start, t_offset - step), min(t_end, t_offset + step)
+            rh_lower, rh_upper = max(rh_start, rh_offset - step), min(rh_end, rh_offset + step)
+
+            step = max(1, step // 2)
+
+            t_offset, rh_offset = self.grid(t_lower, t_upper, rh_lower, rh_upper, step)
+
+        return t_offset, rh_offset
+
+
+    def golden(self, t_start, t_end, rh_start, rh_end):
+        if t_start == t_end:
+            rh_offset = self.__golden(lambda offset: self.__objective(t_start, offset), rh_start, rh_end)
+            return t_start, rh_offset
+
+        if rh_start == rh_end:
+            t_offset = self.__golden(lambda offset: self.__objective(offset, rh_start), t_start, t_end)
+            return t_offset, rh_start
+
+        raise ValueError("golden-section search requires a single axis")
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def stdev(self, t_offset, rh_offset):
+        key = (t_offset, rh_offset)
+
+        if key not in self.__stdevs:
+            self.__stdevs[key] = self.__func(t_offset, rh_offset)
+
+        return self.__stdevs[key]
+
+
+    def optimum(self, t_start=None, t_end=None, rh_start=None, rh_end=None):
+        optimum = None
+        minimum = None
+
+        for (t_offset, rh_offset), stdev in self.__stdevs.items():
+            if stdev is None:
+                continue
+
+            if t_start is not None and not t_start <= t_offset <= t_end:
+                continue
+
+            if rh_start is not None and not rh_start <= rh_offset <= rh_end:
+                continue
+
+            if minimum is None or stdev < minimum:
+                optimum = (t_offset, rh_offset)
+                minimum = stdev
+
+        return (None, None) if optimum is None else optimum
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __golden(self, objective, lower, upper):
+        # integer golden-section search, assuming a unimodal objective...
+        c = upper - round((upper - lower) * self.INVERSE_PHI)
+        d = lower + round((upper - lower) * self.INVERSE_PHI)
+
+        while upper - lower > 3:
+            if objective(c) < objective(d):
+                upper = d
+            else:
+                lower = c
+
+            c = upper - round((upper - lower) * self.INVERSE_PHI)
+            d = lower + round((upper - lower) * self.INVERSE_PHI)
+
+        # exhaustive over the residual bracket...
+        return min(range(lower, upper + 1), key=objective)
+
+
+    def __objective(self, t_offset, rh_offset):
+        stdev = self.stdev(t_offset, rh_offset)
+
+        return float('inf') if stdev is None else stdev
+
+
+    @staticmethod
+    def __ticks(start, end, step):
+        ticks = list(range(start, end + 1, step))
+
+        if ticks[-1] != end:
+            ticks.append(end)                               # always include the upper bound
+
+        return ticks
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def stdevs(self):
+        return self.__stdevs
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "OffsetSearch:{evaluated:%d, optimum:%s}" % (len(self), self.optimum())
@@ -0,0 +1,151 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A line-oriented writer for the stdout of the stream utilities.
+
+In live mode, every line is flushed as it is written. Live mode is used if requested - as it is by the MQTT and
+socket receivers - or if the stream is interactive.
+
+In batch mode, lines are held until flush_bytes have accumulated, and are then written and flushed together. A
+daemon thread flushes any held lines once flush_interval seconds have elapsed, so the latency of a slow stream is
+bounded even when the utility sits in a live pipeline. Held lines are flushed when the stream is closed, or when the
+interpreter exits.
+"""
+
+import atexit
+import sys
+
+from threading import Event, Lock, Thread
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OutputStream(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_FLUSH_BYTES =       65536
+    DEFAULT_FLUSH_INTERVAL =    0.5                         # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, file=None, live=False, flush_bytes=DEFAULT_FLUSH_BYTES, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        file = sys.stdout if file is None else file
+
+        try:
+            interactive = file.isatty()
+        except (AttributeError, ValueError):
+            interactive = False
+
+        return cls(file, live or interactive, flush_bytes, flush_interval)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, file, live, flush_bytes, flush_interval):
+        """
+        Constructor
+        """
+        self.__file = file                                  # text stream
+        self.__live = live                                  # bool
+        self.__flush_bytes = flush_bytes                    # int
+        self.__flush_interval = flush_interval              # float (seconds)
+
+        self.__lines = []                                   # array of string
+        self.__size = 0                                     # int
+        self.__error = None                                 # exception raised by a timed flush
+
+        self.__lock = Lock()
+        self.__closed = Event()
+
+        if not self.__live:
+            Thread(target=self.__run, daemon=True).start()
+
+        atexit.register(self.close)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print(self, text, end='\n'):
+        if self.__live:
+            self.__file.write(text + end)
+            self.__file.flush()
+            return
+
+        with self.__lock:
+            if self.__error is not None:
+                raise self.__error
+
+            line = text + end
+
+            self.__lines.append(line)
+            self.__size += len(line)
+
+            if self.__size >= self.__flush_bytes:
+                self.__flush()
+
+
+    def flush(self):
+        with self.__lock:
+            if self.__error is not None:
+                raise self.__error
+
+            self.__flush()
+
+
+    def close(self):
+        if self.__closed.is_set():
+            return
+
+        self.__closed.set()
+
+        try:
+            self.flush()
+
+        except BrokenPipeError:
+            pass                                            # the reader has gone - there is no one to tell
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __flush(self):
+        if self.__lines:
+            self.__file.write(''.join(self.__lines))
+
+            self.__lines = []
+            self.__size = 0
+
+        self.__file.flush()
+
+
+    def __run(self):
+        while not self.__closed.wait(self.__flush_interval):
+            with self.__lock:
+                if not self.__lines or self.__error is not None:
+                    continue
+
+                try:
+                    self.__flush()
+
+                except OSError as ex:
+                    self.__error = ex                       # raised by the next print(..) or flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def live(self):
+        return self.__live
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "OutputStream:{live:%s, flush_bytes:%s, flush_interval:%s, held:%s}" % \
+               (self.__live, self.__flush_bytes, self.__flush_interval, len(self.__lines))
@@ -0,0 +1,136 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+An order-preserving parallel map, for the --workers mode of the stateless per-document utilities - sample_ah,
+sample_ah_correction, sample_concentration, sample_iso_8601, sample_timezone and sample_wec_sens.
+
+Each of these utilities transforms each line of input independently of every other, with a processor function that
+returns (is document, output JSON or None). With one worker, the function is applied to each line as it arrives, so
+live streams are handled as before. With more, lines are read in chunks, and the chunks are processed by a
+multiprocessing pool of ParallelMapWorkers. Results are returned in input order, and the number of chunks in flight is
+bounded, so that memory use does not depend on the length of the input.
+
+An exception raised by the function is returned with the results for the lines that came before it, and is raised
+again by ParallelMap.map(..) once those results have been returned, as it would have been by a single process.
+"""
+
+from collections import deque
+from multiprocessing import Pool
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ParallelMap(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_CHUNK_SIZE = 1000                               # lines
+    CHUNKS_PER_WORKER = 2                                   # chunks in flight, for each worker
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, workers, func, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Constructor
+        """
+        self.__workers = workers                            # int
+        self.__func = func                                  # function line -> result
+        self.__chunk_size = chunk_size                      # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def map(self, lines):
+        # single process...
+        if self.__workers < 2:
+            for line in lines:
+                yield self.__func(line)
+
+            return
+
+        # pool...
+        with Pool(self.__workers, ParallelMapWorker.initialise, (self.__func, )) as pool:
+            pending = deque()
+
+            for chunk in self.__chunks(lines):
+                pending.append(pool.apply_async(ParallelMapWorker.process, (chunk, )))
+
+                if len(pending) > self.__workers * self.CHUNKS_PER_WORKER:
+                    yield from self.__results(pending.popleft())
+
+            while pending:
+                yield from self.__results(pending.popleft())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __chunks(self, lines):
+        chunk = []
+
+        for line in lines:
+            chunk.append(line)
+
+            if len(chunk) == self.__chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+
+    @staticmethod
+    def __results(async_result):
+        results, ex = async_result.get()
+
+        yield from results
+
+        if ex is not None:
+            raise ex
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def workers(self):
+        return self.__workers
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ParallelMap:{workers:%s, chunk_size:%s}" % (self.__workers, self.__chunk_size)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ParallelMapWorker(object):
+    """
+    classdocs
+    """
+
+    __func = None                                           # function line -> result, for this process
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def initialise(cls, func):
+        cls.__func = func
+
+
+    @classmethod
+    def process(cls, lines):
+        results = []
+
+        for line in lines:
+            try:
+                results.append(cls.__func(line))
+
+            except Exception as ex:
+                return results, ex
+
+        return results, None
@@ -0,0 +1,505 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+In-process equivalents of the stream utilities, for use by scs_pipeline.
+
+Each stage is constructed from the command-line arguments of its utility, and transforms an iterable of PathDict
+documents into a generator of PathDict documents. Documents are therefore parsed and serialised only at the ends of
+the chain, rather than at every pipe.
+
+A chain specification has the same form as a shell pipeline, for example:
+"csv_reader.py climate.csv | node_shift.py -o 2 val.hmd val.hmd_s2 | sample_aggregate.py -c **:/15:00"
+"""
+
+import os
+import shlex
+import sys
+
+from abc import ABC, abstractmethod
+
+from scs_analysis.cmd.cmd_csv_reader import CmdCSVReader
+from scs_analysis.cmd.cmd_csv_writer import CmdCSVWriter
+from scs_analysis.cmd.cmd_node import CmdNode
+from scs_analysis.cmd.cmd_node_shift import CmdNodeShift
+from scs_analysis.cmd.cmd_sample_aggregate import CmdSampleAggregate
+
+from scs_analysis.helper.checkpoint_index import FastISO8601
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.sample_aggregate import BatchAggregate, MultiResolutionAggregate
+
+from scs_core.csv.csv_reader import CSVReader
+from scs_core.csv.csv_writer import CSVWriter
+
+from scs_core.data.checkpoint_generator import CheckpointGenerator
+from scs_core.data.node_shifter import NodeShifter
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Pipeline(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def stage_classes():
+        return {
+            'csv_reader': CSVReaderStage,
+            'csv_writer': CSVWriterStage,
+            'node': NodeStage,
+            'node_shift': NodeShiftStage,
+            'sample_aggregate': SampleAggregateStage
+        }
+
+
+    @classmethod
+    def construct(cls, specification):
+        lexer = shlex.shlex(specification, posix=True, punctuation_chars='|')
+        lexer.whitespace_split = True
+
+        # commands...
+        commands = [[]]
+
+        for token in lexer:
+            if token == '|':
+                commands.append([])
+            else:
+                commands[-1].append(token)
+
+        # stages...
+        stage_classes = cls.stage_classes()
+        stages = []
+
+        for command in commands:
+            if len(command) == 0:
+                raise ValueError("empty stage in: %s" % specification)
+
+            name = os.path.basename(command[0])
+            name = name[:-3] if name.endswith('.py') else name
+
+            if name not in stage_classes:
+                raise ValueError("unsupported utility: %s" % command[0])
+
+            stages.append(stage_classes[name].construct(command[1:]))
+
+        return cls(stages)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, stages):
+        """
+        Constructor
+        """
+        self.__stages = stages                              # array of PipelineStage
+
+
+    def __len__(self):
+        return len(self.__stages)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def documents(self, lines):
+        documents = None if self.__stages[0].is_source() else self.__parse(lines)
+
+        for stage in self.__stages:
+            documents = stage.documents(documents)
+
+        return documents
+
+
+    def writes_stdout(self):
+        return any(stage.writes_stdout() for stage in self.__stages)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __parse(lines):
+        for line in lines:
+            datum = JSONCodec.path_dict(line)
+
+            if datum is None:
+                continue
+
+            yield datum
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def stages(self):
+        return self.__stages
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Pipeline:{stages:[%s]}" % ', '.join(str(stage) for stage in self.__stages)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PipelineStage(ABC):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    @abstractmethod
+    def construct(cls, args):
+        pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def documents(self, source):
+        pass
+
+
+    def is_source(self):
+        return False
+
+
+    def writes_stdout(self):
+        return False
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVReaderStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, args):
+        cmd = CmdCSVReader(args)
+
+        if cmd.array:
+            raise ValueError("csv_reader: --array is not supported in a pipeline")
+
+        return cls(cmd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cmd):
+        """
+        Constructor
+        """
+        self.__cmd = cmd                                    # CmdCSVReader
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def documents(self, _):
+        count = 0
+
+        for filename in self.__cmd.filenames:
+            try:
+                reader = CSVReader(filename=filename, cast=self.__cmd.cast)
+            except FileNotFoundError:
+                raise ValueError("csv_reader: file not found: %s" % filename)
+
+            try:
+                for jstr in reader.rows:
+                    if self.__cmd.limit is not None and count >= self.__cmd.limit:
+                        break
+
+                    yield JSONCodec.path_dict(jstr)
+
+                    count += 1
+
+            finally:
+                reader.close()
+
+
+    def is_source(self):
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVReaderStage:{cmd:%s}" % self.__cmd
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NodeStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, args):
+        cmd = CmdNode(args)
+
+        if not cmd.is_valid():
+            raise ValueError("node: invalid arguments: %s" % ' '.join(args))
+
+        if cmd.array or cmd.sequence:
+            raise ValueError("node: --array and --sequence are not supported in a pipeline")
+
+        return cls(cmd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cmd):
+        """
+        Constructor
+        """
+        self.__cmd = cmd                                    # CmdNode
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def documents(self, source):
+        for datum in source:
+            if self.__cmd.exclude and not self.__cmd.sub_paths:
+                continue                                    # everything is excluded
+
+            # build...
+            if not self.__cmd.sub_paths:
+                target = datum
+
+            else:
+                target = PathDict()
+
+                for path in datum.paths():
+                    if self.__cmd.includes(path):
+                        target.append(path, datum.node(path))
+
+            # report...
+            if not target:
+                continue                                    # skip empty outputs
+
+            yield target
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NodeStage:{cmd:%s}" % self.__cmd
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NodeShiftStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, args):
+        cmd = CmdNodeShift(args)
+
+        if not cmd.is_valid():
+            raise ValueError("node_shift: invalid arguments: %s" % ' '.join(args))
+
+        return cls(cmd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cmd):
+        """
+        Constructor
+        """
+        self.__cmd = cmd                                    # CmdNodeShift
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def documents(self, source):
+        shifter = NodeShifter(self.__cmd.offset, self.__cmd.fill, self.__cmd.source_path, self.__cmd.target_path)
+
+        for datum in source:
+            if not datum.has_sub_path(self.__cmd.source_path):
+                raise ValueError("node_shift: source path '%s' not in %s" %
+                                 (self.__cmd.source_path, JSONCodec.dumps(datum)))
+
+            try:
+                target = shifter.shift(datum)
+
+            except TypeError:
+                raise ValueError("node_shift: incompatible types for '%s' and '%s'" %
+                                 (self.__cmd.source_path, self.__cmd.target_path))
+
+            if target is None:
+                continue
+
+            yield target
+
+        # residual...
+        while True:
+            target = shifter.pop()
+
+            if target is None:
+                break
+
+            yield target
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NodeShiftStage:{cmd:%s}" % self.__cmd
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleAggregateStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, args):
+        cmd = CmdSampleAggregate(args)
+
+        if not cmd.is_valid():
+            raise ValueError("sample_aggregate: invalid arguments: %s" % ' '.join(args))
+
+        for checkpoint in cmd.checkpoints:
+            if not CheckpointGenerator.is_valid(checkpoint):
+                raise ValueError("sample_aggregate: the checkpoint specification %s is invalid." % checkpoint)
+
+        if cmd.file_prefix is not None:
+            raise ValueError("sample_aggregate: --output-prefix is not supported in a pipeline")
+
+        if cmd.state is not None:
+            raise ValueError("sample_aggregate: --state is not supported in a pipeline")
+
+        if cmd.batch and not BatchAggregate.is_available():
+            raise ValueError("sample_aggregate: --batch requires numpy")
+
+        return cls(cmd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cmd):
+        """
+        Constructor
+        """
+        self.__cmd = cmd                                    # CmdSampleAggregate
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def documents(self, source):
+        lateness = None if self.__cmd.lateness is None else self.__cmd.lateness.total_seconds()
+
+        stream = MultiResolutionAggregate.construct(self.__cmd.checkpoints, self.__cmd.group_by,
+                                                    self.__cmd.min_max, self.__cmd.iso, self.__cmd.nodes,
+                                                    self.__cmd.fill, self.__cmd.batch, lateness,
+                                                    statistics=self.__cmd.statistics)
+
+        tagged = len(stream) > 1
+
+        for datum in source:
+            try:
+                rec_node = datum.node(self.__cmd.iso)
+            except KeyError:
+                continue
+
+            rec = FastISO8601.construct(rec_node)
+
+            if rec is None:
+                continue
+
+            for checkpoint, report in stream.append(rec, datum):
+                yield stream.tagged(checkpoint, report) if tagged else report
+
+        for checkpoint, report in stream.close():
+            yield stream.tagged(checkpoint, report) if tagged else report
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleAggregateStage:{cmd:%s}" % self.__cmd
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVWriterStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, args):
+        cmd = CmdCSVWriter(args)
+
+        if not cmd.is_valid():
+            raise ValueError("csv_writer: invalid arguments: %s" % ' '.join(args))
+
+        return cls(cmd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cmd):
+        """
+        Constructor
+        """
+        self.__cmd = cmd                                    # CmdCSVWriter
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def documents(self, source):
+        writer = CSVWriter(filename=self.__cmd.filename, append=self.__cmd.append,
+                           exclude_header=self.__cmd.exclude_header)
+
+        try:
+            for datum in source:
+                writer.write(JSONCodec.dumps(datum))
+
+                if self.__cmd.filename is None:
+                    sys.stdout.flush()
+
+                # echo...
+                if self.__cmd.echo:
+                    yield datum
+
+        finally:
+            writer.close()
+
+            if self.__cmd.filename is None:
+                sys.stdout.flush()
+
+
+    def writes_stdout(self):
+        return self.__cmd.filename is None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVWriterStage:{cmd:%s}" % self.__cmd
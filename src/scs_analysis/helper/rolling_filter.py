@@ -0,0 +1,105 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+Multi-path support for the rolling filter utilities - sample_average, sample_low_pass, sample_median, sample_midpoint
+and sample_regression.
+
+A RollingFilter is given any number of nodes. A leaf node is filtered as it stands, an internal node stands for all of
+its numeric leaves, and no node at all stands for every numeric leaf of the document, except rec. Each leaf path gets
+its own filter state, constructed on first sight of the path, so that one pass over the stream serves every path.
+
+As for sample_aggregate, the leaf paths of a document are cached against the shape of the document, so they are only
+resolved again when the keys of the input change. An IndexError is raised for a node whose array index is out of range.
+"""
+
+from collections import OrderedDict
+
+from scs_analysis.helper.leaf_paths import LeafPaths
+
+from scs_core.data.datum import Datum
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RollingFilter(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, nodes, construct):
+        """
+        Constructor
+        """
+        self.__nodes = nodes                                # array of string (or None for the whole document)
+        self.__construct = construct                        # function path -> filter state
+
+        self.__filters = OrderedDict()                      # dict of path: filter state
+        self.__shapes = {}                                  # dict of shape: array of path
+
+
+    def __len__(self):
+        return len(self.__filters)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def values(self, sample: PathDict):
+        # (path, value, filter state) for each numeric leaf of the sample, in document order...
+        for path in self.leaf_paths(sample):
+            value = sample.node(path)
+
+            if value is None or not Datum.is_numeric(value):
+                continue
+
+            try:
+                func = self.__filters[path]
+
+            except KeyError:
+                func = self.__filters[path] = self.__construct(path)
+
+            yield path, value, func
+
+
+    def leaf_paths(self, sample: PathDict):
+        shape = LeafPaths.shape(sample.node())
+
+        try:
+            return self.__shapes[shape]
+
+        except KeyError:
+            pass
+
+        paths = list(LeafPaths.find(self.__nodes, sample).keys())
+
+        if len(self.__shapes) >= LeafPaths.MAX_SHAPES:
+            self.__shapes.clear()
+
+        self.__shapes[shape] = paths
+
+        return paths
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def nodes(self):
+        return self.__nodes
+
+
+    @property
+    def paths(self):
+        return list(self.__filters.keys())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RollingFilter:{nodes:%s, filters:{%s}}" % \
+               (self.__nodes, ', '.join(path + ': ' + str(func) for path, func in self.__filters.items()))
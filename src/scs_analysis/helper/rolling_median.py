@@ -0,0 +1,91 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A rolling median for wide windows, as a drop-in replacement for scs_core's MedianFilter.
+
+MedianFilter sorts its whole window for every sample. RollingMedian holds the window both in arrival order and in
+sorted order: each sample is placed with a binary search, and the departing sample is found with another, so there is
+no sort. New values are inserted to the right of any equal values, and the departing value - the oldest of its equals -
+is removed from the left, so the sorted window is exactly that given by sorted(..), and the output is identical.
+
+RollingMedian.construct(..) selects MedianFilter for narrow windows, where sorting a handful of values is as quick.
+"""
+
+from bisect import bisect_left, insort_right
+from collections import deque
+
+from scs_core.data.median_filter import MedianFilter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RollingMedian(object):
+    """
+    classdocs
+    """
+
+    THRESHOLD = 5                                           # smallest window given a RollingMedian
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, window_size):
+        if window_size < cls.THRESHOLD:
+            return MedianFilter(window_size)
+
+        return cls(window_size)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, window_size):
+        """
+        Constructor
+        """
+        if window_size % 2 == 0:
+            raise ValueError("window_size must be an odd number")
+
+        self.__window_size = window_size                    # int
+        self.__window_midpoint = window_size // 2           # int
+
+        self.__arrivals = deque()                           # deque of number, in arrival order
+        self.__sorted = []                                  # array of number, in ascending order
+
+
+    def __len__(self):
+        return len(self.__arrivals)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def compute(self, x):
+        self.__arrivals.append(x)
+        insort_right(self.__sorted, x)
+
+        # window is not full - as MedianFilter, the first window_size values are passed through...
+        if len(self.__arrivals) <= self.__window_size:
+            return x
+
+        # window is full...
+        departing = self.__arrivals.popleft()
+        del self.__sorted[bisect_left(self.__sorted, departing)]
+
+        return self.__sorted[self.__window_midpoint]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def window_size(self):
+        return self.__window_size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RollingMedian:{window_size:%s, window_midpoint:%s, count:%s}" % \
+               (self.__window_size, self.__window_midpoint, len(self))
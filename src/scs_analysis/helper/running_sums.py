@@ -0,0 +1,306 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+Constant-time rolling average and linear regression, for sample_average, sample_midpoint and sample_regression.
+
+scs_core's Average and LinearRegression hold their tally of samples, and scan the whole tally for every report.
+RunningAverage and RunningRegression hold running sums - Σy, or Σx, Σy, Σx² and Σxy - which are updated as samples
+arrive and depart, so that the cost of a sample does not depend on the size of the tally.
+
+The window is bounded by a tally of samples, or by a duration in seconds, or by both. A duration window holds the
+samples whose timestamps fall in the DURATION up to and including that of the latest sample, evicting from the oldest
+end, so samples must arrive in timestamp order.
+
+Subtracting departing samples lets floating-point error accumulate, so, after as many departures as there are samples
+held, the sums are recomputed from the samples held. This costs one scan per window of samples - still constant time
+per sample. For the regression, x values are held relative to an origin that is moved to the oldest sample at each
+recomputation, so that Σx² does not grow with the length of the stream, and the slope does not lose precision to
+cancellation.
+"""
+
+from collections import deque
+from datetime import datetime
+
+from scs_core.data.localized_datetime import LocalizedDatetime
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RunningAverage(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tally=None, duration=None):
+        """
+        Constructor
+        """
+        self.__tally = tally                                # int (None for all samples)
+        self.__duration = duration                          # float seconds (None for all samples)
+
+        self.__values = deque()                             # deque of number
+        self.__timestamps = deque()                         # deque of float (duration windows only)
+        self.__sum = 0                                      # number - int, as long as the values are
+        self.__departures = 0                               # int - since the sum was recomputed
+
+
+    def __len__(self):
+        return len(self.__values)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, value, timestamp=None):
+        self.__values.append(value)
+        self.__sum += value
+
+        if self.__duration is not None:
+            self.__timestamps.append(timestamp)
+
+        # remove oldest...
+        while self.__is_full(timestamp):
+            self.__sum -= self.__values.popleft()
+            self.__departures += 1
+
+            if self.__duration is not None:
+                self.__timestamps.popleft()
+
+        if self.__departures >= len(self.__values):
+            self.__recompute()
+
+
+    def reset(self):
+        self.__values.clear()
+        self.__timestamps.clear()
+        self.__sum = 0
+        self.__departures = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def compute(self):
+        count = len(self.__values)
+
+        if count == 0:
+            return None
+
+        return self.__sum / count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __is_full(self, timestamp):
+        if self.__tally is not None and len(self.__values) > self.__tally:
+            return True
+
+        return self.__duration is not None and self.__timestamps[0] <= timestamp - self.__duration
+
+
+    def __recompute(self):
+        self.__sum = sum(self.__values)
+        self.__departures = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RunningAverage:{tally:%s, duration:%s, items:%s}" % (self.__tally, self.__duration, len(self))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RunningRegression(object):
+    """
+    classdocs
+    """
+
+    MIN_DATA_POINTS = 2
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tally=None, time_relative=True, duration=None):
+        """
+        Constructor
+        """
+        self.__tally = tally                                # int (None for all samples)
+        self.__duration = duration                          # float seconds (None for all samples)
+        self.__time_relative = time_relative                # bool - set first timestamp to time zero
+
+        self.__start_timestamp = None                       # float
+        self.__tzinfo = None                                # tzinfo
+
+        self.__data = deque()                               # deque of (x, y)
+        self.__lows = deque()                               # deque of x - candidates for the minimum x
+        self.__highs = deque()                              # deque of x - candidates for the maximum x
+
+        self.__origin = None                                # float - sums are of x - origin
+        self.__sum_x = 0.0
+        self.__sum_y = 0.0
+        self.__sum_x2 = 0.0
+        self.__sum_xy = 0.0
+
+        self.__departures = 0                               # int - since the sums were recomputed
+
+
+    def __len__(self):
+        return len(self.__data)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def has_midpoint(self):
+        return len(self) > 0
+
+
+    def has_regression(self):
+        return len(self) >= self.MIN_DATA_POINTS
+
+
+    def append(self, rec: LocalizedDatetime, value):
+        if len(self) == 0:
+            self.__start_timestamp = rec.timestamp()
+
+        x = rec.timestamp() - self.__start_timestamp if self.__time_relative else rec.timestamp()
+
+        if self.__origin is None:
+            self.__origin = x
+
+        # append...
+        self.__data.append((x, value))
+        self.__add(x - self.__origin, value, 1)
+
+        while self.__lows and self.__lows[-1] > x:
+            self.__lows.pop()
+
+        self.__lows.append(x)
+
+        while self.__highs and self.__highs[-1] < x:
+            self.__highs.pop()
+
+        self.__highs.append(x)
+
+        self.__tzinfo = rec.tzinfo
+
+        # remove oldest...
+        while self.__is_full(x):
+            old_x, old_y = self.__data.popleft()
+            self.__add(old_x - self.__origin, old_y, -1)
+
+            # equal x values are all held, so the departing sample is at the head, if it is a candidate...
+            if self.__lows[0] == old_x:
+                self.__lows.popleft()
+
+            if self.__highs[0] == old_x:
+                self.__highs.popleft()
+
+            self.__departures += 1
+
+        if self.__departures >= len(self.__data):
+            self.__recompute()
+
+
+    def reset(self):
+        self.__start_timestamp = None
+        self.__tzinfo = None
+
+        self.__data.clear()
+        self.__lows.clear()
+        self.__highs.clear()
+
+        self.__origin = None
+        self.__recompute()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def line(self):
+        slope, intercept = self.__centred_line()
+
+        if slope is None:
+            return None, None
+
+        return slope, intercept - slope * self.__origin
+
+
+    def midpoint(self, ndigits=None):
+        # validate...
+        if not self.has_midpoint():
+            return None, None
+
+        # single value...
+        if len(self) == 1:
+            timestamp, value = self.__data[0]
+            return self.__localised_datetime(timestamp), float(value)
+
+        # multiple values...
+        slope, intercept = self.__centred_line()
+
+        mid_x = (self.__lows[0] + self.__highs[0]) / 2
+        value = slope * (mid_x - self.__origin) + intercept
+
+        return self.__localised_datetime(mid_x), value if ndigits is None else round(value, ndigits)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __centred_line(self):
+        # validate...
+        if not self.has_regression():
+            return None, None
+
+        n = len(self)
+
+        d_x = (self.__sum_x2 * n) - (self.__sum_x * self.__sum_x)
+        d_y = (self.__sum_xy * n) - (self.__sum_x * self.__sum_y)
+
+        slope = d_y / d_x
+        intercept = (self.__sum_y / n) - (slope * (self.__sum_x / n))
+
+        return slope, intercept
+
+
+    def __is_full(self, x):
+        if self.__tally is not None and len(self.__data) > self.__tally:
+            return True
+
+        return self.__duration is not None and self.__data[0][0] <= x - self.__duration
+
+
+    def __add(self, x, y, sign):
+        self.__sum_x += sign * x
+        self.__sum_y += sign * y
+        self.__sum_x2 += sign * x * x
+        self.__sum_xy += sign * x * y
+
+
+    def __recompute(self):
+        if self.__data:
+            self.__origin = self.__data[0][0]
+
+        self.__sum_x = 0.0
+        self.__sum_y = 0.0
+        self.__sum_x2 = 0.0
+        self.__sum_xy = 0.0
+
+        for x, y in self.__data:
+            self.__add(x - self.__origin, y, 1)
+
+        self.__departures = 0
+
+
+    def __localised_datetime(self, timestamp):
+        return LocalizedDatetime(datetime.fromtimestamp(timestamp, self.__tzinfo))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RunningRegression:{tally:%s, time_relative:%s, duration:%s, start_timestamp:%s, tzinfo:%s, " \
+               "items:%s}" % \
+               (self.__tally, self.__time_relative, self.__duration, self.__start_timestamp, self.__tzinfo, len(self))
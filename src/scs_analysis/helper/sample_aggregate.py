@@ -6,18 +6,29 @@ Created on 1 Mar 2019
 source repo: scs_analysis
 """
 
-import sys
+import os
+import re
 
+from collections import OrderedDict
 from decimal import InvalidOperation
 
+from scs_analysis.helper.checkpoint_index import CheckpointIndex
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.leaf_paths import LeafPaths
+from scs_analysis.helper.streaming_statistics import StreamingStatistics
+
 from scs_core.data.categorical_regression import CategoricalRegression
 from scs_core.data.datum import Datum
-from scs_core.data.json import JSONify
 from scs_core.data.linear_regression import LinearRegression
 from scs_core.data.localized_datetime import LocalizedDatetime
 from scs_core.data.path_dict import PathDict
 from scs_core.data.precision import Precision
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -28,21 +39,27 @@ class SampleAggregate(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, min_max, iso_path, nodes):
+    def __init__(self, min_max, iso_path, nodes, retain=False, statistics=False):
         """
         Constructor
         """
         self.__min_max = min_max
         self.__iso_path = iso_path
         self.__nodes = nodes
+        self.__retain = retain                              # retain the samples of the period, for as_json()
+        self.__statistics = statistics                      # report count, stdev and quantiles of numeric paths
 
-        self.__precisions = {}
-        self.__regressions = {}
+        # shared with spawned aggregates...
+        self.__paths = OrderedDict()                        # dict of path: is_numeric
+        self.__precisions = {}                              # dict of path: Precision
+        self.__shapes = set()                               # set of document shapes already discovered
 
-        self.__initialised = False
-        self.__tag = None
+        # this period...
+        self.__regressions = {}                             # dict of path: Regression, created on first value
+        self.__estimators = {}                              # dict of path: StreamingStatistics
+        self.__samples = []                                 # array of (LocalizedDatetime, dict of path: value)
 
-        self.__output_count = 0
+        self.__tag = None
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -55,34 +72,42 @@ class SampleAggregate(object):
         return False
 
 
-    def append(self, datetime: LocalizedDatetime, sample: PathDict):
-        # initialise...
-        if not self.__initialised:
-            for node in self.__nodes:
-                try:
-                    paths = sample.paths(node)
+    def discover(self, sample: PathDict):
+        shape = LeafPaths.shape(sample.node())
 
-                except KeyError:
-                    continue
+        if shape in self.__shapes:
+            return
 
-                except IndexError as ex:
-                    paths = None
-                    print("sample_aggregate: %s: IndexError: %s" % (node, ex), file=sys.stderr)
-                    sys.stderr.flush()
-                    exit(1)
+        for path, is_numeric in LeafPaths.find(self.__nodes, sample).items():
+            if path not in self.__paths:
+                self.__paths[path] = is_numeric
+                self.__precisions[path] = Precision()
 
-                for path in paths:
-                    if path == 'rec':
-                        continue
+        if len(self.__shapes) >= LeafPaths.MAX_SHAPES:
+            self.__shapes.clear()
 
-                    self.__precisions[path] = Precision()
-                    self.__regressions[path] = LinearRegression() if Datum.is_numeric(sample.node(path)) else \
-                        CategoricalRegression()
+        self.__shapes.add(shape)
 
-            self.__initialised = True
+
+    def spawn(self):
+        # an empty aggregate, sharing paths and precisions...
+        aggregate = SampleAggregate(self.__min_max, self.__iso_path, self.__nodes, self.__retain, self.__statistics)
+
+        aggregate.__paths = self.__paths
+        aggregate.__precisions = self.__precisions
+        aggregate.__shapes = self.__shapes
+
+        return aggregate
+
+
+    def append(self, datetime: LocalizedDatetime, sample: PathDict):
+        # new paths...
+        self.discover(sample)
 
         # values...
-        for path in self.__precisions.keys():
+        values = OrderedDict()
+
+        for path in self.__paths.keys():
             try:
                 value = sample.node(path)
             except KeyError:
@@ -93,15 +118,86 @@ class SampleAggregate(object):
 
             try:
                 self.__precisions[path].widen(value)
-                self.__regressions[path].append(datetime, value)
+                self.__regression(path).append(datetime, value)
             except InvalidOperation:
                 continue
 
+            if path in self.__estimators:
+                self.__estimators[path].append(value)
+
+            values[path] = value
+
+        if self.__retain:
+            self.__samples.append((datetime, values))
+
 
     def reset(self):
         for path in self.__regressions.keys():
             self.__regressions[path].reset()
 
+        for estimator in self.__estimators.values():
+            estimator.reset()
+
+        self.__samples = []
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['paths'] = self.__paths
+        jdict['precisions'] = OrderedDict((path, precision.digits) for path, precision in self.__precisions.items())
+        jdict['samples'] = [[datetime.as_iso8601(), values] for datetime, values in self.__samples]
+
+        return jdict
+
+
+    def restore(self, jdict):
+        if jdict is None:
+            return
+
+        for path, is_numeric in jdict['paths'].items():
+            self.__paths[path] = is_numeric
+            self.__precisions[path] = Precision(jdict['precisions'][path])
+
+        self.replay(jdict['samples'])
+
+
+    def replay(self, samples):
+        # precisions are restored separately, and not widened...
+        for rec_node, values in samples:
+            datetime = LocalizedDatetime.construct_from_iso8601(rec_node)
+
+            for path, value in values.items():
+                self.__regression(path).append(datetime, value)
+
+                if path in self.__estimators:
+                    self.__estimators[path].append(value)
+
+            if self.__retain:
+                self.__samples.append((datetime, values))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __regression(self, path):
+        try:
+            return self.__regressions[path]
+
+        except KeyError:
+            is_numeric = self.__paths[path]
+
+            regression = LinearRegression() if is_numeric else CategoricalRegression()
+            self.__regressions[path] = regression
+
+            if self.__statistics and is_numeric:
+                self.__estimators[path] = StreamingStatistics()
+
+            return regression
+
+
+    # ----------------------------------------------------------------------------------------------------------------
 
     def report(self, localised_datetime):
         report = PathDict()
@@ -111,40 +207,906 @@ class SampleAggregate(object):
 
         # values...
         for path, precision in self.__precisions.items():
-            regression = self.__regressions[path]
+            regression = self.__regressions.get(path)
 
-            if self.__regressions[path].has_midpoint():
+            if regression is not None and regression.has_midpoint():
                 _, midpoint = regression.midpoint(precision.digits)
 
+                if not self.__min_max and not self.__statistics:
+                    report.append(path, midpoint)
+                    continue
+
                 if self.__min_max:
                     report.append(path + '.min', regression.min(precision.digits))
-                    report.append(path + '.mid', midpoint)
+
+                report.append(path + '.mid', midpoint)
+
+                if self.__min_max:
                     report.append(path + '.max', regression.max(precision.digits))
 
+                if path in self.__estimators:
+                    for name, value in self.__estimators[path].report(precision.digits).items():
+                        report.append(path + '.' + name, value)
+
+        return report
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        regressions = '{' + ', '.join(topic + ': ' + str(reg) for topic, reg in self.__regressions.items()) + '}'
+
+        return "SampleAggregate:{min_max:%s, iso_path:%s, statistics:%s, regressions:%s}" % \
+               (self.__min_max, self.__iso_path, self.__statistics, regressions)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CheckpointAggregate(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, generator, aggregate, fill):
+        """
+        Constructor
+        """
+        self.__generator = generator                        # CheckpointIndex or CheckpointGenerator
+        self.__aggregate = aggregate                        # SampleAggregate
+        self.__fill = fill                                  # bool
+
+        self.__checkpoint = None                            # LocalizedDatetime
+        self.__checkpoint_timestamp = None                  # float
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, rec: LocalizedDatetime, sample: PathDict):
+        reports = []
+
+        timestamp = rec.timestamp()
+
+        # set checkpoint...
+        if self.__checkpoint is None:
+            self.__set_checkpoint(self.__generator.enclosing_localised_datetime(rec))
+
+        # report and reset...
+        if timestamp > self.__checkpoint_timestamp:
+            reports.append(self.__aggregate.report(self.__checkpoint))
+            self.__aggregate.reset()
+
+            filler = self.__checkpoint
+            self.__set_checkpoint(self.__generator.enclosing_localised_datetime(rec))
+
+            # fill missing...
+            while self.__fill:
+                filler = self.__generator.next_localised_datetime(filler)
+
+                if filler >= self.__checkpoint:
+                    break
+
+                reports.append(self.__aggregate.report(filler))
+
+        # append sample...
+        self.__aggregate.append(rec, sample)
+
+        return reports
+
+
+    def close(self):
+        # report remainder...
+        if not self.__aggregate.has_value():
+            return []
+
+        return [self.__aggregate.report(self.__checkpoint)]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['checkpoint'] = None if self.__checkpoint is None else self.__checkpoint.as_iso8601()
+        jdict['aggregate'] = self.__aggregate.as_json()
+
+        return jdict
+
+
+    def restore(self, jdict):
+        checkpoint = jdict['checkpoint']
+
+        if checkpoint is not None:
+            self.__set_checkpoint(LocalizedDatetime.construct_from_iso8601(checkpoint))
+
+        self.__aggregate.restore(jdict['aggregate'])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __set_checkpoint(self, checkpoint):
+        self.__checkpoint = checkpoint
+        self.__checkpoint_timestamp = checkpoint.timestamp()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def checkpoint(self):
+        return self.__checkpoint
+
+
+    @property
+    def aggregate(self):
+        return self.__aggregate
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CheckpointAggregate:{generator:%s, fill:%s, checkpoint:%s, aggregate:%s}" % \
+               (self.__generator, self.__fill, self.__checkpoint, self.__aggregate)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class WatermarkAggregate(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, generator, aggregate, fill, lateness):
+        """
+        Constructor
+        """
+        self.__generator = generator                        # CheckpointIndex
+        self.__aggregate = aggregate                        # SampleAggregate (template for each bucket)
+        self.__fill = fill                                  # bool
+        self.__lateness = lateness                          # float seconds
+
+        self.__buckets = {}                                 # dict of timestamp: (checkpoint, SampleAggregate)
+
+        self.__watermark = None                             # float timestamp
+        self.__reported = None                              # LocalizedDatetime - the latest reported checkpoint
+        self.__reported_timestamp = None                    # float
+
+        self.__late_count = 0
+
+
+    def __len__(self):
+        return len(self.__buckets)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, rec: LocalizedDatetime, sample: PathDict):
+        timestamp = rec.timestamp()
+
+        # drop late...
+        if self.__reported_timestamp is not None and timestamp <= self.__reported_timestamp:
+            self.__late_count += 1
+            return []
+
+        # bucket...
+        checkpoint_timestamp = self.__generator.enclosing_timestamp(timestamp, CheckpointIndex.utc_offset(rec))
+
+        try:
+            _, aggregate = self.__buckets[checkpoint_timestamp]
+
+        except KeyError:
+            checkpoint = self.__generator.localised_datetime(checkpoint_timestamp, rec.tzinfo)
+            aggregate = self.__aggregate.spawn()
+
+            self.__buckets[checkpoint_timestamp] = (checkpoint, aggregate)
+
+        aggregate.append(rec, sample)
+
+        # advance watermark...
+        watermark = timestamp - self.__lateness
+
+        if self.__watermark is not None and watermark <= self.__watermark:
+            return []
+
+        self.__watermark = watermark
+
+        # report buckets that can no longer receive samples...
+        return self.__report(lambda bucket_timestamp: bucket_timestamp < watermark)
+
+
+    def close(self):
+        if not self.__buckets:
+            return []
+
+        # report all, except an empty remainder...
+        final_timestamp = max(self.__buckets.keys())
+        _, final = self.__buckets[final_timestamp]
+
+        if not final.has_value():
+            del self.__buckets[final_timestamp]
+
+        return self.__report(lambda bucket_timestamp: True)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['reported'] = None if self.__reported is None else self.__reported.as_iso8601()
+        jdict['watermark'] = self.__watermark
+        jdict['template'] = self.__aggregate.as_json()
+
+        jdict['buckets'] = [[checkpoint.as_iso8601(), aggregate.as_json()['samples']]
+                            for _, (checkpoint, aggregate) in sorted(self.__buckets.items())]
+
+        return jdict
+
+
+    def restore(self, jdict):
+        reported = jdict['reported']
+
+        if reported is not None:
+            self.__reported = LocalizedDatetime.construct_from_iso8601(reported)
+            self.__reported_timestamp = self.__reported.timestamp()
+
+        self.__watermark = jdict['watermark']
+        self.__aggregate.restore(jdict['template'])
+
+        for checkpoint_node, samples in jdict['buckets']:
+            checkpoint = LocalizedDatetime.construct_from_iso8601(checkpoint_node)
+
+            aggregate = self.__aggregate.spawn()
+            aggregate.replay(samples)
+
+            self.__buckets[checkpoint.timestamp()] = (checkpoint, aggregate)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __report(self, is_closed):
+        reports = []
+
+        for bucket_timestamp in sorted(self.__buckets.keys()):
+            if not is_closed(bucket_timestamp):
+                break
+
+            checkpoint, aggregate = self.__buckets.pop(bucket_timestamp)
+
+            # fill missing...
+            filler = self.__reported
+
+            while self.__fill and filler is not None:
+                filler = self.__generator.next_localised_datetime(filler)
+
+                if filler >= checkpoint:
+                    break
+
+                reports.append(self.__aggregate.report(filler))
+
+            reports.append(aggregate.report(checkpoint))
+
+            self.__reported = checkpoint
+            self.__reported_timestamp = bucket_timestamp
+
+        return reports
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def checkpoint(self):
+        return self.__reported
+
+
+    @property
+    def late_count(self):
+        return self.__late_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "WatermarkAggregate:{generator:%s, fill:%s, lateness:%s, reported:%s, buckets:%d, late_count:%d}" % \
+               (self.__generator, self.__fill, self.__lateness, self.__reported, len(self), self.__late_count)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BatchAggregate(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_CHUNK_SIZE = 65536                              # documents
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def is_available():
+        return np is not None
+
+
+    @staticmethod
+    def precision(value):
+        if value is None:
+            return -1
+
+        try:
+            digits = Datum.precision(value)
+        except TypeError:
+            return -1                                       # not a leaf value
+
+        return -1 if digits is None else digits
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, generator, min_max, iso_path, nodes, fill, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Constructor
+        """
+        self.__generator = generator                        # CheckpointIndex or CheckpointGenerator
+        self.__min_max = min_max                            # bool
+        self.__iso_path = iso_path                          # string
+        self.__nodes = nodes                                # array of string
+        self.__fill = fill                                  # bool
+        self.__chunk_size = chunk_size                      # int
+
+        self.__paths = OrderedDict()                        # dict of path: is_numeric
+        self.__shapes = set()                               # set of document shapes already discovered
+        self.__keys = {}                                    # dict of path: array of key
+        self.__digits = {}                                  # dict of path: int (-1 if no precision yet)
+
+        self.__checkpoint = None                            # LocalizedDatetime
+        self.__checkpoint_timestamp = None                  # float
+
+        self.__timestamps = []                              # array of float
+        self.__columns = {}                                 # dict of path: array of value
+        self.__buckets = []                                 # array of (end index, checkpoint, fill checkpoints)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, rec: LocalizedDatetime, sample: PathDict):
+        # new paths...
+        shape = LeafPaths.shape(sample.node())
+
+        if shape not in self.__shapes:
+            self.__discover(sample, shape)
+
+        timestamp = rec.timestamp()
+
+        # set checkpoint...
+        if self.__checkpoint is None:
+            self.__set_checkpoint(self.__generator.enclosing_localised_datetime(rec))
+
+        # close bucket...
+        if timestamp > self.__checkpoint_timestamp:
+            checkpoint = self.__generator.enclosing_localised_datetime(rec)
+            fillers = []
+
+            filler = self.__checkpoint
+
+            while self.__fill:
+                filler = self.__generator.next_localised_datetime(filler)
+
+                if filler >= checkpoint:
+                    break
+
+                fillers.append(filler)
+
+            self.__buckets.append((len(self.__timestamps), self.__checkpoint, fillers))
+            self.__set_checkpoint(checkpoint)
+
+        # append sample...
+        self.__timestamps.append(timestamp)
+
+        jdict = sample.node()
+
+        for path, column in self.__columns.items():
+            column.append(self.__leaf(jdict, self.__keys[path]))
+
+        # process complete buckets...
+        if len(self.__timestamps) < self.__chunk_size or not self.__buckets:
+            return []
+
+        return [report for report, _ in self.__process()]
+
+
+    def close(self):
+        reports = [report for report, _ in self.__process()]
+
+        # report remainder...
+        if self.__timestamps:
+            self.__buckets.append((len(self.__timestamps), self.__checkpoint, []))
+
+            reports.extend(report for report, has_value in self.__process() if has_value)
+
+        return reports
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __discover(self, sample, shape):
+        for path, is_numeric in LeafPaths.find(self.__nodes, sample).items():
+            if path in self.__paths:
+                continue
+
+            self.__paths[path] = is_numeric
+            self.__keys[path] = re.split(r"[.:]", path)
+            self.__digits[path] = -1
+            self.__columns[path] = [None] * len(self.__timestamps)
+
+        if len(self.__shapes) >= LeafPaths.MAX_SHAPES:
+            self.__shapes.clear()
+
+        self.__shapes.add(shape)
+
+
+    def __set_checkpoint(self, checkpoint):
+        self.__checkpoint = checkpoint
+        self.__checkpoint_timestamp = checkpoint.timestamp()
+
+
+    def __process(self):
+        if not self.__buckets:
+            return []
+
+        # buckets...
+        ends = np.array([bucket[0] for bucket in self.__buckets])
+        starts = np.concatenate(([0], ends[:-1]))
+        lengths = ends - starts
+
+        end = int(ends[-1])
+        x = np.array(self.__timestamps[:end], dtype=float)
+
+        # statistics...
+        statistics = OrderedDict()
+
+        for path, is_numeric in self.__paths.items():
+            values = self.__columns[path][:end]
+
+            if is_numeric:
+                statistics[path] = self.__linear(path, values, x, starts, lengths)
+            else:
+                statistics[path] = self.__categorical(values, starts, ends, self.__min_max)
+
+        # reports...
+        reports = []
+
+        for i, (_, checkpoint, fillers) in enumerate(self.__buckets):
+            report = PathDict()
+            report.append(self.__iso_path, checkpoint.as_iso8601())
+
+            has_value = False
+
+            for path, (counts, midpoints, minimums, maximums, digits) in statistics.items():
+                if counts[i] == 0:
+                    continue
+
+                has_value = True
+                ndigits = None if digits is None else int(digits[i])
+
+                midpoint = self.__round(midpoints[i], ndigits) if counts[i] > 1 else midpoints[i]
+
+                if self.__min_max:
+                    report.append(path + '.min', self.__round(minimums[i], ndigits))
+                    report.append(path + '.mid', midpoint)
+                    report.append(path + '.max', self.__round(maximums[i], ndigits))
+
                 else:
                     report.append(path, midpoint)
 
-        return report
+            reports.append((report, has_value))
+
+            for filler in fillers:
+                report = PathDict()
+                report.append(self.__iso_path, filler.as_iso8601())
+
+                reports.append((report, False))
+
+        # retain the open bucket...
+        self.__timestamps = self.__timestamps[end:]
+
+        for path in self.__columns.keys():
+            self.__columns[path] = self.__columns[path][end:]
+
+        self.__buckets = []
+
+        return reports
+
 
+    def __linear(self, path, values, x, starts, lengths):
+        digits = np.array([self.precision(value) for value in values], dtype=int)
+        valid = digits >= 0
 
-    def print(self, localised_datetime):
-        print(JSONify.dumps(self.report(localised_datetime)))
-        sys.stdout.flush()
+        y = np.array([float(value) if digits[i] >= 0 else 0.0 for i, value in enumerate(values)], dtype=float)
 
-        self.__output_count += 1
+        # precision is widened over the whole stream, and never reset...
+        bucket_digits = np.maximum.reduceat(digits, starts)
+        bucket_digits[0] = max(bucket_digits[0], self.__digits[path])
+        bucket_digits = np.maximum.accumulate(bucket_digits)
+
+        self.__digits[path] = int(bucket_digits[-1])
+
+        # least squares, centred on the mean of each bucket...
+        counts = np.add.reduceat(valid.astype(int), starts)
+        divisors = np.maximum(counts, 1)
+
+        mean_x = np.add.reduceat(np.where(valid, x, 0.0), starts) / divisors
+        mean_y = np.add.reduceat(y, starts) / divisors
+
+        d_x = np.where(valid, x - np.repeat(mean_x, lengths), 0.0)
+        d_y = np.where(valid, y - np.repeat(mean_y, lengths), 0.0)
+
+        s_xx = np.add.reduceat(d_x * d_x, starts)
+        s_xy = np.add.reduceat(d_x * d_y, starts)
+
+        slopes = np.divide(s_xy, s_xx, out=np.zeros_like(s_xy), where=s_xx > 0)
+
+        # midpoints...
+        with np.errstate(invalid='ignore'):
+            min_x = np.minimum.reduceat(np.where(valid, x, np.inf), starts)
+            max_x = np.maximum.reduceat(np.where(valid, x, -np.inf), starts)
+
+            midpoints = mean_y + slopes * (((min_x + max_x) / 2) - mean_x)
+
+        minimums = np.minimum.reduceat(np.where(valid, y, np.inf), starts)
+        maximums = np.maximum.reduceat(np.where(valid, y, -np.inf), starts)
+
+        return counts, midpoints.tolist(), minimums.tolist(), maximums.tolist(), bucket_digits
+
+
+    @staticmethod
+    def __categorical(values, starts, ends, min_max):
+        counts = []
+        midpoints = []
+        minimums = []
+        maximums = []
+
+        for start, end in zip(starts, ends):
+            categories = set()
+
+            for value in values[start:end]:
+                if value is None:
+                    continue
+
+                try:
+                    categories.add(value)
+                except TypeError:
+                    continue                                # not a leaf value
+
+            counts.append(len(categories))
+            midpoints.append(next(iter(categories)) if len(categories) == 1 else None)
+
+            if min_max:
+                ordered = sorted(categories)
+
+                minimums.append(ordered[0] if ordered else None)
+                maximums.append(ordered[-1] if ordered else None)
+
+        return counts, midpoints, minimums, maximums, None
+
+
+    @staticmethod
+    def __leaf(node, keys):
+        # as PathDict.node(..), but with the path split once only...
+        try:
+            for key in keys:
+                node = node[int(key)] if isinstance(node, list) else node[key]
+
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None
+
+        return node
+
+
+    @staticmethod
+    def __round(value, ndigits):
+        if ndigits is None or not isinstance(value, float):
+            return value
+
+        return round(value, ndigits)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
-    def output_count(self):
-        return self.__output_count
+    def checkpoint(self):
+        return self.__checkpoint
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        regressions = '{' + ', '.join(topic + ': ' + str(reg) for topic, reg in self.__regressions.items()) + '}'
+        return "BatchAggregate:{generator:%s, min_max:%s, iso_path:%s, nodes:%s, fill:%s, chunk_size:%s, " \
+               "checkpoint:%s, held:%s}" % \
+               (self.__generator, self.__min_max, self.__iso_path, self.__nodes, self.__fill, self.__chunk_size,
+                self.__checkpoint, len(self.__timestamps))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GroupedAggregate(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, group_path, generator, min_max, iso_path, nodes, fill, batch=False, lateness=None,
+                 retain=False, statistics=False):
+        """
+        Constructor
+        """
+        self.__group_path = group_path                      # string
+        self.__generator = generator                        # CheckpointIndex or CheckpointGenerator
+        self.__min_max = min_max                            # bool
+        self.__iso_path = iso_path                          # string
+        self.__nodes = nodes                                # array of string
+        self.__fill = fill                                  # bool
+        self.__batch = batch                                # bool
+        self.__lateness = lateness                          # float seconds or None
+        self.__retain = retain                              # bool
+        self.__statistics = statistics                      # bool
+
+        self.__groups = OrderedDict()                       # dict of group key: aggregate stream
+
+
+    def __len__(self):
+        return len(self.__groups)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, rec: LocalizedDatetime, sample: PathDict):
+        try:
+            key = sample.node(self.__group_path)
+        except KeyError:
+            return []
+
+        try:
+            stream = self.__groups[key]
+
+        except KeyError:
+            stream = self.__stream()
+            self.__groups[key] = stream
+
+        except TypeError:
+            return []                                       # the group node is not a leaf
+
+        return [self.__tagged(key, report) for report in stream.append(rec, sample)]
+
+
+    def close(self):
+        reports = []
+
+        for key, stream in self.__groups.items():
+            reports.extend(self.__tagged(key, report) for report in stream.close())
+
+        return reports
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['group_path'] = self.__group_path
+        jdict['groups'] = [[key, stream.as_json()] for key, stream in self.__groups.items()]
+
+        return jdict
+
+
+    def restore(self, jdict):
+        if jdict['group_path'] != self.__group_path:
+            raise ValueError("group path %s does not match %s" % (jdict['group_path'], self.__group_path))
+
+        for key, stream_jdict in jdict['groups']:
+            stream = self.__stream()
+            stream.restore(stream_jdict)
+
+            self.__groups[key] = stream
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __stream(self):
+        if self.__batch:
+            return BatchAggregate(self.__generator, self.__min_max, self.__iso_path, self.__nodes, self.__fill)
+
+        aggregate = SampleAggregate(self.__min_max, self.__iso_path, self.__nodes, self.__retain, self.__statistics)
+
+        if self.__lateness is None:
+            return CheckpointAggregate(self.__generator, aggregate, self.__fill)
+
+        return WatermarkAggregate(self.__generator, aggregate, self.__fill, self.__lateness)
+
+
+    def __tagged(self, key, report: PathDict):
+        tagged = PathDict()
+        tagged.append(self.__group_path, key)
+
+        for path in report.paths():
+            if path == self.__group_path or path.startswith(self.__group_path + '.'):
+                continue                                    # the group node itself, or its min / mid / max
+
+            tagged.append(path, report.node(path))
+
+        return tagged
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def groups(self):
+        return self.__groups
+
+
+    @property
+    def late_count(self):
+        if self.__lateness is None:
+            return 0
+
+        return sum(stream.late_count for stream in self.__groups.values())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GroupedAggregate:{group_path:%s, generator:%s, min_max:%s, iso_path:%s, nodes:%s, fill:%s, " \
+               "batch:%s, lateness:%s, statistics:%s, groups:%d}" % \
+               (self.__group_path, self.__generator, self.__min_max, self.__iso_path, self.__nodes, self.__fill,
+                self.__batch, self.__lateness, self.__statistics, len(self))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MultiResolutionAggregate(object):
+    """
+    classdocs
+    """
+
+    TAG_PATH = 'checkpoint'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, checkpoints, group_path, min_max, iso_path, nodes, fill, batch=False, lateness=None,
+                  retain=False, statistics=False):
+        streams = OrderedDict()
+
+        for checkpoint in checkpoints:
+            generator = CheckpointIndex.construct(checkpoint)
+
+            if group_path is not None:
+                stream = GroupedAggregate(group_path, generator, min_max, iso_path, nodes, fill, batch, lateness,
+                                          retain, statistics)
+            elif batch:
+                stream = BatchAggregate(generator, min_max, iso_path, nodes, fill)
+            else:
+                aggregate = SampleAggregate(min_max, iso_path, nodes, retain, statistics)
+
+                if lateness is None:
+                    stream = CheckpointAggregate(generator, aggregate, fill)
+                else:
+                    stream = WatermarkAggregate(generator, aggregate, fill, lateness)
+
+            streams[checkpoint] = stream
+
+        return cls(streams)
+
+
+    @staticmethod
+    def filename(file_prefix, checkpoint):
+        # for example, **:/15:00 becomes x-e15-00...
+        infix = checkpoint.replace('**', 'x').replace('/', 'e').replace(':', '-')
+
+        return file_prefix + '_' + infix + '.csv'
+
+
+    @classmethod
+    def tagged(cls, checkpoint, report: PathDict):
+        tagged = PathDict()
+        tagged.append(cls.TAG_PATH, checkpoint)
+
+        for path in report.paths():
+            tagged.append(path, report.node(path))
+
+        return tagged
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, streams):
+        """
+        Constructor
+        """
+        self.__streams = streams                            # dict of checkpoint: aggregate stream
+
+
+    def __len__(self):
+        return len(self.__streams)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, rec: LocalizedDatetime, sample: PathDict):
+        reports = []
+
+        for checkpoint, stream in self.__streams.items():
+            reports.extend((checkpoint, report) for report in stream.append(rec, sample))
+
+        return reports
+
+
+    def close(self):
+        reports = []
+
+        for checkpoint, stream in self.__streams.items():
+            reports.extend((checkpoint, report) for report in stream.close())
+
+        return reports
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        return OrderedDict((checkpoint, stream.as_json()) for checkpoint, stream in self.__streams.items())
+
+
+    def restore(self, jdict):
+        if set(jdict.keys()) != set(self.checkpoints):
+            raise ValueError("checkpoints %s do not match %s" % (list(jdict.keys()), self.checkpoints))
+
+        for checkpoint, stream in self.__streams.items():
+            try:
+                stream.restore(jdict[checkpoint])
+            except (KeyError, TypeError):
+                raise ValueError("the state for %s does not match its mode" % checkpoint)
+
+
+    def load(self, filename):
+        try:
+            f = open(filename, 'r')
+        except FileNotFoundError:
+            return False
+
+        with f:
+            self.restore(JSONCodec.loads(f.read()))
+
+        return True
+
+
+    def save(self, filename):
+        # write, then rename, so that a failed run leaves the previous state intact...
+        tmp_filename = filename + '.tmp'
+
+        with open(tmp_filename, 'w') as f:
+            f.write(JSONCodec.dumps(self.as_json()) + '\n')
+
+        os.replace(tmp_filename, filename)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def checkpoints(self):
+        return list(self.__streams.keys())
+
+
+    @property
+    def streams(self):
+        return self.__streams
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        streams = '{' + ', '.join(checkpoint + ': ' + str(stream)
+                                  for checkpoint, stream in self.__streams.items()) + '}'
 
-        return "SampleAggregate:{min_max:%s, iso_path:%s output_count:%s, regressions:%s}" % \
-               (self.__min_max, self.__iso_path, self.output_count, regressions)
+        return "MultiResolutionAggregate:{streams:%s}" % streams
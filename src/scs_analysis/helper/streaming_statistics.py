@@ -0,0 +1,286 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+Constant-memory estimators of dispersion and quantiles, for use by sample_aggregate.
+
+RunningMoments uses Welford's method. P2Quantile uses the P-square algorithm of Jain and Chlamtac, which holds five
+markers, whatever the number of observations. Up to five observations, the quantile is exact, interpolated as for
+numpy.percentile(..).
+
+https://www.cse.wustl.edu/~jain/papers/ftp/psqr.pdf
+"""
+
+import math
+
+from collections import OrderedDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RunningMoments(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__count = 0                                    # int
+        self.__mean = 0.0                                   # float
+        self.__m2 = 0.0                                     # float - sum of squared differences from the mean
+
+
+    def __len__(self):
+        return self.__count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, value):
+        self.__count += 1
+
+        delta = value - self.__mean
+        self.__mean += delta / self.__count
+        self.__m2 += delta * (value - self.__mean)
+
+
+    def reset(self):
+        self.__count = 0
+        self.__mean = 0.0
+        self.__m2 = 0.0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def mean(self):
+        return self.__mean if self.__count > 0 else None
+
+
+    def stdev(self):
+        # sample standard deviation, as pandas...
+        if self.__count < 2:
+            return None
+
+        return math.sqrt(self.__m2 / (self.__count - 1))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RunningMoments:{count:%s, mean:%s, m2:%s}" % (self.__count, self.__mean, self.__m2)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class P2Quantile(object):
+    """
+    classdocs
+    """
+
+    MARKERS = 5
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, p):
+        """
+        Constructor
+        """
+        self.__p = p                                        # float 0.0 .. 1.0
+
+        self.__heights = []                                 # array of float - the first observations, then markers
+        self.__positions = []                               # array of int
+        self.__desired = []                                 # array of float
+        self.__increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+        self.__count = 0
+
+
+    def __len__(self):
+        return self.__count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, value):
+        self.__count += 1
+
+        # initial observations...
+        if self.__count <= self.MARKERS:
+            self.__heights.append(value)
+            self.__heights.sort()
+
+            if self.__count == self.MARKERS:
+                p = self.__p
+
+                self.__positions = [0, 1, 2, 3, 4]
+                self.__desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+
+            return
+
+        q = self.__heights
+        n = self.__positions
+
+        # cell...
+        if value < q[0]:
+            q[0] = value
+            k = 0
+
+        elif value >= q[4]:
+            q[4] = value
+            k = 3
+
+        else:
+            k = 0
+
+            while value >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, self.MARKERS):
+            n[i] += 1
+
+        for i in range(self.MARKERS):
+            self.__desired[i] += self.__increments[i]
+
+        # adjust the inner markers...
+        for i in range(1, self.MARKERS - 1):
+            d = self.__desired[i] - n[i]
+
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+
+                height = self.__parabolic(i, d)
+
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+
+                q[i] = height
+                n[i] += d
+
+
+    def reset(self):
+        self.__heights = []
+        self.__positions = []
+        self.__desired = []
+
+        self.__count = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def value(self):
+        if self.__count == 0:
+            return None
+
+        if self.__count > self.MARKERS:
+            return self.__heights[2]
+
+        # exact, for few observations...
+        index = self.__p * (self.__count - 1)
+        lower = int(math.floor(index))
+        upper = min(lower + 1, self.__count - 1)
+
+        return self.__heights[lower] + (index - lower) * (self.__heights[upper] - self.__heights[lower])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __parabolic(self, i, d):
+        q = self.__heights
+        n = self.__positions
+
+        return q[i] + d / (n[i + 1] - n[i - 1]) * ((n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+                                                   (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def p(self):
+        return self.__p
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "P2Quantile:{p:%s, count:%s, heights:%s, positions:%s}" % \
+               (self.__p, self.__count, self.__heights, self.__positions)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class StreamingStatistics(object):
+    """
+    classdocs
+    """
+
+    QUANTILES = (('p5', 0.05), ('p50', 0.5), ('p95', 0.95))
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__moments = RunningMoments()
+        self.__quantiles = OrderedDict((name, P2Quantile(p)) for name, p in self.QUANTILES)
+
+
+    def __len__(self):
+        return len(self.__moments)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, value):
+        value = float(value)
+
+        self.__moments.append(value)
+
+        for quantile in self.__quantiles.values():
+            quantile.append(value)
+
+
+    def reset(self):
+        self.__moments.reset()
+
+        for quantile in self.__quantiles.values():
+            quantile.reset()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def report(self, ndigits=None):
+        report = OrderedDict()
+
+        report['count'] = len(self)
+        report['stdev'] = self.__round(self.__moments.stdev(), ndigits)
+
+        for name, quantile in self.__quantiles.items():
+            report[name] = self.__round(quantile.value(), ndigits)
+
+        return report
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __round(value, ndigits):
+        if value is None or ndigits is None:
+            return value
+
+        return round(value, ndigits)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        quantiles = '{' + ', '.join(name + ': ' + str(quantile) for name, quantile in self.__quantiles.items()) + '}'
+
+        return "StreamingStatistics:{moments:%s, quantiles:%s}" % (self.__moments, quantiles)
@@ -0,0 +1,258 @@
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+An in-process equivalent of the pipeline that was previously run for every temperature / humidity offset pair:
+
+csv_reader.py REPORT | node_shift.py -o T_OFFSET T_PATH | node_shift.py -o RH_OFFSET RH_PATH | \
+sample_aggregate.py -c **:/15:00 | csv_join.py -i -l praxis rec - -r ref rec REF | \
+sample_rh_t_grid.py -r 20 95 5 -t 0 30 5 -o S ...
+
+The report and reference files are read once. Each offset pair is then evaluated against the cached values, with
+shifts performed by index arithmetic, in the same way as a NodeShifter without fill.
+
+Offset pairs are independent of one another, and may be evaluated by a multiprocessing pool of TimeshiftGridWorkers.
+Each worker process holds its own copy of the TimeshiftGrid, so no state or scratch files are shared.
+"""
+
+from collections import OrderedDict
+from statistics import stdev
+
+from scs_analysis.helper.checkpoint_index import CheckpointIndex, FastISO8601
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.sample_aggregate import CheckpointAggregate, SampleAggregate
+
+from scs_core.csv.csv_reader import CSVReader
+
+from scs_core.data.datum import Datum
+from scs_core.data.path_dict import PathDict
+
+from scs_core.error.error_grid import ErrorGrid
+from scs_core.error.error_mesh_t_rh import ErrorMeshTRh
+from scs_core.error.error_report import ErrorReport
+from scs_core.error.error_surface import ErrorSurface
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TimeshiftGrid(object):
+    """
+    classdocs
+    """
+
+    CHECKPOINT =        '**:/15:00'
+
+    RH_MIN =            20
+    RH_MAX =            95
+    RH_STEP =           5
+
+    T_MIN =             0
+    T_MAX =             30
+    T_STEP =            5
+
+    STDEV_PRECISION =   3
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, report_filename, ref_filename, rh_path, t_path, report_path, ref_path, iso_path='rec'):
+        # report...
+        recs = []
+        rh_values = []
+        t_values = []
+        report_values = []
+
+        reader = CSVReader(filename=report_filename)
+
+        try:
+            for row in reader.rows:
+                datum = JSONCodec.path_dict(row)
+
+                if datum is None:
+                    continue
+
+                try:
+                    rec_node = datum.node(iso_path)
+                except KeyError:
+                    rec_node = None
+
+                recs.append(FastISO8601.construct(rec_node))
+
+                rh_values.append(datum.node(rh_path))
+                t_values.append(datum.node(t_path))
+                report_values.append(datum.node(report_path))
+
+        finally:
+            reader.close()
+
+        # reference...
+        references = {}
+
+        reader = CSVReader(filename=ref_filename)
+
+        try:
+            for row in reader.rows:
+                datum = JSONCodec.path_dict(row)
+
+                if datum is None:
+                    continue
+
+                rec = FastISO8601.construct(datum.node(iso_path))
+
+                if rec is None:
+                    raise ValueError(datum.node(iso_path))
+
+                try:
+                    value = datum.node(ref_path)
+                except KeyError:
+                    continue
+
+                if not Datum.is_numeric(value):
+                    continue
+
+                references[rec.timestamp()] = float(value)
+
+        finally:
+            reader.close()
+
+        return cls(recs, rh_values, t_values, report_values, references)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, recs, rh_values, t_values, report_values, references):
+        """
+        Constructor
+        """
+        self.__recs = recs                                  # array of LocalizedDatetime (None if absent)
+        self.__rh_values = rh_values                        # array of value
+        self.__t_values = t_values                          # array of value
+        self.__report_values = report_values                # array of value
+
+        self.__references = references                      # dict of timestamp: float
+
+        self.__generator = CheckpointIndex.construct(self.CHECKPOINT)
+
+
+    def __len__(self):
+        return len(self.__recs)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def evaluate(self, t_offset, rh_offset):
+        grid, error_stdev = self.__grid(t_offset, rh_offset)
+
+        mesh = ErrorMeshTRh.construct(grid)
+        surface = ErrorSurface.construct(mesh)
+
+        return ErrorReport(t_offset, rh_offset, error_stdev), surface
+
+
+    def error_stdev(self, t_offset, rh_offset):
+        _, error_stdev = self.__grid(t_offset, rh_offset)
+
+        return error_stdev
+
+
+    def aggregates(self, t_offset, rh_offset):
+        stream = CheckpointAggregate(self.__generator, SampleAggregate(False, 'rec', [None]), False)
+
+        for rec, sample in self.samples(t_offset, rh_offset):
+            if rec is None:
+                continue
+
+            for report in stream.append(rec, sample):
+                yield report
+
+        for report in stream.close():
+            yield report
+
+
+    def samples(self, t_offset, rh_offset):
+        count = len(self)
+
+        # documents retained by the t shift...
+        t_start = max(0, t_offset)
+        t_end = count + min(0, t_offset)
+        t_count = max(0, t_end - t_start)
+
+        # documents retained by the subsequent rH shift...
+        for index in range(max(0, rh_offset), t_count + min(0, rh_offset)):
+            i = t_start + index
+
+            sample = PathDict(OrderedDict((
+                ('rh', self.__rh_values[i - rh_offset]),
+                ('t', self.__t_values[i - t_offset]),
+                ('report', self.__report_values[i])
+            )))
+
+            yield self.__recs[i], sample
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __grid(self, t_offset, rh_offset):
+        grid = ErrorGrid.construct(self.RH_MIN, self.RH_MAX, self.RH_STEP, self.T_MIN, self.T_MAX, self.T_STEP)
+        errors = []
+
+        for aggregate in self.aggregates(t_offset, rh_offset):
+            # join...
+            rec = FastISO8601.construct(aggregate.node('rec'))
+
+            try:
+                ref = self.__references[rec.timestamp()]
+            except KeyError:
+                continue
+
+            # nodes...
+            try:
+                rh = float(aggregate.node('rh'))
+                t = float(aggregate.node('t'))
+                report = float(aggregate.node('report'))
+            except (KeyError, TypeError, ValueError):
+                continue
+
+            # append...
+            if grid.append(rh, t, report, ref):
+                errors.append(report - ref)
+
+        error_stdev = round(stdev(errors), self.STDEV_PRECISION) if len(errors) > 1 else None
+
+        return grid, error_stdev
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TimeshiftGrid:{checkpoint:%s, rh:%s, t:%s, len:%d, references:%d}" % \
+               (self.CHECKPOINT, (self.RH_MIN, self.RH_MAX, self.RH_STEP), (self.T_MIN, self.T_MAX, self.T_STEP),
+                len(self), len(self.__references))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TimeshiftGridWorker(object):
+    """
+    classdocs
+    """
+
+    __grid = None                                           # TimeshiftGrid for this process
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def initialise(cls, grid: TimeshiftGrid):
+        cls.__grid = grid
+
+
+    @classmethod
+    def evaluate(cls, offsets):
+        t_offset, rh_offset = offsets
+
+        report, surface = cls.__grid.evaluate(t_offset, rh_offset)
+
+        return JSONCodec.dumps(report), JSONCodec.dumps(surface)
@@ -46,8 +46,9 @@ array mode:
 import sys
 
 from scs_analysis.cmd.cmd_node import CmdNode
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
 
-from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
 
 
@@ -71,19 +72,21 @@ if __name__ == '__main__':
         print("node: %s" % cmd, file=sys.stderr)
         sys.stderr.flush()
 
+    stdout = OutputStream.construct()
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
         if cmd.array:
-            print('[', end='')
+            stdout.print('[', end='')
 
         node = None
         first = True
 
         for line in sys.stdin:
             jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
+            datum = JSONCodec.path_dict(jstr)
 
             if datum is None:
                 continue
@@ -114,24 +117,22 @@ if __name__ == '__main__':
 
                     try:
                         for item in node:
-                            print(JSONify.dumps(item))
+                            stdout.print(JSONCodec.dumps(item))
                     except TypeError as ex:
-                        print(ex)
-                        print(JSONify.dumps(node))
+                        stdout.print(str(ex))
+                        stdout.print(JSONCodec.dumps(node))
 
             else:
                 if cmd.array:
                     if first:
-                        print(JSONify.dumps(target), end='')
+                        stdout.print(JSONCodec.dumps(target), end='')
                         first = False
 
                     else:
-                        print(", %s" % JSONify.dumps(target), end='')
+                        stdout.print(", %s" % JSONCodec.dumps(target), end='')
 
                 else:
-                    print(JSONify.dumps(target))
-
-            sys.stdout.flush()
+                    stdout.print(JSONCodec.dumps(target))
 
             output_count += 1
 
@@ -145,7 +146,7 @@ if __name__ == '__main__':
 
     finally:
         if cmd.array:
-            print(']')
+            stdout.print(']')
 
         if cmd.verbose:
             print("node: documents: %d output: %d" % (document_count, output_count), file=sys.stderr)
@@ -38,10 +38,10 @@ csv_reader.py climate.csv | sample_aggregate.py -f -c **:/01:00 | node_shift.py
 import sys
 
 from scs_analysis.cmd.cmd_node_shift import CmdNodeShift
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
 
-from scs_core.data.json import JSONify
 from scs_core.data.node_shifter import NodeShifter
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -73,6 +73,8 @@ if __name__ == '__main__':
             print("node_shift: %s" % shifter, file=sys.stderr)
             sys.stderr.flush()
 
+        stdout = OutputStream.construct()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -80,7 +82,7 @@ if __name__ == '__main__':
         # input...
         for line in sys.stdin:
             jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
+            datum = JSONCodec.path_dict(jstr)
 
             if datum is None:
                 continue
@@ -105,8 +107,7 @@ if __name__ == '__main__':
                 continue
 
             # report...
-            print(JSONify.dumps(target))
-            sys.stdout.flush()
+            stdout.print(JSONCodec.dumps(target))
 
             output_count += 1
 
@@ -117,8 +118,7 @@ if __name__ == '__main__':
             if target is None:
                 break
 
-            print(JSONify.dumps(target))
-            sys.stdout.flush()
+            stdout.print(JSONCodec.dumps(target))
 
             output_count += 1
 
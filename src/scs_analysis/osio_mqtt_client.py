@@ -41,10 +41,11 @@ import sys
 import time
 
 from scs_analysis.cmd.cmd_mqtt_client import CmdMQTTClient
+from scs_analysis.helper.json_codec import JSONCodec
 from scs_analysis.helper.osio_mqtt_client_handler import OSIOMQTTHandler
 from scs_analysis.helper.mqtt_reporter import MQTTReporter
+from scs_analysis.helper.output_stream import OutputStream
 
-from scs_core.data.json import JSONify
 from scs_core.data.publication import Publication
 
 from scs_core.osio.client.api_auth import APIAuth
@@ -144,6 +145,8 @@ if __name__ == '__main__':
         client = MQTTClient(*subscribers)
         client.connect(ClientAuth.MQTT_HOST, client_auth.client_id, client_auth.user_id, client_auth.client_password)
 
+        stdout = OutputStream.construct(live=True)
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -173,7 +176,7 @@ if __name__ == '__main__':
 
                 except Exception as ex:
                     if cmd.verbose:
-                        print(JSONify.dumps(ExceptionReport.construct(ex)))
+                        print(JSONCodec.dumps(ExceptionReport.construct(ex)))
                         sys.stderr.flush()
 
                 time.sleep(random.uniform(1.0, 2.0))        # Don't hammer the broker!
@@ -182,8 +185,7 @@ if __name__ == '__main__':
                 reporter.print("done")
 
             if cmd.echo:
-                print(message)
-                sys.stdout.flush()
+                stdout.print(message)
 
 
     # ----------------------------------------------------------------------------------------------------------------
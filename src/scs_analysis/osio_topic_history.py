@@ -30,8 +30,9 @@ scs_analysis/osio_api_auth
 import sys
 
 from scs_analysis.cmd.cmd_osio_topic_history import CmdOSIOTopicHistory
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
 
-from scs_core.data.json import JSONify
 from scs_core.data.localized_datetime import LocalizedDatetime
 
 from scs_core.osio.client.api_auth import APIAuth
@@ -85,6 +86,8 @@ if __name__ == '__main__':
             print("osio_topic_history: %s" % message_manager, file=sys.stderr)
             sys.stderr.flush()
 
+        stdout = OutputStream.construct()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -112,8 +115,7 @@ if __name__ == '__main__':
 
         for message in messages:
             document = message if cmd.include_wrapping else message.payload.content
-            print(JSONify.dumps(document))
-            sys.stdout.flush()
+            stdout.print(JSONCodec.dumps(document))
 
         if cmd.verbose:
             print("osio_topic_history: total: %d" % len(messages), file=sys.stderr)
@@ -35,8 +35,9 @@ import sys
 from collections import OrderedDict
 
 from scs_analysis.cmd.cmd_osio_topic_publisher import CmdOSIOTopicPublisher
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
 
-from scs_core.data.json import JSONify
 from scs_core.data.publication import Publication
 
 from scs_core.osio.config.project import Project
@@ -45,9 +46,9 @@ from scs_core.sys.system_id import SystemID
 
 from scs_host.sys.host import Host
 
-
 # TODO: remove channel handling
 
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
@@ -97,6 +98,8 @@ if __name__ == '__main__':
             print("osio_topic_publisher: %s" % topic, file=sys.stderr)
             sys.stderr.flush()
 
+        stdout = OutputStream.construct(live=True)
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -118,8 +121,7 @@ if __name__ == '__main__':
 
             publication = Publication(topic, payload)
 
-            print(JSONify.dumps(publication))
-            sys.stdout.flush()
+            stdout.print(JSONCodec.dumps(publication))
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -28,7 +28,10 @@ paths can be specified, including none (process all paths). If a path to an inte
 specified, then all of the leaf-node descendants of that node will be processed.
 
 Note that the leaf-node paths to be processed are obtained from the paths provided on the command line, and the
-actual paths found in the first JSON document. Paths that do not exist in the first document are ignored.
+actual paths found in the input JSON documents. A leaf-node path is added when it is first found with a non-null
+value - for example, when a sensor comes online part way through the input - and is reported from then on. Paths are
+discovered only when a document has a set of fields, or of null fields, that has not been seen before, so the cost
+for a stream of documents of unchanging form is low.
 
 The input JSON document must contain a field labelled 'rec', providing an ISO 8601 localised datetime. If this field
 is not present then the document is skipped. Note that the timezone of the output rec datetimes is the same as the
@@ -37,44 +40,102 @@ input rec values.
 Leaf node values may be numeric or strings. Numeric values are processed according to a simple linear regression.
 String values are processed using a categorical regression.
 
+If the statistics flag is set, then the count, sample standard deviation, and 5th, 50th and 95th percentiles of each
+numeric path are also reported, following the midpoint. These are computed with streaming estimators, whose memory
+does not grow with the length of the checkpoint period: the percentiles use the P-square algorithm, and are therefore
+estimates when a period has more than five values. Statistics are not available in batch mode.
+
 If the input document does not contain a specified path - or if the value is null - then the value is ignored.
 
 At each checkpoint, if there are no values for a given path, then only the rec field is reported. If the fill flag is
 set, then any checkpoints missing in the input data are written to stdout in sequence.
 
+More than one checkpoint specification may be given, in which case the input is read once, and aggregated separately
+for each specification. If an output file prefix is given, then the output for each specification is written to its
+own CSV file, named with the prefix and the specification - for example, the output for **:/15:00 with the prefix
+climate is written to climate_x-e15-00.csv. Otherwise, if there are several specifications, each output document is
+led by a checkpoint field, giving its specification.
+
+In batch mode, documents are held in blocks, and the midpoint, min and max of every complete checkpoint period in the
+block are computed together with NumPy, in place of the streaming regressions, so batch mode requires NumPy. Batch mode
+is intended for offline files: output is delayed until a block is full, or the input is closed. The output is the same
+as for streaming mode, to within the last reported digit, except that a midpoint is reported as the mean where all of
+the values in a period share one rec datetime.
+
+If a group path is specified, then the input stream is aggregated separately for each value of that node - typically
+'tag', for a merged stream from many devices. Each group has its own paths, regressions and checkpoints, and each
+output document is led by the group path and its value. Documents without the group path are skipped. Groups are
+reported independently, so the output of one group may be interleaved with that of another.
+
+By default, the input rec values must be non-decreasing. If a lateness is specified, then documents may arrive out of
+order by up to that duration: each checkpoint period is held open until a document arrives with a rec later than the
+checkpoint by more than the lateness, and periods are then reported in order. Documents that arrive after their
+period has been reported are dropped, and the number dropped is reported on stderr. With a group path, the lateness
+applies separately to each group. Lateness is not available in batch mode.
+
+If a state file is specified, then any state saved by a previous run is loaded before the input is read, and when
+the input is closed, the open checkpoint period - or periods, for groups or lateness - is saved to the file, in
+place of being reported. The next run reports the period when its checkpoint is passed, so that a series of runs over
+consecutive inputs produces the same output as a single run over all of them. The state file also records the
+discovered paths and precisions. The checkpoint specifications and group path must be the same for each run. State
+files are not available in batch mode.
+
 SYNOPSIS
-sample_aggregate.py -c HH:MM:SS [-m] [-t] [-f] [-i] [-v] [PATH_1..PATH_N]
+sample_aggregate.py -c HH:MM:SS [-c HH:MM:SS ..] [-o FILE_PREFIX] [-m] [-x] [-t] [-f] [-i] [-g GROUP_PATH]
+[{ -b | -l LATENESS }] [-s STATE_FILE] [-v] [PATH_1..PATH_N]
 
 EXAMPLES
 csv_reader.py gases.csv | sample_aggregate.py -f -c **:/5:00 val
+
+csv_reader.py estate_gases.csv | sample_aggregate.py -g tag -c **:/15:00 val
+
+csv_reader.py climate.csv | sample_aggregate.py -c **:/1:00 -c **:/15:00 -c **:00:00 -o climate val
+
+aws_mqtt_client.py -s estate/climate | sample_aggregate.py -g tag -l 2 -c **:/5:00 val
+
+csv_reader.py climate-2019-03-01.csv | sample_aggregate.py -s climate-state.json -c **:/15:00 val
 """
 
 import sys
 
 from scs_analysis.cmd.cmd_sample_aggregate import CmdSampleAggregate
-from scs_analysis.helper.sample_aggregate import SampleAggregate
+from scs_analysis.helper.checkpoint_index import FastISO8601
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.sample_aggregate import BatchAggregate, MultiResolutionAggregate
+
+from scs_core.csv.csv_writer import CSVWriter
 
 from scs_core.data.checkpoint_generator import CheckpointGenerator
-from scs_core.data.localized_datetime import LocalizedDatetime
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
-    aggregate = None
+    stream = None
+    writers = {}
 
     document_count = 0
     processed_count = 0
+    output_count = 0
 
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
 
     cmd = CmdSampleAggregate()
 
-    if not CheckpointGenerator.is_valid(cmd.checkpoint):
-        print("sample_aggregate: the checkpoint specification %s is invalid." % cmd.checkpoint, file=sys.stderr)
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    for checkpoint in cmd.checkpoints:
+        if not CheckpointGenerator.is_valid(checkpoint):
+            print("sample_aggregate: the checkpoint specification %s is invalid." % checkpoint, file=sys.stderr)
+            exit(2)
+
+    if cmd.batch and not BatchAggregate.is_available():
+        print("sample_aggregate: --batch requires numpy.", file=sys.stderr)
         exit(2)
 
     if cmd.verbose:
@@ -85,23 +146,40 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        generator = CheckpointGenerator.construct(cmd.checkpoint)
+        lateness = None if cmd.lateness is None else cmd.lateness.total_seconds()
+
+        stream = MultiResolutionAggregate.construct(cmd.checkpoints, cmd.group_by, cmd.min_max, cmd.iso, cmd.nodes,
+                                                    cmd.fill, cmd.batch, lateness, cmd.state is not None,
+                                                    cmd.statistics)
+
+        if cmd.state is not None:
+            try:
+                if stream.load(cmd.state) and cmd.verbose:
+                    print("sample_aggregate: resumed from %s" % cmd.state, file=sys.stderr)
+
+            except ValueError as ex:
+                print("sample_aggregate: the state file %s is invalid: %s" % (cmd.state, ex), file=sys.stderr)
+                exit(1)
 
-        aggregate = SampleAggregate(cmd.min_max, cmd.iso, cmd.nodes)
+        if cmd.file_prefix is not None:
+            for checkpoint in cmd.checkpoints:
+                writers[checkpoint] = CSVWriter(MultiResolutionAggregate.filename(cmd.file_prefix, checkpoint))
+
+        tagged = len(stream) > 1 and not writers
 
         if cmd.verbose:
-            print("sample_aggregate: %s" % aggregate, file=sys.stderr)
+            print("sample_aggregate: %s" % stream, file=sys.stderr)
             sys.stderr.flush()
 
+        stdout = OutputStream.construct()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        checkpoint = None
-
         for line in sys.stdin:
             # sample...
-            datum = PathDict.construct_from_jstr(line)
+            datum = JSONCodec.path_dict(line)
 
             if datum is None:
                 continue
@@ -113,49 +191,60 @@ if __name__ == '__main__':
             except KeyError:
                 continue
 
-            rec = LocalizedDatetime.construct_from_iso8601(rec_node)
-
-            # set checkpoint...
-            if checkpoint is None:
-                checkpoint = generator.enclosing_localised_datetime(rec)
+            rec = FastISO8601.construct(rec_node)
 
-            # report and reset...
-            if rec.datetime > checkpoint.datetime:
-                aggregate.print(checkpoint)
-                aggregate.reset()
+            if rec is None:
+                continue
 
-                filler = checkpoint
-                checkpoint = generator.enclosing_localised_datetime(rec)
+            # report and append...
+            for checkpoint, report in stream.append(rec, datum):
+                if writers:
+                    writers[checkpoint].write(JSONCodec.dumps(report))
+                else:
+                    stdout.print(JSONCodec.dumps(stream.tagged(checkpoint, report) if tagged else report))
 
-                # fill missing...
-                while cmd.fill:
-                    filler = generator.next_localised_datetime(filler)
+                output_count += 1
 
-                    if filler >= checkpoint:
-                        break
+            processed_count += 1
 
-                    aggregate.print(filler)
+        # save or report remainder...
+        if cmd.state is not None:
+            stream.save(cmd.state)
 
-            # append sample...
-            aggregate.append(rec, datum)
+        else:
+            for checkpoint, report in stream.close():
+                if writers:
+                    writers[checkpoint].write(JSONCodec.dumps(report))
+                else:
+                    stdout.print(JSONCodec.dumps(stream.tagged(checkpoint, report) if tagged else report))
 
-            processed_count += 1
-
-        # report remainder...
-        if aggregate.has_value():
-            aggregate.print(checkpoint)
+                output_count += 1
 
 
     # ----------------------------------------------------------------------------------------------------------------
     # end...
 
+    except IndexError as ex:
+        print("sample_aggregate: IndexError: %s" % ex, file=sys.stderr)
+        exit(1)
+
     except KeyboardInterrupt:
         if cmd.verbose:
             print("sample_aggregate: KeyboardInterrupt", file=sys.stderr)
 
     finally:
-        if cmd.verbose:
-            output_count = 0 if aggregate is None else aggregate.output_count
+        for writer in writers.values():
+            writer.close()
 
+        if cmd.lateness is not None and stream is not None:
+            for checkpoint, late_stream in stream.streams.items():
+                print("sample_aggregate: %s: late documents dropped: %d" % (checkpoint, late_stream.late_count),
+                      file=sys.stderr)
+
+        if cmd.verbose:
             print("sample_aggregate: documents: %d processed: %d output: %d" %
                   (document_count, processed_count, output_count), file=sys.stderr)
+
+            if cmd.group_by is not None and stream is not None:
+                for checkpoint, grouped in stream.streams.items():
+                    print("sample_aggregate: %s: groups: %d" % (checkpoint, len(grouped)), file=sys.stderr)
@@ -20,8 +20,11 @@ leaf node is recreated as the dictionary {rh: RH_VALUE, ah: AH_VALUE} - see exam
 
 The conversion equation used by sample_ah does not take account of atmospheric pressure.
 
+For large files, the --workers flag spreads the documents over a pool of processes. The output is in input order,
+and is the same as that of a single process, which remains the default for live streams.
+
 SYNOPSIS
-sample_ah.py [-v] RH_PATH T_PATH
+sample_ah.py [-w WORKERS] [-v] RH_PATH T_PATH
 
 EXAMPLES
 csv_reader.py climate.csv | sample_ah.py val.hmd val.tmp
@@ -42,13 +45,87 @@ https://www.aqua-calc.com/calculate/humidity
 import sys
 
 from scs_analysis.cmd.cmd_sample_ah import CmdSampleAH
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.parallel_map import ParallelMap
 
 from scs_core.climate.absolute_humidity import AbsoluteHumidity
 
-from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
 
 
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleAH(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, rh_path, t_path):
+        """
+        Constructor
+        """
+        self.__rh_path = rh_path
+        self.__t_path = t_path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, line):
+        # (is document, output JSON or None) - raises ValueError for malformed values...
+        jstr = line.strip()
+        datum = JSONCodec.path_dict(jstr)
+
+        if datum is None:
+            return False, None
+
+        paths = datum.paths()
+
+        # rH / t...
+        if self.__rh_path not in paths or self.__t_path not in paths:
+            return True, None
+
+        rh_node = datum.node(self.__rh_path)
+        t_node = datum.node(self.__t_path)
+
+        if rh_node == '' or t_node == '':
+            return True, None
+
+        try:
+            rh = float(rh_node)
+        except ValueError:
+            raise ValueError("invalid value for rH in %s" % jstr)
+
+        try:
+            t = float(t_node)
+        except ValueError:
+            raise ValueError("invalid value for t in %s" % jstr)
+
+        # compute...
+        ah = round(AbsoluteHumidity.from_rh_t(rh, t), 3)                    # report to 0.001 g / m3
+
+        # copy...
+        target = PathDict()
+
+        for path in paths:
+            if path == self.__rh_path:
+                target.append(path + '.rH', rh)
+                target.append(path + '.aH', ah)
+
+            else:
+                target.append(path, datum.node(path))
+
+        return True, JSONCodec.dumps(target.node())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleAH:{rh_path:%s, t_path:%s}" % (self.__rh_path, self.__t_path)
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
@@ -70,62 +147,38 @@ if __name__ == '__main__':
 
     try:
         # ------------------------------------------------------------------------------------------------------------
-        # run...
-
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
-            document_count += 1
+        # resources...
 
-            paths = datum.paths()
+        processor = ParallelMap(cmd.workers, SampleAH(cmd.rh_path, cmd.t_path).process)
 
-            # rH / t...
-            if cmd.rh_path not in paths or cmd.t_path not in paths:
-                continue
-
-            rh_node = datum.node(cmd.rh_path)
-            t_node = datum.node(cmd.t_path)
+        if cmd.verbose:
+            print("sample_ah: %s" % processor, file=sys.stderr)
+            sys.stderr.flush()
 
-            if rh_node == '' or t_node == '':
-                continue
+        stdout = OutputStream.construct()
 
-            try:
-                rh = float(rh_node)
-            except ValueError:
-                rh = None
-                print("sample_ah: invalid value for rH in %s" % jstr, file=sys.stderr)
-                exit(1)
 
-            try:
-                t = float(t_node)
-            except ValueError:
-                t = None
-                print("sample_ah: invalid value for t in %s" % jstr, file=sys.stderr)
-                exit(1)
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
 
-            # compute...
-            ah = round(AbsoluteHumidity.from_rh_t(rh, t), 3)                # report to 0.001 g / m3
+        try:
+            for is_document, jstr in processor.map(sys.stdin):
+                if not is_document:
+                    continue
 
-            # copy...
-            target = PathDict()
+                document_count += 1
 
-            for path in paths:
-                if path == cmd.rh_path:
-                    target.append(path + '.rH', rh)
-                    target.append(path + '.aH', ah)
+                if jstr is None:
+                    continue
 
-                else:
-                    target.append(path, datum.node(path))
+                # report...
+                stdout.print(jstr)
 
-            # report...
-            print(JSONify.dumps(target.node()))
-            sys.stdout.flush()
+                processed_count += 1
 
-            processed_count += 1
+        except ValueError as ex:
+            print("sample_ah: %s" % ex, file=sys.stderr)
+            exit(1)
 
 
     # ----------------------------------------------------------------------------------------------------------------
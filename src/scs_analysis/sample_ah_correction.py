@@ -36,8 +36,11 @@ weC must be presented as a voltage, and aH as grammes / cubic metre. The correct
 If fields are missing from the input document, then the document is ignored. If values are
 malformed, execution will terminate.
 
+The --workers flag may be used to correct a large file with a pool of processes. Documents are reported in input
+order, exactly as they would be by a single process.
+
 SYNOPSIS
-sample_ah_correction.py -s SENS_MV BASELINE -c WS WB [-v] GAS_SUB_PATH AH_PATH
+sample_ah_correction.py -s SENS_MV BASELINE -c WS WB [-w WORKERS] [-v] GAS_SUB_PATH AH_PATH
 
 EXAMPLES
 csv_reader.py brighton_gases-24h-1min-ah.csv | sample_ah_correction.py -s 0.295 0 -c 0 -10 -v val.NO2 val.sht.hmd.aH
@@ -60,13 +63,100 @@ https://github.com/south-coast-science/scs_dev/wiki/3:-Data-formats
 import sys
 
 from scs_analysis.cmd.cmd_sample_ah_correction import CmdSampleAhCorrection
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.parallel_map import ParallelMap
 
-from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
 
 from scs_core.gas.ah_correction import AhCorrection
 
 
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleAhCorrection(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, correction, gas_sub_path, ah_path):
+        """
+        Constructor
+        """
+        self.__correction = correction
+        self.__ah_path = ah_path
+
+        # self.__we_c_path = gas_sub_path + '.weC'
+
+        self.__cnc_path = gas_sub_path + '.cnc'
+        self.__cnc_corr_path = gas_sub_path + '.cnc-ah-corr'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, line):
+        # (is document, output JSON or None) - raises ValueError for malformed values...
+        jstr = line.strip()
+        datum = JSONCodec.path_dict(jstr)
+
+        if datum is None:
+            return False, None
+
+        paths = datum.paths()
+
+        # weC, aH...
+        if self.__cnc_path not in paths or self.__ah_path not in paths:        # we_c_path
+            return True, None
+
+        # we_c_node = datum.node(we_c_path)
+        cnc_node = datum.node(self.__cnc_path)
+        ah_node = datum.node(self.__ah_path)
+
+        if cnc_node == '' or ah_node == '':
+            return True, None
+
+        try:
+            cnc = float(cnc_node)
+        except ValueError:
+            raise ValueError("invalid value for weC in %s" % jstr)
+
+        try:
+            ah = float(ah_node)
+        except ValueError:
+            raise ValueError("invalid value for aH in %s" % jstr)
+
+        # compute...
+        cnc_ah_corr = round(self.__correction.ah_corr(cnc, ah), 1)            # report to 0.1 ppb
+
+        # corrected_sens = (-0.0152 * ah) + 0.2942            # mV
+        # corrected_baseline_offset = (-0.909 * ah) + 30.8    # ppb
+
+        # ubl = we_c / (corrected_sens / 1000.0)
+
+        # copy...
+        target = PathDict()
+
+        for path in paths:
+            target.append(path, datum.node(path))
+
+            if path == self.__cnc_path:
+                target.append(self.__cnc_corr_path, cnc_ah_corr)
+                # target.append(cmd.gas_sub_path + '.cs', corrected_sens)
+                # target.append(cmd.gas_sub_path + '.cbo', corrected_baseline_offset)
+                # target.append(cmd.gas_sub_path + '.ubl', ubl)
+
+        return True, JSONCodec.dumps(target.node())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleAhCorrection:{correction:%s, ah_path:%s, cnc_path:%s, cnc_corr_path:%s}" % \
+               (self.__correction, self.__ah_path, self.__cnc_path, self.__cnc_corr_path)
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
@@ -96,76 +186,36 @@ if __name__ == '__main__':
             print("sample_ah_correction: %s" % correction, file=sys.stderr)
             sys.stderr.flush()
 
-        # we_c_path = cmd.gas_sub_path + '.weC'
+        processor = ParallelMap(cmd.workers, SampleAhCorrection(correction, cmd.gas_sub_path, cmd.ah_path).process)
+
+        if cmd.verbose:
+            print("sample_ah_correction: %s" % processor, file=sys.stderr)
+            sys.stderr.flush()
 
-        cnc_path = cmd.gas_sub_path + '.cnc'
-        cnc_corr_path = cmd.gas_sub_path + '.cnc-ah-corr'
+        stdout = OutputStream.construct()
 
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
-            document_count += 1
-
-            paths = datum.paths()
-
-            # weC, aH...
-            if cnc_path not in paths or cmd.ah_path not in paths:       # we_c_path
-                continue
-
-            # we_c_node = datum.node(we_c_path)
-            cnc_node = datum.node(cnc_path)
-            ah_node = datum.node(cmd.ah_path)
-
-            if cnc_node == '' or ah_node == '':
-                continue
-
-            try:
-                cnc = float(cnc_node)
-            except ValueError:
-                cnc = None
-                print("sample_ah_correction: invalid value for weC in %s" % jstr, file=sys.stderr)
-                exit(1)
-
-            try:
-                ah = float(ah_node)
-            except ValueError:
-                ah = None
-                print("sample_ah_correction: invalid value for aH in %s" % jstr, file=sys.stderr)
-                exit(1)
-
-            # compute...
-            cnc_ah_corr = round(correction.ah_corr(cnc, ah), 1)                # report to 0.1 ppb
-
-            # corrected_sens = (-0.0152 * ah) + 0.2942            # mV
-            # corrected_baseline_offset = (-0.909 * ah) + 30.8    # ppb
-
-            # ubl = we_c / (corrected_sens / 1000.0)
+        try:
+            for is_document, jstr in processor.map(sys.stdin):
+                if not is_document:
+                    continue
 
-            # copy...
-            target = PathDict()
+                document_count += 1
 
-            for path in paths:
-                target.append(path, datum.node(path))
+                if jstr is None:
+                    continue
 
-                if path == cnc_path:
-                    target.append(cnc_corr_path, cnc_ah_corr)
-                    # target.append(cmd.gas_sub_path + '.cs', corrected_sens)
-                    # target.append(cmd.gas_sub_path + '.cbo', corrected_baseline_offset)
-                    # target.append(cmd.gas_sub_path + '.ubl', ubl)
+                # report...
+                stdout.print(jstr)
 
-            # report...
-            print(JSONify.dumps(target.node()))
-            sys.stdout.flush()
+                processed_count += 1
 
-            processed_count += 1
+        except ValueError as ex:
+            print("sample_ah_correction: %s" % ex, file=sys.stderr)
+            exit(1)
 
 
     # ----------------------------------------------------------------------------------------------------------------
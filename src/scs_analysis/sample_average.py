@@ -11,16 +11,28 @@ DESCRIPTION
 The sample_average utility is used to compute an average value for a stream of data delivered on stdin. This can be an
 average of all values, or a rolling average for a given number of values.
 
-Input data is typically in the form of a JSON document. A command parameter specifies the path to the node within
-the document that is to be averaged. The node is typically a leaf node integer or float. The output of the
-sample_average utility includes the source value, and the average value.
+Input data is typically in the form of a JSON document. Command parameters specify the paths to the nodes within
+the document that are to be averaged. A leaf node is typically an integer or float. An internal node stands for all of
+its numeric leaves, and if no path is given, all the numeric leaves of the document are averaged. Each leaf path has
+its own rolling average, and the outputs for all paths are merged into one document per input document. The output of
+the sample_average utility includes the source value, and the average value.
+
+The window may instead be given as a duration, with the --window flag. Each output is then computed over the samples
+whose rec falls within that duration, up to and including the current rec. This keeps a steady time scale where
+device intervals jitter, or where the data has gaps. Input must be in rec order.
 
 SYNOPSIS
-sample_average.py [-t TALLY] [-p PRECISION] [-v] [PATH]
+sample_average.py [{ -t TALLY | -w DURATION }] [-p PRECISION] [-v] [PATH_1 .. PATH_N]
 
 EXAMPLES
 osio_topic_history.py -m1 /orgs/south-coast-science-demo/brighton/loc/1/gases | sample_average.py -t3 -p1 val.CO.cnc
 
+osio_topic_history.py -m1 /orgs/south-coast-science-demo/brighton/loc/1/gases | \
+sample_average.py -t3 -p1 val.NO2.cnc val.Ox.cnc val.sht
+
+osio_topic_history.py -m60 /orgs/south-coast-science-demo/brighton/loc/1/gases | \
+sample_average.py -w 10 -p1 val.NO2.cnc
+
 DOCUMENT EXAMPLE - INPUT
 {"tag": "scs-bgx-401", "rec": "2018-03-27T09:54:41.042+00:00", "val": {
 "NO2": {"weV": 0.29563, "aeV": 0.280879, "weC": 0.009569, "cnc": 61.0},
@@ -36,9 +48,12 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_tally import CmdSampleTally
+from scs_analysis.helper.checkpoint_index import FastISO8601
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.rolling_filter import RollingFilter
+from scs_analysis.helper.running_sums import RunningAverage
 
-from scs_core.data.average import Average
-from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
 
 
@@ -51,28 +66,43 @@ class SampleAverage(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, path, tally, precision):
+    def __init__(self, nodes, tally, duration, precision):
         """
         Constructor
         """
-        self.__path = path
+        self.__duration = duration
         self.__precision = precision
 
-        self.__func = Average(tally)
+        self.__filter = RollingFilter(nodes, lambda path: RunningAverage(tally, duration))
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def datum(self, sample):
-        if not sample.has_path(self.__path):
-            return None
+        timestamp = None
+
+        if self.__duration is not None:
+            try:
+                rec = FastISO8601.construct(sample.node('rec'))
+            except KeyError:
+                return None
+
+            if rec is None:
+                return None
 
-        value = sample.node(self.__path)
-        self.__func.append(value)
+            timestamp = rec.timestamp()
 
-        avg = self.__func.compute()
+        averages = []
 
-        if avg is None:
+        for path, value, func in self.__filter.values(sample):
+            func.append(value, timestamp)
+
+            avg = func.compute()
+
+            if avg is not None:
+                averages.append((path, value, avg))
+
+        if not averages:
             return None
 
         target = PathDict()
@@ -80,8 +110,9 @@ class SampleAverage(object):
         if sample.has_path('rec'):
             target.copy(sample, 'rec')
 
-        target.append(self.__path + '.src', value)
-        target.append(self.__path + '.avg', round(avg, self.__precision))
+        for path, value, avg in averages:
+            target.append(path + '.src', value)
+            target.append(path + '.avg', round(avg, self.__precision))
 
         return target.node()
 
@@ -89,7 +120,8 @@ class SampleAverage(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "SampleAverage:{path:%s, precision:%s, func:%s}" % (self.__path, self.__precision, self.__func)
+        return "SampleAverage:{duration:%s, precision:%s, filter:%s}" % \
+               (self.__duration, self.__precision, self.__filter)
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -115,18 +147,20 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        sampler = SampleAverage(cmd.path, cmd.tally, cmd.precision)
+        sampler = SampleAverage(cmd.nodes, cmd.tally, cmd.duration, cmd.precision)
 
         if cmd.verbose:
             print("sample_average: %s" % sampler, file=sys.stderr)
             sys.stderr.flush()
 
+        stdout = OutputStream.construct()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
         for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
+            datum = JSONCodec.path_dict(line)
 
             if datum is None:
                 continue
@@ -136,8 +170,7 @@ if __name__ == '__main__':
             average = sampler.datum(datum)
 
             if average is not None:
-                print(JSONify.dumps(average))
-                sys.stdout.flush()
+                stdout.print(JSONCodec.dumps(average))
 
             processed_count += 1
 
@@ -145,6 +178,10 @@ if __name__ == '__main__':
     # ----------------------------------------------------------------------------------------------------------------
     # end...
 
+    except IndexError as ex:
+        print("sample_average: IndexError: %s" % ex, file=sys.stderr)
+        exit(1)
+
     except KeyboardInterrupt:
         if cmd.verbose:
             print("sample_average: KeyboardInterrupt", file=sys.stderr)
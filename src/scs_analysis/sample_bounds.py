@@ -39,9 +39,10 @@ csv_reader.py praxis_303.csv | sample_bounds.py -v -i -l 2018-09-26T00:00:00Z -u
 import sys
 
 from scs_analysis.cmd.cmd_sample_bounds import CmdSampleBounds
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
 
 from scs_core.data.datum import Datum
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -84,13 +85,15 @@ if __name__ == '__main__':
             print("sample_bounds: invalid value for upper bound: %s" % ex, file=sys.stderr)
             exit(2)
 
+        stdout = OutputStream.construct()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
         for line in sys.stdin:
             jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
+            datum = JSONCodec.path_dict(jstr)
 
             if datum is None:
                 continue
@@ -131,8 +134,7 @@ if __name__ == '__main__':
                 continue
 
             # report...
-            print(jstr)
-            sys.stdout.flush()
+            stdout.print(jstr)
 
             output_count += 1
 
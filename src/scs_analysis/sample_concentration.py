@@ -19,8 +19,10 @@ The path for the node in the output document indicating concentration is based o
 input document indicating density. For example, if the input path is SUB-PATH.dns, the output path is SUB-PATH.cnc. If
 a SUB-PATH.cnc field exists in the input document, it is overwritten.
 
+Large files may be processed by a pool of processes, with the --workers flag. The output is in input order.
+
 SYNOPSIS
-sample_concentration.py [-v] GAS DENSITY_PATH T_PATH [{P_PATH | -p PRESSURE}]
+sample_concentration.py [-w WORKERS] [-v] GAS DENSITY_PATH T_PATH [{P_PATH | -p PRESSURE}]
 
 EXAMPLES
 csv_reader.py joined_2019-02.csv | sample_concentration.py -v NO2 ref.val.NO2.dns praxis.val.sht.tmp
@@ -42,8 +44,10 @@ http://www.apis.ac.uk/unit-conversion
 import sys
 
 from scs_analysis.cmd.cmd_sample_concentration import CmdSampleConcentration
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.parallel_map import ParallelMap
 
-from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
 
 from scs_core.gas.gas import Gas
@@ -51,11 +55,104 @@ from scs_core.gas.gas import Gas
 
 # --------------------------------------------------------------------------------------------------------------------
 
-if __name__ == '__main__':
+class SampleConcentration(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, gas, density_path, t_path, p_path, pressure):
+        """
+        Constructor
+        """
+        self.__gas = gas
+        self.__density_path = density_path
+        self.__t_path = t_path
+        self.__p_path = p_path
+        self.__pressure = pressure
+
+        density_nodes = density_path.split('.')
+        self.__concentration_path = '.'.join(density_nodes[:-1] + ['cnc'])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, line):
+        # (is document, output JSON or None) - raises ValueError for malformed values...
+        jstr = line.strip()
+        datum = JSONCodec.path_dict(jstr)
+
+        if datum is None:
+            return False, None
+
+        paths = datum.paths()
+
+        # density / t...
+        if self.__density_path not in paths or self.__t_path not in paths:
+            return True, None
+
+        density_node = datum.node(self.__density_path)
+        t_node = datum.node(self.__t_path)
+
+        if density_node == '' or t_node == '':
+            return True, None
+
+        try:
+            density = float(density_node)
+        except ValueError:
+            raise ValueError("invalid value for density in %s" % jstr)
+
+        try:
+            t = float(t_node)
+        except ValueError:
+            raise ValueError("invalid value for t in %s" % jstr)
+
+        # p...
+        if self.__p_path:
+            p_node = datum.node(self.__p_path)
+
+            if p_node == '':
+                return True, None
+
+            try:
+                p = float(p_node)
+            except ValueError:
+                raise ValueError("invalid value for p in %s" % jstr)
+
+        else:
+            p = self.__pressure
+
+        # compute...
+        cnc = round(Gas.concentration(self.__gas, density, t, p), 1)
+
+        # copy...
+        target = PathDict()
+
+        for path in paths:
+            if path == self.__concentration_path:
+                continue
+
+            target.append(path, datum.node(path))
+
+            if path == self.__density_path:
+                target.append(self.__concentration_path, cnc)
+
+        return True, JSONCodec.dumps(target)
+
 
-    density = None
-    t = None
-    p = None
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleConcentration:{gas:%s, density_path:%s, t_path:%s, p_path:%s, pressure:%s, " \
+               "concentration_path:%s}" % \
+               (self.__gas, self.__density_path, self.__t_path, self.__p_path, self.__pressure,
+                self.__concentration_path)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
 
     document_count = 0
     processed_count = 0
@@ -80,82 +177,37 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        density_nodes = cmd.density_path.split('.')
-        concentration_path = '.'.join(density_nodes[:-1] + ['cnc'])
-
-
-        # ------------------------------------------------------------------------------------------------------------
-        # run...
-
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
-            document_count += 1
-
-            paths = datum.paths()
+        concentration = SampleConcentration(cmd.gas, cmd.density_path, cmd.t_path, cmd.p_path, cmd.pressure)
+        processor = ParallelMap(cmd.workers, concentration.process)
 
-            # density / t...
-            if cmd.density_path not in paths or cmd.t_path not in paths:
-                continue
-
-            density_node = datum.node(cmd.density_path)
-            t_node = datum.node(cmd.t_path)
+        if cmd.verbose:
+            print("sample_concentration: %s" % processor, file=sys.stderr)
+            sys.stderr.flush()
 
-            if density_node == '' or t_node == '':
-                continue
+        stdout = OutputStream.construct()
 
-            try:
-                density = float(density_node)
-            except ValueError:
-                print("sample_concentration: invalid value for density in %s" % jstr, file=sys.stderr)
-                exit(1)
 
-            try:
-                t = float(t_node)
-            except ValueError:
-                print("sample_concentration: invalid value for t in %s" % jstr, file=sys.stderr)
-                exit(1)
-
-            # p...
-            if cmd.p_path:
-                p_node = datum.node(cmd.p_path)
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
 
-                if p_node == '':
+        try:
+            for is_document, jstr in processor.map(sys.stdin):
+                if not is_document:
                     continue
 
-                try:
-                    p = float(p_node)
-                except ValueError:
-                    print("sample_concentration: invalid value for p in %s" % jstr, file=sys.stderr)
-                    exit(1)
-
-            else:
-                p = cmd.pressure
+                document_count += 1
 
-            # compute...
-            cnc = round(Gas.concentration(cmd.gas, density, t, p), 1)
-
-            # copy...
-            target = PathDict()
-
-            for path in paths:
-                if path == concentration_path:
+                if jstr is None:
                     continue
 
-                target.append(path, datum.node(path))
-
-                if path == cmd.density_path:
-                    target.append(concentration_path, cnc)
+                # report...
+                stdout.print(jstr)
 
-            # report...
-            print(JSONify.dumps(target))
-            sys.stdout.flush()
+                processed_count += 1
 
-            processed_count += 1
+        except ValueError as ex:
+            print("sample_concentration: %s" % ex, file=sys.stderr)
+            exit(1)
 
 
     # ----------------------------------------------------------------------------------------------------------------
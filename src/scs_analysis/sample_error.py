@@ -16,8 +16,11 @@ Input data is typically in the form of a JSON document. A command parameter spec
 the document that is to be examined. The node is typically a leaf node integer or float. The output of the
 sample_error utility includes the source value, aggregate, and the error.
 
+For offline reprocessing, the --batch flag reads the input in blocks of documents, and handles the path as a column.
+The aggregate is carried from block to block, so the output is identical to that of streaming mode.
+
 SYNOPSIS
-sample_error.py [-p PRECISION] [-v] [PATH]
+sample_error.py [-b] [-p PRECISION] [-v] [PATH]
 
 EXAMPLES
 osio_topic_history.py -m1 /orgs/south-coast-science-demo/brighton/loc/1/gases | sample_error.py -p3 val.CO.cnc
@@ -37,8 +40,10 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_filter import CmdSampleFilter
+from scs_analysis.helper.batch_filter import BatchFilter, ErrorRecurrence
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
 
-from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
 
 
@@ -58,20 +63,19 @@ class SampleError(object):
         self.__path = path
         self.__precision = precision
 
-        self.__aggregate = None
+        self.__recurrence = ErrorRecurrence()
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def datum(self, sample):
         latest = float(sample.node(self.__path))
+        aggregate = self.__recurrence.compute(latest)
 
-        if self.__aggregate is None:
-            self.__aggregate = latest
+        if aggregate is None:
             return None
 
-        self.__aggregate = (0.9 * self.__aggregate) + (0.1 * latest)
-        error = latest - self.__aggregate
+        error = latest - aggregate
 
         target = PathDict()
 
@@ -79,7 +83,7 @@ class SampleError(object):
             target.copy(sample, 'rec')
 
         target.append(self.__path + '.src', latest)
-        target.append(self.__path + '.agr', round(self.__aggregate, self.__precision))
+        target.append(self.__path + '.agr', round(aggregate, self.__precision))
         target.append(self.__path + '.err', round(error, self.__precision))
 
         return target.node()
@@ -89,13 +93,13 @@ class SampleError(object):
 
     @property
     def aggregate(self):
-        return self.__aggregate
+        return self.__recurrence.aggregate
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        aggregate = "None" if self.__aggregate is None else format(self.__aggregate, '.6f')
+        aggregate = "None" if self.aggregate is None else format(self.aggregate, '.6f')
 
         return "SampleError:{path:%s, precision:%s, aggregate:%s}" % (self.__path, self.__precision, aggregate)
 
@@ -119,31 +123,69 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        err = SampleError(cmd.path, cmd.precision)
+        if cmd.batch:
+            err = BatchFilter([cmd.path], lambda path: ErrorRecurrence())
+        else:
+            err = SampleError(cmd.path, cmd.precision)
 
         if cmd.verbose:
             print("sample_error: %s" % err, file=sys.stderr)
             sys.stderr.flush()
 
+        stdout = OutputStream.construct()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
+        if cmd.batch:
+            for documents in err.chunks(sys.stdin):
+                document_count += len(documents)
+
+                layout, columns = err.columns(documents)
+                lines = {}
+
+                for path, (values, recurrence) in columns.items():
+                    latest = [float(value) for value in values]
+                    lines[path] = (latest, recurrence.line(latest))
+
+                for document, cells in zip(documents, BatchFilter.cells(layout)):
+                    target = None
+
+                    for path, index in cells:
+                        latest, aggregates = lines[path]
+                        aggregate = aggregates[index]
+
+                        if aggregate is None:
+                            continue                        # the aggregate is set by the first value
+
+                        if target is None:
+                            target = BatchFilter.target(document)
+
+                        BatchFilter.insert(target, path, (('src', latest[index]),
+                                                          ('agr', round(aggregate, cmd.precision)),
+                                                          ('err', round(latest[index] - aggregate, cmd.precision))))
+
+                    if target is not None:
+                        stdout.print(JSONCodec.dumps(target))
+
+                    processed_count += 1
+
+        else:
+            for line in sys.stdin:
+                datum = JSONCodec.path_dict(line)
 
-            if datum is None:
-                continue
+                if datum is None:
+                    continue
 
-            document_count += 1
+                document_count += 1
 
-            error_datum = err.datum(datum)
+                error_datum = err.datum(datum)
 
-            if error_datum is not None:
-                print(JSONify.dumps(error_datum))
-                sys.stdout.flush()
+                if error_datum is not None:
+                    stdout.print(JSONCodec.dumps(error_datum))
 
-            processed_count += 1
+                processed_count += 1
 
         if cmd.verbose:
             print(err, file=sys.stderr)
@@ -36,11 +36,11 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_interval import CmdSampleInterval
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
 
 from scs_core.data.interval import Interval
-from scs_core.data.json import JSONify
 from scs_core.data.localized_datetime import LocalizedDatetime
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -60,6 +60,8 @@ if __name__ == '__main__':
         sys.stderr.flush()
 
 
+    stdout = OutputStream.construct()
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -70,7 +72,7 @@ if __name__ == '__main__':
             if cmd.verbose:
                 print(line, file=sys.stderr)
 
-            datum = PathDict.construct_from_jstr(line)
+            datum = JSONCodec.path_dict(line)
 
             if datum is None:
                 break
@@ -80,8 +82,7 @@ if __name__ == '__main__':
             time = LocalizedDatetime.construct_from_iso8601(datum.node(cmd.path))
 
             interval = Interval.construct(prev_time, time, cmd.precision)
-            print(JSONify.dumps(interval))
-            sys.stdout.flush()
+            stdout.print(JSONCodec.dumps(interval))
 
             prev_time = time
 
@@ -22,9 +22,12 @@ All fields in the input document are presented in the output document, with the
 datetime fields. The default name for the ISO 8601 datetime output field is 'rec' but an alternate name may be
 specified.
 
+The --workers flag may be used to convert a large file with a pool of processes. The output is in input order, and
+execution terminates at the first missing or malformed field, as it would with a single process.
+
 SYNOPSIS
 sample_iso_8601.py { -z | -f DATE_FORMAT [-t TIMEZONE_NAME [-u]] [-i ISO_PATH]
-{ DATETIME_PATH | DATE_PATH TIME_PATH } } [-v]
+{ DATETIME_PATH | DATE_PATH TIME_PATH } } [-w WORKERS] [-v]
 
 EXAMPLES
 csv_reader.py 15_min_Praxis_LHR2.csv -l10 | sample_iso_8601.py -v -f DD/MM/YYYY "Max of Time" -t Europe/Athens -u
@@ -47,14 +50,104 @@ https://github.com/south-coast-science/scs_dev/wiki/3:-Data-formats
 import sys
 
 from scs_analysis.cmd.cmd_sample_iso_8601 import CmdSampleISO8601
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.parallel_map import ParallelMap
 
-from scs_core.data.json import JSONify
 from scs_core.data.localized_datetime import DateParser, LocalizedDatetime
 from scs_core.data.path_dict import PathDict
 
 from scs_core.location.timezone import Timezone
 
 
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleISO8601(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, parser, zone, utc, iso, datetime_path, date_path, time_path):
+        """
+        Constructor
+        """
+        self.__parser = parser                              # DateParser
+        self.__zone = zone                                  # string (None for UTC)
+        self.__utc = utc                                    # bool - shift to UTC
+
+        self.__iso = iso                                    # string
+        self.__datetime_path = datetime_path                # string (None if date and time paths are given)
+        self.__date_path = date_path                        # string
+        self.__time_path = time_path                        # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, line):
+        # (is document, output JSON or None) - raises ValueError for missing or malformed fields...
+        jstr = line.strip()
+        datum = JSONCodec.path_dict(jstr)
+
+        if datum is None:
+            return False, None
+
+        paths = datum.paths()
+
+        # date / time...
+        if self.__datetime_path is not None:
+            if self.__datetime_path not in paths:
+                raise ValueError("datetime path '%s' not in %s" % (self.__datetime_path, jstr))
+
+            pieces = datum.node(self.__datetime_path).split(' ')
+
+            if len(pieces) != 2:
+                raise ValueError("malformed datetime '%s' in %s" % (self.__datetime_path, jstr))
+
+            date = pieces[0].strip()
+            time = pieces[1].strip()
+
+        else:
+            if self.__date_path not in paths:
+                raise ValueError("date path '%s' not in %s" % (self.__date_path, jstr))
+
+            if self.__time_path not in paths:
+                raise ValueError("time path '%s' not in %s" % (self.__time_path, jstr))
+
+            date = datum.node(self.__date_path)
+            time = datum.node(self.__time_path)
+
+        # ISO 8601...
+        iso = LocalizedDatetime.construct_from_date_time(self.__parser, date, time, tz=self.__zone)
+
+        if iso is None:
+            raise ValueError("malformed datetime in %s" % jstr)
+
+        if self.__zone is not None and self.__utc:
+            iso = iso.utc()
+
+        target = PathDict()
+        target.append(self.__iso, iso.as_iso8601())
+
+        # copy...
+        datetime_paths = (self.__iso, self.__datetime_path, self.__date_path, self.__time_path)
+
+        for path in paths:
+            if path not in datetime_paths:
+                target.append(path, datum.node(path))
+
+        return True, JSONCodec.dumps(target)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleISO8601:{parser:%s, zone:%s, utc:%s, iso:%s, datetime_path:%s, date_path:%s, time_path:%s}" % \
+               (self.__parser, self.__zone, self.__utc, self.__iso, self.__datetime_path, self.__date_path,
+                self.__time_path)
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
@@ -105,6 +198,15 @@ if __name__ == '__main__':
                 print("sample_iso_8601: %s" % timezone, file=sys.stderr)
                 sys.stderr.flush()
 
+        converter = SampleISO8601(parser, zone, cmd.utc, cmd.iso, cmd.datetime_path, cmd.date_path, cmd.time_path)
+        processor = ParallelMap(cmd.workers, converter.process)
+
+        if cmd.verbose:
+            print("sample_iso_8601: %s" % processor, file=sys.stderr)
+            sys.stderr.flush()
+
+        stdout = OutputStream.construct()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -114,67 +216,21 @@ if __name__ == '__main__':
                 print(zone, file=sys.stderr)
             exit(0)
 
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
-            document_count += 1
-
-            paths = datum.paths()
-
-            # date / time...
-            if cmd.uses_datetime():
-                if cmd.datetime_path not in paths:
-                    print("sample_iso_8601: datetime path '%s' not in %s" % (cmd.datetime_path, jstr), file=sys.stderr)
-                    exit(1)
-
-                pieces = datum.node(cmd.datetime_path).split(' ')
-
-                if len(pieces) != 2:
-                    print("sample_iso_8601: malformed datetime '%s' in %s" % (cmd.datetime_path, jstr), file=sys.stderr)
-                    exit(1)
-
-                date = pieces[0].strip()
-                time = pieces[1].strip()
-
-            else:
-                if cmd.date_path not in paths:
-                    print("sample_iso_8601: date path '%s' not in %s" % (cmd.date_path, jstr), file=sys.stderr)
-                    exit(1)
-
-                if cmd.time_path not in paths:
-                    print("sample_iso_8601: time path '%s' not in %s" % (cmd.time_path, jstr), file=sys.stderr)
-                    exit(1)
-
-                date = datum.node(cmd.date_path)
-                time = datum.node(cmd.time_path)
-
-            # ISO 8601...
-            iso = LocalizedDatetime.construct_from_date_time(parser, date, time, tz=zone)
-
-            if iso is None:
-                print("sample_iso_8601: malformed datetime in %s" % jstr, file=sys.stderr)
-                exit(1)
-
-            if cmd.timezone is not None and cmd.utc:
-                iso = iso.utc()
+        try:
+            for is_document, jstr in processor.map(sys.stdin):
+                if not is_document:
+                    continue
 
-            target = PathDict()
-            target.append(cmd.iso, iso.as_iso8601())
+                document_count += 1
 
-            # copy...
-            for path in paths:
-                if path not in cmd.datetime_paths():
-                    target.append(path, datum.node(path))
+                # report...
+                stdout.print(jstr)
 
-            # report...
-            print(JSONify.dumps(target))
-            sys.stdout.flush()
+                processed_count += 1
 
-            processed_count += 1
+        except ValueError as ex:
+            print("sample_iso_8601: %s" % ex, file=sys.stderr)
+            exit(1)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -11,12 +11,17 @@ DESCRIPTION
 The sample_low_pass utility provides a rolling exponential average or low pass filter. The user must specify the
 sampling interval in seconds, together with the cut-off frequency.
 
-Input data is typically in the form of a JSON document. A command parameter specifies the path to the node within
-the document that is to be filtered. The node is typically a leaf node integer or float. The output of the
+Input data is typically in the form of a JSON document. Command parameters specify the paths to the nodes within
+the document that are to be filtered. A leaf node is typically an integer or float. An internal node stands for all of
+its numeric leaves, and if no path is given, all the numeric leaves of the document are filtered. Each leaf path has
+its own filter, and the outputs for all paths are merged into one document per input document. The output of the
 sample_low_pass utility includes the source value, and the smoothed value.
 
+For offline reprocessing, the --batch flag reads the input in blocks of documents, and filters each path as a column.
+The state of each filter is carried from block to block, so the output is identical to that of streaming mode.
+
 SYNOPSIS
-sample_low_pass.py -d DELTA_T -c CUT_OFF [-p PRECISION] [-v] [PATH]
+sample_low_pass.py -d DELTA_T -c CUT_OFF [-b] [-p PRECISION] [-v] [PATH_1 .. PATH_N]
 
 EXAMPLES
 osio_topic_history.py -m60 /orgs/south-coast-science-demo/brighton/loc/1/gases | \
@@ -41,8 +46,11 @@ https://www.embeddedrelated.com/showarticle/779.php
 import sys
 
 from scs_analysis.cmd.cmd_sample_low_pass import CmdLowPass
+from scs_analysis.helper.batch_filter import BatchFilter, LowPassRecurrence
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.rolling_filter import RollingFilter
 
-from scs_core.data.json import JSONify
 from scs_core.data.low_pass_filter import LowPassFilter
 from scs_core.data.path_dict import PathDict
 
@@ -70,46 +78,82 @@ if __name__ == '__main__':
     # ----------------------------------------------------------------------------------------------------------------
     # resources...
 
-    lpf = LowPassFilter.construct(cmd.delta, cmd.cut_off)
+    if cmd.batch:
+        lpfs = BatchFilter(cmd.nodes, lambda path: LowPassRecurrence.construct(cmd.delta, cmd.cut_off))
+    else:
+        lpfs = RollingFilter(cmd.nodes, lambda path: LowPassFilter.construct(cmd.delta, cmd.cut_off))
 
     if cmd.verbose:
-        print("sample_low_pass: %s" % lpf, file=sys.stderr)
+        print("sample_low_pass: %s" % lpfs, file=sys.stderr)
         sys.stderr.flush()
 
+    stdout = OutputStream.construct()
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
+        if cmd.batch:
+            for documents in lpfs.chunks(sys.stdin, strict=True):
+                layout, columns = lpfs.columns(documents)
+
+                # as streaming mode, the run ends at the first document without values...
+                end = next((row for row, paths in enumerate(layout) if not paths), len(documents))
+                document_count += min(end + 1, len(documents))
+
+                lines = {path: (values, lpf.line(values))
+                         for path, (values, lpf) in columns.items()}
+
+                for row, cells in zip(range(end), BatchFilter.cells(layout)):
+                    target = BatchFilter.target(documents[row])
+
+                    for path, index in cells:
+                        values, path_lines = lines[path]
+                        BatchFilter.insert(target, path, (('src', values[index]),
+                                                          ('lpf', round(path_lines[index], cmd.precision))))
 
-            if datum is None:
-                break
+                    stdout.print(JSONCodec.dumps(target))
 
-            document_count += 1
+                    processed_count += 1
 
-            value = datum.node(cmd.path)
+                if end < len(documents):
+                    break
 
-            if value is None:
-                break
+        else:
+            for line in sys.stdin:
+                datum = JSONCodec.path_dict(line)
 
-            target = PathDict()
+                if datum is None:
+                    break
 
-            if datum.has_path('rec'):
-                target.copy(datum, 'rec')
+                document_count += 1
 
-            target.append(cmd.path + '.src', value)
-            target.append(cmd.path + '.lpf', round(lpf.line(value), cmd.precision))
+                lines = [(path, value, lpf.line(value)) for path, value, lpf in lpfs.values(datum)]
 
-            print(JSONify.dumps(target.node()))
-            sys.stdout.flush()
+                if not lines:
+                    break
 
-            processed_count += 1
+                target = PathDict()
+
+                if datum.has_path('rec'):
+                    target.copy(datum, 'rec')
+
+                for path, value, line in lines:
+                    target.append(path + '.src', value)
+                    target.append(path + '.lpf', round(line, cmd.precision))
+
+                stdout.print(JSONCodec.dumps(target.node()))
+
+                processed_count += 1
 
 
     # ----------------------------------------------------------------------------------------------------------------
     # end...
 
+    except IndexError as ex:
+        print("sample_low_pass: IndexError: %s" % ex, file=sys.stderr)
+        exit(1)
+
     except KeyboardInterrupt:
         if cmd.verbose:
             print("sample_low_pass: KeyboardInterrupt", file=sys.stderr)
@@ -10,14 +10,17 @@ source repo: scs_analysis
 DESCRIPTION
 The sample_median utility provides a median filter - the filter maintains an odd-numbered window on the input
 data sequence, and outputs the middle item in the sorted list of items. The user can specify the
-size of the window.
+size of the window. Wide windows, such as -w 301 over 1-second data, are handled without re-sorting the window for
+each sample, so the cost of the filter grows only slowly with the size of the window.
 
-Input data is typically in the form of a JSON document. A command parameter specifies the path to the node within
-the document that is to be filtered. The node is typically a leaf node integer or float. The output of the
+Input data is typically in the form of a JSON document. Command parameters specify the paths to the nodes within
+the document that are to be filtered. A leaf node is typically an integer or float. An internal node stands for all of
+its numeric leaves, and if no path is given, all the numeric leaves of the document are filtered. Each leaf path has
+its own window, and the outputs for all paths are merged into one document per input document. The output of the
 sample_median utility includes the source value, and the smoothed value.
 
 SYNOPSIS
-sample_median.py [-w SIZE] [-p PRECISION] [-v] [PATH]
+sample_median.py [-w SIZE] [-p PRECISION] [-v] [PATH_1 .. PATH_N]
 
 EXAMPLES
 osio_topic_history.py -m60 /orgs/south-coast-science-demo/brighton/loc/1/gases | \
@@ -42,9 +45,11 @@ https://en.wikipedia.org/wiki/Median_filter
 import sys
 
 from scs_analysis.cmd.cmd_sample_median import CmdSampleMedian
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.rolling_filter import RollingFilter
+from scs_analysis.helper.rolling_median import RollingMedian
 
-from scs_core.data.json import JSONify
-from scs_core.data.median_filter import MedianFilter
 from scs_core.data.path_dict import PathDict
 
 
@@ -71,27 +76,30 @@ if __name__ == '__main__':
     # ----------------------------------------------------------------------------------------------------------------
     # resources...
 
-    median_filter = MedianFilter(cmd.window)
+    median_filters = RollingFilter(cmd.nodes, lambda path: RollingMedian.construct(cmd.window))
 
     if cmd.verbose:
-        print("sample_median: %s" % median_filter, file=sys.stderr)
+        print("sample_median: %s" % median_filters, file=sys.stderr)
         sys.stderr.flush()
 
+    stdout = OutputStream.construct()
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
         for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
+            datum = JSONCodec.path_dict(line)
 
             if datum is None:
                 continue
 
             document_count += 1
 
-            value = datum.node(cmd.path)
+            medians = [(path, value, median_filter.compute(value))
+                       for path, value, median_filter in median_filters.values(datum)]
 
-            if value is None:
+            if not medians:
                 continue
 
             target = PathDict()
@@ -99,11 +107,11 @@ if __name__ == '__main__':
             if datum.has_path('rec'):
                 target.copy(datum, 'rec')
 
-            target.append(cmd.path + '.src', value)
-            target.append(cmd.path + '.med', round(median_filter.compute(value), cmd.precision))
+            for path, value, med in medians:
+                target.append(path + '.src', value)
+                target.append(path + '.med', round(med, cmd.precision))
 
-            print(JSONify.dumps(target.node()))
-            sys.stdout.flush()
+            stdout.print(JSONCodec.dumps(target.node()))
 
             processed_count += 1
 
@@ -111,6 +119,10 @@ if __name__ == '__main__':
     # ----------------------------------------------------------------------------------------------------------------
     # end...
 
+    except IndexError as ex:
+        print("sample_median: IndexError: %s" % ex, file=sys.stderr)
+        exit(1)
+
     except KeyboardInterrupt:
         if cmd.verbose:
             print("sample_median: KeyboardInterrupt", file=sys.stderr)
@@ -11,12 +11,21 @@ DESCRIPTION
 The sample_midpoint utility computes a linear regression for a stream of data delivered on stdin, it then finds the
 midpoint y value. This is similar to an averaging function, but is independent of sampling jitter.
 
-Input data is typically in the form of a JSON document. A command parameter specifies the path to the node within
-the document that is to be averaged. The node is typically a leaf node integer or float. The output of the
+Input data is typically in the form of a JSON document. Command parameters specify the paths to the nodes within
+the document that are to be averaged. A leaf node is typically an integer or float. An internal node stands for all of
+its numeric leaves, and if no path is given, all the numeric leaves of the document are averaged. Each leaf path has
+its own regression, and the outputs for all paths are merged into one document per input document. The output of the
 sample_midpoint utility includes the source value, and the midpoint value.
 
+The mid-rec field gives the midpoint datetime of the first path reported. Where the regression of any other path has
+a different midpoint datetime - because it has seen fewer values - that path also reports its own mid-rec.
+
+The window may instead be given as a duration, with the --window flag. Each output is then computed over the samples
+whose rec falls within that duration, up to and including the current rec. This keeps a steady time scale where
+device intervals jitter, or where the data has gaps. Input must be in rec order.
+
 SYNOPSIS
-sample_midpoint.py [-t TALLY] [-p PRECISION] [-v] [PATH]
+sample_midpoint.py [{ -t TALLY | -w DURATION }] [-p PRECISION] [-v] [PATH_1 .. PATH_N]
 
 EXAMPLES
 osio_topic_history.py -m60 /orgs/south-coast-science-demo/brighton/loc/1/gases | \
@@ -39,9 +48,11 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_tally import CmdSampleTally
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.rolling_filter import RollingFilter
+from scs_analysis.helper.running_sums import RunningRegression
 
-from scs_core.data.json import JSONify
-from scs_core.data.linear_regression import LinearRegression
 from scs_core.data.localized_datetime import LocalizedDatetime
 from scs_core.data.path_dict import PathDict
 
@@ -55,47 +66,51 @@ class SampleMidpoint(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, path, tally, precision):
+    def __init__(self, nodes, tally, duration, precision):
         """
         Constructor
         """
-        self.__path = path
         self.__precision = precision
 
-        self.__func = LinearRegression(tally, False)
+        self.__filter = RollingFilter(nodes, lambda path: RunningRegression(tally, False, duration))
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def datum(self, sample):
-        if not sample.has_path(self.__path):
-            return None
-
         try:
             rec_node = sample.node('rec')
         except KeyError:
             return None
 
         rec = LocalizedDatetime.construct_from_jdict(rec_node)
-        value = sample.node(self.__path)
+        midpoints = []
 
-        self.__func.append(rec, value)
+        for path, value, func in self.__filter.values(sample):
+            func.append(rec, value)
 
-        if not self.__func.has_midpoint():
-            return None
+            if not func.has_midpoint():
+                continue
 
-        mid_rec, mid = self.__func.midpoint()
+            mid_rec, mid = func.midpoint()
+            midpoints.append((path, value, mid_rec, mid))
 
-        if rec is None:
+        if not midpoints or rec is None:
             return None
 
         target = PathDict()
 
+        first_mid_rec = midpoints[0][2].as_iso8601()
+
         target.append('rec', rec.as_iso8601())
-        target.append('mid-rec', mid_rec.as_iso8601())
+        target.append('mid-rec', first_mid_rec)
+
+        for path, value, mid_rec, mid in midpoints:
+            target.append(path + '.src', value)
+            target.append(path + '.mid', round(mid, self.__precision))
 
-        target.append(self.__path + '.src', value)
-        target.append(self.__path + '.mid', round(mid, self.__precision))
+            if mid_rec.as_iso8601() != first_mid_rec:
+                target.append(path + '.mid-rec', mid_rec.as_iso8601())
 
         return target.node()
 
@@ -103,7 +118,7 @@ class SampleMidpoint(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "SampleMidpoint:{path:%s, precision:%s, func:%s}" % (self.__path, self.__precision, self.__func)
+        return "SampleMidpoint:{precision:%s, filter:%s}" % (self.__precision, self.__filter)
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -129,18 +144,20 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        sampler = SampleMidpoint(cmd.path, cmd.tally, cmd.precision)
+        sampler = SampleMidpoint(cmd.nodes, cmd.tally, cmd.duration, cmd.precision)
 
         if cmd.verbose:
             print("sample_midpoint: %s" % sampler, file=sys.stderr)
             sys.stderr.flush()
 
+        stdout = OutputStream.construct()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
         for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
+            datum = JSONCodec.path_dict(line)
 
             if datum is None:
                 continue
@@ -150,8 +167,7 @@ if __name__ == '__main__':
             min_avg_max = sampler.datum(datum)
 
             if min_avg_max is not None:
-                print(JSONify.dumps(min_avg_max))
-                sys.stdout.flush()
+                stdout.print(JSONCodec.dumps(min_avg_max))
 
             processed_count += 1
 
@@ -159,6 +175,10 @@ if __name__ == '__main__':
     # ----------------------------------------------------------------------------------------------------------------
     # end...
 
+    except IndexError as ex:
+        print("sample_midpoint: IndexError: %s" % ex, file=sys.stderr)
+        exit(1)
+
     except KeyboardInterrupt:
         if cmd.verbose:
             print("sample_midpoint: KeyboardInterrupt", file=sys.stderr)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+DESCRIPTION
+The sample_multi_filter utility runs any combination of median, average, low pass and error filters over a stream of
+data delivered on stdin, and reports all of their outputs in a single document, in place of a pipeline of
+sample_median, sample_average, sample_low_pass and sample_error, and a csv_join of their results.
+
+Input data is typically in the form of a JSON document. Each command parameter specifies the path to a node within the
+document, and the filters to be run on it, as PATH=FILTER[,FILTER..]. The filters are:
+
+med:WINDOW - a rolling median over an odd WINDOW of samples, as sample_median
+avg:TALLY - a rolling average over TALLY samples, as sample_average
+lpf:DELTA_T:CUT_OFF - a low pass filter with the given sampling interval and cut-off frequency, as sample_low_pass
+err - an exponential average, and the error of the source value from it, as sample_error
+
+As for the single-filter utilities, an internal node stands for all of its numeric leaves, and an empty PATH stands
+for all the numeric leaves of the document. Each leaf has its own state for each filter. The output includes the
+source value, and the med, avg, lpf, agr and err values of the filters given. The error filter reports nothing for the
+first value of each leaf.
+
+SYNOPSIS
+sample_multi_filter.py [-p PRECISION] [-v] PATH=FILTER[,FILTER..] [PATH=FILTER[,FILTER..] ..]
+
+EXAMPLES
+osio_topic_history.py -m60 /orgs/south-coast-science-demo/brighton/loc/1/gases | \
+sample_multi_filter.py -p1 val.CO.cnc=med:5,avg:10,lpf:10.0:0.02,err
+
+DOCUMENT EXAMPLE - INPUT
+{"tag": "scs-bgx-401", "rec": "2018-03-27T09:54:41.042+00:00", "val": {
+"NO2": {"weV": 0.29563, "aeV": 0.280879, "weC": 0.009569, "cnc": 61.0},
+"Ox": {"weV": 0.406819, "aeV": 0.387443, "weC": -0.010706, "cnc": 34.7},
+"NO": {"weV": 0.319692, "aeV": 0.292129, "weC": 0.028952, "cnc": 165.5},
+"CO": {"weV": 0.395819, "aeV": 0.289317, "weC": 0.113108, "cnc": 311.3},
+"sht": {"hmd": 82.4, "tmp": 12.6}}}
+
+DOCUMENT EXAMPLE - OUTPUT
+{"rec": "2018-03-27T10:07:11.033+00:00", "val": {"CO": {"cnc": {"src": 263.0, "med": 254.1, "avg": 246.9, "lpf": 231.7,
+"agr": 194.7, "err": 68.3}}}}
+"""
+
+import sys
+
+from scs_analysis.cmd.cmd_sample_multi_filter import CmdSampleMultiFilter
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.multi_filter import MultiFilter
+from scs_analysis.helper.output_stream import OutputStream
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    document_count = 0
+    processed_count = 0
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdSampleMultiFilter()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("sample_multi_filter: %s" % cmd, file=sys.stderr)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        sampler = MultiFilter(cmd.specs, cmd.precision)
+
+        if cmd.verbose:
+            print("sample_multi_filter: %s" % sampler, file=sys.stderr)
+            sys.stderr.flush()
+
+        stdout = OutputStream.construct()
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        for line in sys.stdin:
+            datum = JSONCodec.path_dict(line)
+
+            if datum is None:
+                continue
+
+            document_count += 1
+
+            filtered = sampler.datum(datum)
+
+            if filtered is not None:
+                stdout.print(JSONCodec.dumps(filtered))
+
+            processed_count += 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except IndexError as ex:
+        print("sample_multi_filter: IndexError: %s" % ex, file=sys.stderr)
+        exit(1)
+
+    except KeyboardInterrupt:
+        if cmd.verbose:
+            print("sample_multi_filter: KeyboardInterrupt", file=sys.stderr)
+
+    finally:
+        if cmd.verbose:
+            print("sample_multi_filter: documents: %d processed: %d" % (document_count, processed_count),
+                  file=sys.stderr)
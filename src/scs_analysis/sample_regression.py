@@ -10,12 +10,18 @@ source repo: scs_analysis
 DESCRIPTION
 The sample_regression utility computes a linear regression for a stream of data delivered on stdin.
 
-Input data is typically in the form of a JSON document. A command parameter specifies the path to the node within
-the document that is to be averaged. The node is typically a leaf node integer or float. The output of the
-sample_regression utility includes the last source value, slope and intercept.
+Input data is typically in the form of a JSON document. Command parameters specify the paths to the nodes within
+the document that are to be regressed. A leaf node is typically an integer or float. An internal node stands for all
+of its numeric leaves, and if no path is given, all the numeric leaves of the document are regressed. Each leaf path
+has its own regression, and the outputs for all paths are merged into one document per input document. The output of
+the sample_regression utility includes the last source value, slope and intercept.
+
+The window may instead be given as a duration, with the --window flag. Each output is then computed over the samples
+whose rec falls within that duration, up to and including the current rec. This keeps a steady time scale where
+device intervals jitter, or where the data has gaps. Input must be in rec order.
 
 SYNOPSIS
-sample_regression.py [-t TALLY] [-p PRECISION] [-v] [PATH]
+sample_regression.py [{ -t TALLY | -w DURATION }] [-p PRECISION] [-v] [PATH_1 .. PATH_N]
 
 EXAMPLES
 osio_topic_history.py -m60 /orgs/south-coast-science-demo/brighton/loc/1/gases | \
@@ -37,9 +43,11 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_tally import CmdSampleTally
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.rolling_filter import RollingFilter
+from scs_analysis.helper.running_sums import RunningRegression
 
-from scs_core.data.json import JSONify
-from scs_core.data.linear_regression import LinearRegression
 from scs_core.data.localized_datetime import LocalizedDatetime
 from scs_core.data.path_dict import PathDict
 
@@ -53,38 +61,38 @@ class SampleRegression(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, path, tally, precision):
+    def __init__(self, nodes, tally, duration, precision):
         """
         Constructor
         """
-        self.__path = path
         self.__precision = precision
 
-        self.__func = LinearRegression(tally, True)
+        self.__filter = RollingFilter(nodes, lambda path: RunningRegression(tally, True, duration))
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def datum(self, sample):
-        if not sample.has_path(self.__path):
-            return None
-
         try:
             rec_node = sample.node('rec')
         except KeyError:
             return None
 
         rec = LocalizedDatetime.construct_from_jdict(rec_node)
-        value = sample.node(self.__path)
+        lines = []
 
-        self.__func.append(rec, value)
+        for path, value, func in self.__filter.values(sample):
+            func.append(rec, value)
 
-        if not self.__func.has_regression():
-            return None
+            if not func.has_regression():
+                continue
+
+            slope, intercept = func.line()
 
-        slope, intercept = self.__func.line()
+            if slope is not None:
+                lines.append((path, value, slope, intercept))
 
-        if slope is None:
+        if not lines:
             return None
 
         target = PathDict()
@@ -92,9 +100,10 @@ class SampleRegression(object):
         if sample.has_path('rec'):
             target.copy(sample, 'rec')
 
-        target.append(self.__path + '.src', value)
-        target.append(self.__path + '.slope', round(slope, self.__precision))
-        target.append(self.__path + '.intercept', round(intercept, self.__precision))
+        for path, value, slope, intercept in lines:
+            target.append(path + '.src', value)
+            target.append(path + '.slope', round(slope, self.__precision))
+            target.append(path + '.intercept', round(intercept, self.__precision))
 
         return target.node()
 
@@ -102,7 +111,7 @@ class SampleRegression(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "SampleRegression:{path:%s, func:%s}" % (self.__path, self.__func)
+        return "SampleRegression:{filter:%s}" % self.__filter
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -128,18 +137,20 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        sampler = SampleRegression(cmd.path, cmd.tally, cmd.precision)
+        sampler = SampleRegression(cmd.nodes, cmd.tally, cmd.duration, cmd.precision)
 
         if cmd.verbose:
             print("sample_regression: %s" % sampler, file=sys.stderr)
             sys.stderr.flush()
 
+        stdout = OutputStream.construct()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
         for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
+            datum = JSONCodec.path_dict(line)
 
             if datum is None:
                 continue
@@ -149,8 +160,7 @@ if __name__ == '__main__':
             average = sampler.datum(datum)
 
             if average is not None:
-                print(JSONify.dumps(average))
-                sys.stdout.flush()
+                stdout.print(JSONCodec.dumps(average))
 
             processed_count += 1
 
@@ -158,6 +168,10 @@ if __name__ == '__main__':
     # ----------------------------------------------------------------------------------------------------------------
     # end...
 
+    except IndexError as ex:
+        print("sample_regression: IndexError: %s" % ex, file=sys.stderr)
+        exit(1)
+
     except KeyboardInterrupt:
         if cmd.verbose:
             print("sample_regression: KeyboardInterrupt", file=sys.stderr)
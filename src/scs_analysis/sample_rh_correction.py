@@ -60,8 +60,9 @@ https://github.com/south-coast-science/scs_dev/wiki/3:-Data-formats
 import sys
 
 from scs_analysis.cmd.cmd_sample_ah_correction import CmdSampleAhCorrection
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
 
-from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
 
 from scs_core.gas.ah_correction import AhCorrection
@@ -102,13 +103,15 @@ if __name__ == '__main__':
         cnc_corr_path = cmd.gas_sub_path + '.cnc-rh-corr'
         cnc_t_corr_path = cmd.gas_sub_path + '.cnc-t-corr'
 
+        stdout = OutputStream.construct()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
         for line in sys.stdin:
             jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
+            datum = JSONCodec.path_dict(jstr)
 
             if datum is None:
                 continue
@@ -166,8 +169,7 @@ if __name__ == '__main__':
                     target.append(cnc_corr_path, round(cnc_corr, 1))
 
             # report...
-            print(JSONify.dumps(target.node()))
-            sys.stdout.flush()
+            stdout.print(JSONCodec.dumps(target.node()))
 
             processed_count += 1
 
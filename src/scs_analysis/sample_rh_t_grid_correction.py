@@ -32,8 +32,9 @@ import scipy.stats as stats
 import sys
 
 from scs_analysis.cmd.cmd_sample_rh_t_grid_correction import CmdSampleRhTGridCorrection
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
 
-from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
 
 
@@ -71,12 +72,14 @@ if __name__ == '__main__':
         references = []
         corrected = []
 
+        stdout = OutputStream.construct()
+
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
         for line in sys.stdin:
             jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
+            datum = JSONCodec.path_dict(jstr)
 
             if datum is None:
                 continue
@@ -122,13 +125,12 @@ if __name__ == '__main__':
                     target.append(sbl_report_path, report_corrected)
 
             # data report...
-            print(JSONify.dumps(target.node()))
-            sys.stdout.flush()
+            stdout.print(JSONCodec.dumps(target.node()))
 
         # r2 report...
         if cmd.r2:
             mt, ct, r, p, std_err = stats.linregress(references, corrected)
-            print(round(r ** 2, 3))
+            stdout.print(str(round(r ** 2, 3)))
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -27,8 +27,11 @@ The sample_timezone utility silently ignores input lines which have:
 
 Note that the timezone of a South Coast Science device is normally reported on its status topic.
 
+Where a large file is to be shifted, the --workers flag may be used to run a pool of processes. Documents are reported
+in input order.
+
 SYNOPSIS
-sample_timezone.py { -z | TIMEZONE_NAME }
+sample_timezone.py { -z | [-w WORKERS] TIMEZONE_NAME }
 
 EXAMPLES
 aws_topic_history.py south-coast-science-dev/production-test/loc/1/climate -s 2018-10-28T00:00:00+00:00 \
@@ -49,17 +52,65 @@ Because the sample_timezone utility is based on the pytz library, offset errors
 pseudo-timezones.
 """
 
-import json
 import sys
 
 from scs_analysis.cmd.cmd_sample_timezone import CmdSampleTimezone
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.parallel_map import ParallelMap
 
-from scs_core.data.json import JSONify
 from scs_core.data.localized_datetime import LocalizedDatetime
 
 from scs_core.location.timezone import Timezone
 
 
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleTimezone(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, zone):
+        """
+        Constructor
+        """
+        self.__zone = zone
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, line):
+        # (is document, output JSON or None)...
+        try:
+            jdict = JSONCodec.loads(line)
+        except ValueError:
+            return False, None
+
+        try:
+            rec = jdict['rec']
+        except KeyError:
+            return True, None
+
+        # zone shift...
+        datetime = LocalizedDatetime.construct_from_iso8601(rec)
+
+        if datetime is None:
+            return True, None
+
+        jdict['rec'] = datetime.localize(self.__zone).as_iso8601()
+
+        return True, JSONCodec.dumps(jdict)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleTimezone:{zone:%s}" % self.__zone
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
@@ -99,6 +150,14 @@ if __name__ == '__main__':
                 print("sample_timezone: %s" % timezone, file=sys.stderr)
                 sys.stderr.flush()
 
+        processor = ParallelMap(cmd.workers, SampleTimezone(zone).process)
+
+        if cmd.verbose:
+            print("sample_timezone: %s" % processor, file=sys.stderr)
+            sys.stderr.flush()
+
+        stdout = OutputStream.construct()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -108,30 +167,17 @@ if __name__ == '__main__':
                 print(zone, file=sys.stderr)
             exit(0)
 
-        for line in sys.stdin:
-            try:
-                jdict = json.loads(line)
-            except ValueError:
+        for is_document, jstr in processor.map(sys.stdin):
+            if not is_document:
                 continue
 
             document_count += 1
 
-            try:
-                rec = jdict['rec']
-            except KeyError:
-                continue
-
-            # zone shift...
-            datetime = LocalizedDatetime.construct_from_iso8601(rec)
-
-            if datetime is None:
+            if jstr is None:
                 continue
 
-            jdict['rec'] = datetime.localize(zone).as_iso8601()
-
             # report...
-            print(JSONify.dumps(jdict))
-            sys.stdout.flush()
+            stdout.print(jstr)
 
             processed_count += 1
 
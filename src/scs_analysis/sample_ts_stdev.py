@@ -8,176 +8,151 @@ Created on 16 Apr 2019
 source repo: scs_analysis
 
 DESCRIPTION
-The sample_ts_stdev utility is used to
+The sample_ts_stdev utility is used to find the temperature and humidity time shifts that minimise the standard
+deviation of a device's gas concentration errors, relative to a reference data set.
 
-SYNOPSIS
+Each candidate offset pair is evaluated in the same way as for the timeshift_grid utility: the climate nodes of the
+report data are shifted by the given number of documents, the data is aggregated to 15 minute checkpoints, joined
+with the reference data on rec, and the errors are grouped into a humidity / temperature grid. The report and
+reference CSV files are read once only.
+
+Three search modes are available:
+
+G - grid: every offset pair in the given ranges is evaluated at the given step
+R - refine: a coarse grid at the given step, followed by successively finer grids around the minimum, down to a
+resolution of 1
+S - golden-section: a golden-section search along a single axis - the other axis must be fixed (START equal to END)
 
+The golden-section search assumes that the standard deviation has a single minimum in the given range.
+
+An ErrorReport document is written to stdout for every evaluated offset pair, in the order of evaluation. The final
+document is the ErrorReport for the optimum offset pair.
+
+SYNOPSIS
+sample_ts_stdev.py -r START END -t START END -p FILENAME -f FILENAME [-m { G | R | S }] [-s STEP] [-v] \
+RH_PATH T_PATH REPORT_SUB_PATH REF_PATH
 
 EXAMPLES
+sample_ts_stdev.py -v -m S -r -360 -60 -t 145 145 -p praxis_climate_joined_1min.csv -f LHR2_ref_15_min_rec.csv \
+climate.val.hmd climate.val.tmp gas.val.NO2 real
 
+SEE ALSO
+scs_analysis/timeshift_grid
+
+RESOURCES
+https://en.wikipedia.org/wiki/Golden-section_search
 """
 
 import sys
 import time
 
-from subprocess import check_output, Popen, PIPE
+from scs_analysis.cmd.cmd_sample_ts_stdev import CmdSampleTSStdev
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.offset_search import OffsetSearch
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.timeshift_grid import TimeshiftGrid
 
 from scs_core.error.error_report import ErrorReport
-from scs_core.data.json import JSONify
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
-if __name__ == '__main__':
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # cmd...
+def evaluate(t_offset, rh_offset):
+    start_time = time.time()
 
-    praxis_1min_filename = 'praxis_climate_joined_1min_tp145.csv'
-    praxis_15min_filename = 'praxis_climate_joined_tp145_hmX_15min.csv'
+    stdev = grid.error_stdev(t_offset, rh_offset)
 
-    # praxis_1min_filename = 'praxis_climate_joined_1min_hm230.csv'
-    # praxis_15min_filename = 'praxis_climate_joined_tpX_hm230_15min.csv'
+    if cmd.verbose:
+        elapsed_time = round(time.time() - start_time, 1)
+        print("sample_ts_stdev: t:%s rH:%s elapsed: %s" % (t_offset, rh_offset, elapsed_time), file=sys.stderr)
+        sys.stderr.flush()
 
-    ref_15min_filename = 'LHR2_ref_15_min_rec.csv'
+    stdout.print(JSONCodec.dumps(ErrorReport(t_offset, rh_offset, stdev)))
 
-    joined_15min_filename = 'praxis_shifted_LHR2_ref_15_min_rec.csv'
+    return stdev
 
-    rh_path = 'climate.val.hmd'
-    # rh_path = 'climate.val.hmd_m230'
-    # t_path = 'climate.val.tmp'
 
-    rh_ts_offset_min = -360
-    rh_ts_offset_max = -60
-    rh_ts_offset_step = 5
+# --------------------------------------------------------------------------------------------------------------------
 
-    t_ts_offset_min = 30
-    t_ts_offset_max = 180
-    t_ts_offset_step = 5
+if __name__ == '__main__':
 
-    t_ts = 145
+    search = None
 
-    try:
-        # ------------------------------------------------------------------------------------------------------------
-        # resources...
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
 
-        # stdevs = OrderedDict()
+    cmd = CmdSampleTSStdev()
 
-        # for rh_ts in range(rh_ts_offset_min, rh_ts_offset_max + 1, rh_ts_offset_step):
-        #     stdevs[rh_ts] = OrderedDict()
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
 
+    if cmd.verbose:
+        print("sample_ts_stdev: %s" % cmd, file=sys.stderr)
 
+    try:
         # ------------------------------------------------------------------------------------------------------------
-        # run...
-
-        t_ts_path = 'climate.val.tmp_p145'
-
-        # rh_ts = -230
-
-        for rh_ts in range(rh_ts_offset_min, rh_ts_offset_max + 1, rh_ts_offset_step):
-            # for t_ts in range(t_ts_offset_min, t_ts_offset_max + 1, t_ts_offset_step):
-
-            start_time = time.time()
-
-            rh_ts_path = 'climate.val.hmd_m' + str(abs(rh_ts))
-
-            # t_ts_path = 'climate.val.tmp_p' + str(abs(t_ts))
-
-            # --------------------------------------------------------------------------------------------------------
-            # run: time shift 1 min data, aggregate to 15 min...
-
-            if True:
-                print("sample_ts_stdev: time shift 1 min data, aggregate to 15 min...", end='', file=sys.stderr)
-                sys.stderr.flush()
-
-            args = ['csv_reader.py', praxis_1min_filename]
-            sp1 = Popen(args, stdout=PIPE)
-
-            args = ['node_shift.py', '-o', str(rh_ts), rh_path, rh_ts_path]
-            # args = ['node_shift.py', '-o', str(t_ts), t_path, t_ts_path]
-
-            sp2 = Popen(args, stdin=sp1.stdout, stdout=PIPE)
-
-            args = ['sample_aggregate.py', '-c' '**:/15:00']
-            sp3 = Popen(args, stdin=sp2.stdout, stdout=PIPE)
-
-            args = ['csv_writer.py', praxis_15min_filename]
-            sp4 = Popen(args, stdin=sp3.stdout)
-
-            sp4.wait()
-
-            if sp4.returncode > 0:
-                print("sample_ts_stdev: shift failed with exit code %s." % sp4.returncode, file=sys.stderr)
-                exit(sp4.returncode)
-
-            if True:
-                print("done.", file=sys.stderr)
-
-
-            # --------------------------------------------------------------------------------------------------------
-            # run: join with ref 15 min data...
-
-            if True:
-                print("sample_ts_stdev: join with ref 15 min data...", end='', file=sys.stderr)
-                sys.stderr.flush()
-
-            args = ['csv_join.py', '-i', '-l', 'praxis', 'rec', praxis_15min_filename,
-                    '-r', 'ref', 'rec', ref_15min_filename]
-            sp1 = Popen(args, stdout=PIPE)
-
-            args = ['csv_writer.py', joined_15min_filename]
-            sp2 = Popen(args, stdin=sp1.stdout)
-
-            sp2.wait()
+        # resources...
 
-            if sp2.returncode > 0:
-                print("sample_ts_stdev: join failed with exit code %s." % sp2.returncode, file=sys.stderr)
-                exit(sp2.returncode)
+        try:
+            grid = TimeshiftGrid.construct(cmd.report_filename, cmd.ref_filename, cmd.rh_path, cmd.t_path,
+                                           cmd.report_sub_path + '.cnc', cmd.ref_path)
 
-            if True:
-                print("done.", file=sys.stderr)
+        except FileNotFoundError as ex:
+            grid = None
+            print("sample_ts_stdev: file not found: %s" % ex.filename, file=sys.stderr)
+            exit(1)
 
+        except KeyError as ex:
+            grid = None
+            print("sample_ts_stdev: path not in report data: %s" % ex, file=sys.stderr)
+            exit(1)
 
-            # --------------------------------------------------------------------------------------------------------
-            # run: t rH grid...
+        except ValueError as ex:
+            grid = None
+            print("sample_ts_stdev: invalid rec in reference data: %s" % ex, file=sys.stderr)
+            exit(1)
 
-            if True:
-                print("sample_ts_stdev: t rH grid...", end='', file=sys.stderr)
-                sys.stderr.flush()
+        search = OffsetSearch(evaluate)
 
-            args = ['csv_reader.py', joined_15min_filename]
-            sp1 = Popen(args, stdout=PIPE)
+        if cmd.verbose:
+            print("sample_ts_stdev: %s" % grid, file=sys.stderr)
+            sys.stderr.flush()
 
-            args = ['sample_rh_t_grid.py', '-r', '20', '95', '5', '-t', '0', '30', '5', '-d',
-                    'praxis.' + rh_ts_path, 'praxis.' + t_ts_path, 'praxis.gas.val.NO2.cnc', 'ref.real']
-            # args = ['sample_t_rh_grid.py', '-r', '20', '95', '5', '-t', '0', '30', '5', '-d',
-            #         'praxis.' + rh_path, 'praxis.' + t_ts_path, 'praxis.gas.val.NO2.cnc', 'ref.real']
+        stdout = OutputStream.construct()
 
-            output = check_output(args, stdin=sp1.stdout)
 
-            stdev = float(output.decode())
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
 
-            if sp2.returncode > 0:
-                print("sample_ts_stdev: grid failed with exit code %s." % sp2.returncode, file=sys.stderr)
-                exit(sp2.returncode)
+        if cmd.mode == 'G':
+            optimum = search.grid(cmd.t_offset_start, cmd.t_offset_end, cmd.rh_offset_start, cmd.rh_offset_end,
+                                  cmd.step)
 
-            if True:
-                print("done.", file=sys.stderr)
+        elif cmd.mode == 'S':
+            optimum = search.golden(cmd.t_offset_start, cmd.t_offset_end, cmd.rh_offset_start, cmd.rh_offset_end)
 
+        else:
+            optimum = search.refine(cmd.t_offset_start, cmd.t_offset_end, cmd.rh_offset_start, cmd.rh_offset_end,
+                                    cmd.step)
 
-            # --------------------------------------------------------------------------------------------------------
-            # run: report...
+        # report...
+        t_optimum, rh_optimum = optimum
 
-            elapsed_time = round(time.time() - start_time, 1)
-            print("elapsed: %s" % elapsed_time, file=sys.stderr)
+        if t_optimum is None:
+            print("sample_ts_stdev: no offset pair provided a standard deviation", file=sys.stderr)
+            exit(1)
 
-            report = ErrorReport(t_ts, rh_ts, stdev)
-            print(JSONify.dumps(report))
-            sys.stdout.flush()
+        stdout.print(JSONCodec.dumps(ErrorReport(t_optimum, rh_optimum, search.stdev(t_optimum, rh_optimum))))
 
 
     # ----------------------------------------------------------------------------------------------------------------
     # end...
 
     except KeyboardInterrupt:
-        print("sample_ts_stdev: KeyboardInterrupt", file=sys.stderr)
+        if cmd.verbose:
+            print("sample_ts_stdev: KeyboardInterrupt", file=sys.stderr)
+
+    finally:
+        if cmd.verbose and search is not None:
+            print("sample_ts_stdev: %s" % search, file=sys.stderr)
@@ -28,8 +28,10 @@ command line. The value is normally found from the calibration sheet for the sen
 If fields are missing from the input document, then the document is ignored. If values are
 malformed, execution will terminate.
 
+For offline files, the --workers flag spreads the work over a pool of processes, with output in input order.
+
 SYNOPSIS
-sample_wec_sens.py -s SENS PATH [-v]
+sample_wec_sens.py -s SENS PATH [-w WORKERS] [-v]
 
 EXAMPLES
 csv_reader.py gases.csv | sample_wec_sens.py -s 0.255 val.NO2
@@ -49,16 +51,88 @@ https://github.com/south-coast-science/scs_dev/wiki/3:-Data-formats
 import sys
 
 from scs_analysis.cmd.cmd_sample_wec_sens import CmdSampleWeCSens
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.parallel_map import ParallelMap
 
-from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
-if __name__ == '__main__':
+class SampleWeCSens(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, sens, path):
+        """
+        Constructor
+        """
+        self.__sens = sens
+
+        self.__wec_path = path + '.weC'
+        self.__wec_sens_path = path + '.weC_sens'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, line):
+        # (is document, output JSON or None) - raises ValueError for malformed values...
+        jstr = line.strip()
+        datum = JSONCodec.path_dict(jstr)
+
+        if datum is None:
+            return False, None
+
+        paths = datum.paths()
+
+        # weC...
+        if self.__wec_path not in paths:
+            return True, None
+
+        wec_node = datum.node(self.__wec_path)
+
+        if wec_node == '':
+            return True, None
+
+        try:
+            wec = float(wec_node)
+        except ValueError:
+            raise ValueError("invalid value for %s in %s" % (self.__wec_path, jstr))
+
+        # compute...
+        wec_sens = round(wec / (self.__sens / 1000), 1)
+
+        # copy...
+        target = PathDict()
+
+        for path in paths:
+            if path == self.__wec_sens_path:
+                continue                                            # ignore any existing wec_sens_path
+
+            if path == self.__wec_path:
+                target.append(self.__wec_path, wec)
+                target.append(self.__wec_sens_path, wec_sens)
+
+            else:
+                target.append(path, datum.node(path))
 
-    wec = None
+        return True, JSONCodec.dumps(target.node())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleWeCSens:{sens:%s, wec_path:%s, wec_sens_path:%s}" % \
+               (self.__sens, self.__wec_path, self.__wec_sens_path)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
 
     document_count = 0
     processed_count = 0
@@ -79,61 +153,36 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        wec_path = cmd.path + '.weC'
-        wec_sens_path = cmd.path + '.weC_sens'
+        processor = ParallelMap(cmd.workers, SampleWeCSens(cmd.sens, cmd.path).process)
 
+        if cmd.verbose:
+            print("sample_wec_sens: %s" % processor, file=sys.stderr)
+            sys.stderr.flush()
 
-        # ------------------------------------------------------------------------------------------------------------
-        # run...
-
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
-            document_count += 1
-
-            paths = datum.paths()
-
-            # weC...
-            if wec_path not in paths:
-                continue
-
-            wec_node = datum.node(wec_path)
-
-            if wec_node == '':
-                continue
+        stdout = OutputStream.construct()
 
-            try:
-                wec = float(wec_node)
-            except ValueError:
-                print("sample_wec_sens: invalid value for %s in %s" % (wec_path, jstr), file=sys.stderr)
-                exit(1)
 
-            # compute...
-            wec_sens = round(wec / (cmd.sens / 1000), 1)
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
 
-            # copy...
-            target = PathDict()
+        try:
+            for is_document, jstr in processor.map(sys.stdin):
+                if not is_document:
+                    continue
 
-            for path in paths:
-                if path == wec_sens_path:
-                    continue                                        # ignore any existing wec_sens_path
+                document_count += 1
 
-                if path == wec_path:
-                    target.append(wec_path, wec)
-                    target.append(wec_sens_path, wec_sens)
+                if jstr is None:
+                    continue
 
-                else:
-                    target.append(path, datum.node(path))
+                # report...
+                stdout.print(jstr)
 
-            # report...
-            print(JSONify.dumps(target.node()))
-            sys.stdout.flush()
+                processed_count += 1
 
-            processed_count += 1
+        except ValueError as ex:
+            print("sample_wec_sens: %s" % ex, file=sys.stderr)
+            exit(1)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+DESCRIPTION
+The scs_pipeline utility runs a chain of scs_analysis utilities within a single process. The chain is specified in the
+same form as a shell pipeline, and each utility accepts the same arguments as it does on the command line.
+
+Within the chain, documents are passed from one stage to the next as Python objects - JSON is parsed only where the
+chain reads stdin, and serialised only where it writes stdout or a CSV file. The output is the same as that of the
+equivalent shell pipeline.
+
+If the first stage is not csv_reader, then JSON documents are read from stdin. If the last stage is not csv_writer (or
+is csv_writer with the --echo flag), then JSON documents are written to stdout.
+
+The supported utilities are: csv_reader, csv_writer, node, node_shift and sample_aggregate. The csv_reader --array
+option and the node --array and --sequence options are not supported. Narrative output from the individual stages is
+not provided.
+
+SYNOPSIS
+scs_pipeline.py [-v] CHAIN
+
+EXAMPLES
+scs_pipeline.py "csv_reader.py climate.csv | node_shift.py -o 2 val.hmd val.hmd_s2 | \
+sample_aggregate.py -c **:/15:00 | csv_writer.py climate_15min.csv"
+
+SEE ALSO
+scs_analysis/csv_reader
+scs_analysis/csv_writer
+scs_analysis/node
+scs_analysis/node_shift
+scs_analysis/sample_aggregate
+"""
+
+import sys
+
+from scs_analysis.cmd.cmd_scs_pipeline import CmdSCSPipeline
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.pipeline import Pipeline
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    output_count = 0
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdSCSPipeline()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("scs_pipeline: %s" % cmd, file=sys.stderr)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        try:
+            pipeline = Pipeline.construct(cmd.chain)
+
+        except ValueError as ex:
+            pipeline = None
+            print("scs_pipeline: %s" % ex, file=sys.stderr)
+            exit(2)
+
+        if cmd.verbose:
+            print("scs_pipeline: %s" % pipeline, file=sys.stderr)
+            sys.stderr.flush()
+
+        # a csv_writer without a filename writes rows to stdout, and any output must interleave with them...
+        stdout = OutputStream.construct(live=pipeline.writes_stdout())
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        try:
+            for datum in pipeline.documents(sys.stdin):
+                stdout.print(JSONCodec.dumps(datum))
+
+                output_count += 1
+
+        except IndexError as ex:
+            print("scs_pipeline: IndexError: %s" % ex, file=sys.stderr)
+            exit(1)
+
+        except ValueError as ex:
+            print("scs_pipeline: %s" % ex, file=sys.stderr)
+            exit(1)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except KeyboardInterrupt:
+        if cmd.verbose:
+            print("scs_pipeline: KeyboardInterrupt", file=sys.stderr)
+
+    finally:
+        if cmd.verbose:
+            print("scs_pipeline: output: %d" % output_count, file=sys.stderr)
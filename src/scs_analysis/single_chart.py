@@ -43,9 +43,8 @@ import warnings
 
 from scs_analysis.chart.single_chart import SingleChart
 from scs_analysis.cmd.cmd_single_chart import CmdSingleChart
-
-from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
 
 from scs_core.sync.line_reader import LineReader
 
@@ -84,6 +83,8 @@ if __name__ == '__main__':
             print("single_chart: %s" % chart, file=sys.stderr)
             sys.stderr.flush()
 
+        stdout = OutputStream.construct()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -98,14 +99,13 @@ if __name__ == '__main__':
                 chart.pause()
                 continue
 
-            datum = PathDict.construct_from_jstr(line)
+            datum = JSONCodec.path_dict(line)
 
             if datum is None:
                 break
 
             if cmd.echo:
-                print(JSONify.dumps(datum.node()))
-                sys.stdout.flush()
+                stdout.print(JSONCodec.dumps(datum.node()))
 
             chart.plot(datum)
 
@@ -35,6 +35,7 @@ may take time to be garbage collected.
 import sys
 
 from scs_analysis.cmd.cmd_socket_receiver import CmdSocketReceiver
+from scs_analysis.helper.output_stream import OutputStream
 
 from scs_host.comms.network_socket import NetworkSocket
 
@@ -63,13 +64,14 @@ if __name__ == '__main__':
             print("socket_receiver: %s" % receiver, file=sys.stderr)
             sys.stderr.flush()
 
+        stdout = OutputStream.construct(live=True)
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
         for message in receiver.read():
-            print(message)
-            sys.stdout.flush()
+            stdout.print(message)
 
             receiver.ack()
 
@@ -8,37 +8,54 @@ Created on 18 Apr 2019
 source repo: scs_analysis
 
 DESCRIPTION
-The sample_ts_stdev utility is used to
+The timeshift_grid utility is used to find the temperature and humidity time shifts that best align a device's
+climate data with its gas concentration errors, relative to a reference data set.
+
+For every pair of temperature / humidity offsets, the climate nodes of the report data are shifted by the given number
+of documents, the data is aggregated to 15 minute checkpoints and joined with the reference data on rec. The
+concentration errors are then grouped into a humidity / temperature grid. An ErrorReport document is written to stdout
+for each offset pair, giving the standard deviation of the included errors.
+
+The report and reference CSV files are read once only - all the offset pairs are evaluated in-process. The report
+data should present a regular sequence of rec datetimes, as for node_shift.py.
+
+If --jobs is greater than one, offset pairs are evaluated in parallel by a pool of worker processes. The output is
+always in grid order: t offsets, then rH offsets, ascending.
+
+If the --verbose flag is used, the ErrorSurface for each offset pair is written to stderr.
 
 SYNOPSIS
-timeshift_grid.py -r START END STEP -t START END STEP -p FILENAME -f FILENAME [-v] RH_PATH T_PATH REPORT_PATH REF_PATH
+timeshift_grid.py -r START END STEP -t START END STEP -p FILENAME -f FILENAME [-j JOBS] [-v] \
+RH_PATH T_PATH REPORT_SUB_PATH REF_PATH
 
 EXAMPLES
-timeshift_grid.py -v -r -240 -180 5 -t 120 120 1 -p praxis_climate_joined_1min.csv -f LHR2_ref_15_min_rec.csv \
+timeshift_grid.py -v -j 8 -r -240 -180 5 -t 120 120 1 -p praxis_climate_joined_1min.csv -f LHR2_ref_15_min_rec.csv \
 climate.val.hmd climate.val.tmp gas.val.NO2 real
+
+SEE ALSO
+scs_analysis/node_shift
+scs_analysis/sample_aggregate
+scs_analysis/sample_rh_t_grid
 """
 
-import json
 import sys
 import time
 
-# from collections import OrderedDict
-
-from subprocess import check_output, Popen, PIPE
+from multiprocessing import Pool
 
 from scs_analysis.cmd.cmd_timeshift_grid import CmdTimeshiftGrid
-
-from scs_core.error.error_report import ErrorReport
-from scs_core.error.error_surface import ErrorSurface
-
-from scs_core.data.json import JSONify
-# from scs_core.data.path_dict import PathDict
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.timeshift_grid import TimeshiftGrid, TimeshiftGridWorker
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
+    pool = None
+
+    report_count = 0
+
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
 
@@ -55,157 +72,64 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        # TODO: use the original filename prefixes...
+        try:
+            grid = TimeshiftGrid.construct(cmd.report_filename, cmd.ref_filename, cmd.rh_path, cmd.t_path,
+                                           cmd.report_sub_path + '.cnc', cmd.ref_path)
 
-        reported_t_shifted_filename = 'timeshift_grid_t_shifted_tmp.csv'
-        reported_15min_filename = 'timeshift_grid_15min_tmp.csv'
-        joined_15min_filename = 'timeshift_grid_joined_tmp.csv'
+        except FileNotFoundError as ex:
+            grid = None
+            print("timeshift_grid: file not found: %s" % ex.filename, file=sys.stderr)
+            exit(1)
 
-        report_prefix = 'praxis'
-        ref_prefix = 'ref'
+        except KeyError as ex:
+            grid = None
+            print("timeshift_grid: path not in report data: %s" % ex, file=sys.stderr)
+            exit(1)
 
-        joined_report_path = report_prefix + '.' + cmd.report_sub_path + '.cnc'
-        joined_ref_path = ref_prefix + '.' + cmd.ref_path
+        except ValueError as ex:
+            grid = None
+            print("timeshift_grid: invalid rec in reference data: %s" % ex, file=sys.stderr)
+            exit(1)
 
+        if cmd.verbose:
+            print("timeshift_grid: %s" % grid, file=sys.stderr)
+            sys.stderr.flush()
 
-        # ------------------------------------------------------------------------------------------------------------
-        # run...
-
-        for t_offset in range(cmd.t_offset_start, cmd.t_offset_end + 1, cmd.t_offset_step):
+        # offsets...
+        offsets = [(t_offset, rh_offset)
+                   for t_offset in range(cmd.t_offset_start, cmd.t_offset_end + 1, cmd.t_offset_step)
+                   for rh_offset in range(cmd.rh_offset_start, cmd.rh_offset_end + 1, cmd.rh_offset_step)]
 
-            offset_infix = 'm' if t_offset < 0 else 'p'
-            t_shifted_path = cmd.t_path + '_' + offset_infix + str(abs(t_offset))
+        if cmd.jobs > 1:
+            pool = Pool(cmd.jobs, TimeshiftGridWorker.initialise, (grid, ))
+            evaluations = pool.imap(TimeshiftGridWorker.evaluate, offsets)
 
-            # ----------------------------------------------------------------------------------------------------
-            # run: time shift t 1 min data...
+        else:
+            TimeshiftGridWorker.initialise(grid)
+            evaluations = map(TimeshiftGridWorker.evaluate, offsets)
 
-            if cmd.verbose:
-                print("sample_ts_stdev: time shift t 1 min data...", end='', file=sys.stderr)
-                sys.stderr.flush()
+        stdout = OutputStream.construct()
 
-            args = ['csv_reader.py', cmd.report_filename]
-            sp1 = Popen(args, stdout=PIPE)
 
-            args = ['node_shift.py', '-o', str(t_offset), cmd.t_path, t_shifted_path]
-            sp2 = Popen(args, stdin=sp1.stdout, stdout=PIPE)
-
-            args = ['csv_writer.py', reported_t_shifted_filename]
-            sp3 = Popen(args, stdin=sp2.stdout)
-
-            sp3.wait()
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
 
-            if sp3.returncode > 0:
-                print("sample_ts_stdev: t shift phase failed with exit code %s." % sp3.returncode, file=sys.stderr)
-                exit(sp3.returncode)
+        start_time = time.time()
 
+        for (t_offset, rh_offset), (report_jstr, surface_jstr) in zip(offsets, evaluations):
             if cmd.verbose:
-                print("done.", file=sys.stderr)
-
-            # --------------------------------------------------------------------------------------------------------
-
-            for rh_offset in range(cmd.rh_offset_start, cmd.rh_offset_end + 1, cmd.rh_offset_step):
+                elapsed_time = round(time.time() - start_time, 1)
 
-                offset_infix = 'm' if rh_offset < 0 else 'p'
-                rh_shifted_path = cmd.rh_path + '_' + offset_infix + str(abs(rh_offset))
+                print("timeshift_grid: t:%s rH:%s elapsed: %s" % (t_offset, rh_offset, elapsed_time), file=sys.stderr)
+                print(surface_jstr, file=sys.stderr)
+                sys.stderr.flush()
 
                 start_time = time.time()
 
-                # ----------------------------------------------------------------------------------------------------
-                # run: time shift rH 1 min data, aggregate to 15 min...
-
-                if cmd.verbose:
-                    print("sample_ts_stdev: time shift rH 1 min data, aggregate to 15 min...", end='', file=sys.stderr)
-                    sys.stderr.flush()
-
-                args = ['csv_reader.py', reported_t_shifted_filename]
-                sp1 = Popen(args, stdout=PIPE)
-
-                args = ['node_shift.py', '-o', str(rh_offset), cmd.rh_path, rh_shifted_path]
-                sp2 = Popen(args, stdin=sp1.stdout, stdout=PIPE)
-
-                args = ['sample_aggregate.py', '-c' '**:/15:00']
-                sp3 = Popen(args, stdin=sp2.stdout, stdout=PIPE)
-
-                args = ['csv_writer.py', reported_15min_filename]
-                sp4 = Popen(args, stdin=sp3.stdout)
-
-                sp4.wait()
-
-                if sp4.returncode > 0:
-                    print("sample_ts_stdev: rH shift phase failed with exit code %s." % sp4.returncode, file=sys.stderr)
-                    exit(sp4.returncode)
+            # report...
+            stdout.print(report_jstr)
 
-                if cmd.verbose:
-                    print("done.", file=sys.stderr)
-
-
-                # -----------------------------------------------------------------------------------------------------
-                # run: join with ref 15 min data...
-
-                if cmd.verbose:
-                    print("sample_ts_stdev: join with ref 15 min data...", end='', file=sys.stderr)
-                    sys.stderr.flush()
-
-                args = ['csv_join.py', '-i', '-l', report_prefix, 'rec', reported_15min_filename,
-                        '-r', ref_prefix, 'rec', cmd.ref_filename]
-                sp1 = Popen(args, stdout=PIPE)
-
-                args = ['csv_writer.py', joined_15min_filename]
-                sp2 = Popen(args, stdin=sp1.stdout)
-
-                sp2.wait()
-
-                if sp2.returncode > 0:
-                    print("sample_ts_stdev: join phase failed with exit code %s." % sp2.returncode, file=sys.stderr)
-                    exit(sp2.returncode)
-
-                if cmd.verbose:
-                    print("done.", file=sys.stderr)
-
-
-                # ----------------------------------------------------------------------------------------------------
-                # run: t rH grid...
-
-                if cmd.verbose:
-                    print("sample_ts_stdev: t rH grid...", end='', file=sys.stderr)
-                    sys.stderr.flush()
-
-                args = ['csv_reader.py', joined_15min_filename]
-                sp1 = Popen(args, stdout=PIPE)
-
-                args = ['sample_rh_t_grid.py', '-r', '20', '95', '5', '-t', '0', '30', '5', '-o', 'S',
-                        'praxis.' + rh_shifted_path, 'praxis.' + t_shifted_path, joined_report_path, joined_ref_path]
-
-                output = check_output(args, stdin=sp1.stdout)
-
-                if cmd.verbose:
-                    print("done.", file=sys.stderr)
-
-                print("output: %s" % output.decode())
-
-                surface = ErrorSurface.construct_from_jdict(json.loads(output.decode()))
-
-                print("surface: %s" % surface)
-
-
-                # ----------------------------------------------------------------------------------------------------
-                # run: correction...
-
-
-
-                # ----------------------------------------------------------------------------------------------------
-                # run: report...
-
-                elapsed_time = round(time.time() - start_time, 1)
-                print("elapsed: %s" % elapsed_time, file=sys.stderr)
-
-                report = ErrorReport(t_offset, rh_offset, None)     # stdev
-                print(JSONify.dumps(report))
-                sys.stdout.flush()
-
-                # TODO: delete rh tmp files
-
-            # TODO: delete t tmp file
+            report_count += 1
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -213,4 +137,11 @@ if __name__ == '__main__':
 
     except KeyboardInterrupt:
         if cmd.verbose:
-            print("sample_ts_stdev: KeyboardInterrupt", file=sys.stderr)
+            print("timeshift_grid: KeyboardInterrupt", file=sys.stderr)
+
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+        if cmd.verbose:
+            print("timeshift_grid: reports: %d" % report_count, file=sys.stderr)
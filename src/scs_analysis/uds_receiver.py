@@ -24,6 +24,7 @@ scs_analysis/socket_receiver
 import sys
 
 from scs_analysis.cmd.cmd_uds import CmdUDS
+from scs_analysis.helper.output_stream import OutputStream
 
 from scs_host.comms.domain_socket import DomainSocket
 
@@ -54,6 +55,8 @@ if __name__ == '__main__':
         print("uds_reader: %s" % uds, file=sys.stderr)
         sys.stderr.flush()
 
+    stdout = OutputStream.construct(live=True)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -61,8 +64,7 @@ if __name__ == '__main__':
         uds.connect()
 
         for message in uds.read():
-            print(message)
-            sys.stdout.flush()
+            stdout.print(message)
 
 
     # ----------------------------------------------------------------------------------------------------------------
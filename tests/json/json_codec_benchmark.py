@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compares JSONCodec with PathDict.construct_from_jstr(..) and JSONify.dumps(..), over representative gas and climate
+documents. The serialised outputs must be identical.
+
+usage: json_codec_benchmark.py [DOCUMENTS]
+"""
+
+import gc
+import random
+import sys
+import time
+
+from datetime import datetime, timedelta, timezone
+
+from scs_analysis.helper.json_codec import JSONCodec
+
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def timed(func, items):
+    gc.collect()
+
+    start_time = time.time()
+    results = [func(item) for item in items]
+
+    return time.time() - start_time, results
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+print("documents: %d" % count)
+print("accelerated: %s" % JSONCodec.is_accelerated())
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# data...
+
+start = datetime(2019, 1, 1, tzinfo=timezone.utc)
+jstrs = []
+
+for i in range(count):
+    rec = (start + timedelta(seconds=10 * i)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    gases = ', '.join('"%s": {"weV": %0.6f, "aeV": %0.6f, "weC": %0.6f, "cnc": %0.1f}' %
+                      (gas, random.uniform(0.2, 0.4), random.uniform(0.2, 0.4), random.uniform(-0.01, 0.01),
+                       random.uniform(-5, 100)) for gas in ('NO2', 'CO', 'SO2', 'H2S'))
+
+    jstrs.append('{"tag": "scs-be2-3", "rec": "%s", "val": {%s, "sht": {"hmd": %0.1f, "tmp": %0.1f}}}' %
+                 (rec, gases, random.uniform(20, 90), random.uniform(-5, 35)))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# parse...
+
+stdlib_elapsed, stdlib_documents = timed(PathDict.construct_from_jstr, jstrs)
+codec_elapsed, codec_documents = timed(JSONCodec.path_dict, jstrs)
+
+print("parse: stdlib: %0.3f secs codec: %0.3f secs speed-up: %0.1f" %
+      (stdlib_elapsed, codec_elapsed, stdlib_elapsed / codec_elapsed))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# serialise...
+
+stdlib_elapsed, stdlib_jstrs = timed(JSONify.dumps, stdlib_documents)
+codec_elapsed, codec_jstrs = timed(JSONCodec.dumps, codec_documents)
+
+print("serialise: stdlib: %0.3f secs codec: %0.3f secs speed-up: %0.1f" %
+      (stdlib_elapsed, codec_elapsed, stdlib_elapsed / codec_elapsed))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# compare...
+
+print("identical: %s" % (stdlib_jstrs == codec_jstrs))
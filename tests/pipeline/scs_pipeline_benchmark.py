@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compares the shell pipeline with the in-process scs_pipeline, for the same chain of utilities.
+The outputs must be identical.
+
+usage: scs_pipeline_benchmark.py [ROWS]
+"""
+
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from datetime import datetime, timedelta, timezone
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+print("rows: %d" % rows)
+
+scripts = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src', 'scs_analysis')
+python = sys.executable
+
+tmp_dir = tempfile.mkdtemp()
+
+input_filename = os.path.join(tmp_dir, 'climate.csv')
+shell_filename = os.path.join(tmp_dir, 'climate_shell.csv')
+pipeline_filename = os.path.join(tmp_dir, 'climate_pipeline.csv')
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# data...
+
+start = datetime(2019, 1, 1, tzinfo=timezone.utc)
+
+with open(input_filename, 'w') as file:
+    file.write("tag,rec,val.hmd,val.tmp\n")
+
+    for i in range(rows):
+        rec = (start + timedelta(seconds=10 * i)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        file.write("scs-ap1-6,%s,%0.1f,%0.1f\n" % (rec, random.uniform(40, 60), random.uniform(10, 20)))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# shell...
+
+stages = [
+    ['csv_reader.py', input_filename],
+    ['node_shift.py', '-o', '2', 'val.hmd', 'val.hmd_s2'],
+    ['sample_aggregate.py', '-c', '**:/15:00'],
+]
+
+shell = ' | '.join(' '.join([python, os.path.join(scripts, stage[0])] + ["'%s'" % arg for arg in stage[1:]])
+                   for stage in stages)
+
+shell += " | %s %s '%s'" % (python, os.path.join(scripts, 'csv_writer.py'), shell_filename)
+
+start_time = time.time()
+subprocess.check_call(shell, shell=True)
+shell_elapsed = time.time() - start_time
+
+print("shell: %0.3f secs" % shell_elapsed)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# pipeline...
+
+chain = ' | '.join(' '.join([stage[0]] + ["'%s'" % arg for arg in stage[1:]]) for stage in stages)
+chain += " | csv_writer.py '%s'" % pipeline_filename
+
+start_time = time.time()
+subprocess.check_call([python, os.path.join(scripts, 'scs_pipeline.py'), chain])
+pipeline_elapsed = time.time() - start_time
+
+print("scs_pipeline: %0.3f secs" % pipeline_elapsed)
+print("speed-up: %0.1f" % (shell_elapsed / pipeline_elapsed))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# compare...
+
+with open(shell_filename) as shell_file, open(pipeline_filename) as pipeline_file:
+    identical = shell_file.read() == pipeline_file.read()
+
+print("identical: %s" % identical)
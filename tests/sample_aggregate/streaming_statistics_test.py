@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compares the StreamingStatistics estimates with exact values, for normal, skewed and stepped series.
+
+usage: streaming_statistics_test.py [VALUES]
+"""
+
+import random
+import statistics
+import sys
+
+from scs_analysis.helper.streaming_statistics import StreamingStatistics
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def exact(values):
+    ordered = sorted(values)
+
+    def percentile(p):
+        index = p * (len(ordered) - 1)
+        lower = int(index)
+        upper = min(lower + 1, len(ordered) - 1)
+
+        return ordered[lower] + (index - lower) * (ordered[upper] - ordered[lower])
+
+    return {'count': len(values), 'stdev': statistics.stdev(values) if len(values) > 1 else None,
+            'p5': percentile(0.05), 'p50': percentile(0.5), 'p95': percentile(0.95)}
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 86400
+
+random.seed(1)
+
+series = {
+    'normal': [random.gauss(50.0, 5.0) for _ in range(count)],
+    'skewed': [random.expovariate(0.1) for _ in range(count)],
+    'stepped': [20.0 + (i * 10 // count) for i in range(count)],
+    'short': [1.0, 4.0, 2.0]
+}
+
+for name, values in series.items():
+    stats = StreamingStatistics()
+
+    for value in values:
+        stats.append(value)
+
+    print("%s:" % name)
+    print("   exact: %s" % {key: round(value, 3) for key, value in exact(values).items()})
+    print("estimate: %s" % {key: round(value, 3) for key, value in stats.report().items()})
+    print("-")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+"""
+Created on 16 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compares RollingMedian with scs_core's MedianFilter, over a range of window sizes, for spiky 1-second data. The
+outputs must be identical.
+
+usage: rolling_median_benchmark.py [SAMPLES]
+"""
+
+import gc
+import random
+import sys
+import time
+
+from scs_analysis.helper.rolling_median import RollingMedian
+
+from scs_core.data.median_filter import MedianFilter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def timed(func, values):
+    gc.collect()
+
+    start_time = time.time()
+    results = [func.compute(value) for value in values]
+
+    return time.time() - start_time, results
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+print("samples: %d threshold: %d" % (count, RollingMedian.THRESHOLD))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# data - mixed int and float, with repeats and spikes...
+
+values = []
+
+for i in range(count):
+    value = round(random.gauss(50.0, 5.0), 1)
+
+    if random.random() < 0.01:
+        value = 1000                                        # spike
+
+    values.append(int(value) if i % 7 == 0 else value)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# compare...
+
+for window_size in (3, 7, 15, 31, 101, 301, 1001, 3001):
+    sort_elapsed, sort_results = timed(MedianFilter(window_size), values)
+    rolling_elapsed, rolling_results = timed(RollingMedian(window_size), values)
+
+    identical = [repr(result) for result in sort_results] == [repr(result) for result in rolling_results]
+
+    print("window: %5d MedianFilter: %0.3f secs RollingMedian: %0.3f secs speed-up: %6.1f identical: %s" %
+          (window_size, sort_elapsed, rolling_elapsed, sort_elapsed / rolling_elapsed, identical))